@@ -0,0 +1,11 @@
+"""A benchmark suite for the election pipeline. It times each stage of `electoral_systems.election.Election.start_election`
+(ranking, averages, delegations, duels and every voting rule) over a grid of numbers of electors and candidates,
+writes the timings as JSON and compares them with a stored baseline.
+
+Usage:
+    `python -m benchmarks --output bench.json`  
+    `python -m benchmarks --baseline bench.json --threshold 0.2`
+"""
+
+from .stages import time_stages, run_grid
+from .baseline import Regression, compare, load_report, save_report
@@ -0,0 +1,79 @@
+"""Command line of the benchmark suite. Exits with status 1 if a regression is found against the baseline."""
+
+import argparse
+import sys
+from typing import Dict, List, Optional
+
+from electoral_systems import VotingRulesConstants
+from .stages import ELECTORS_GRID, CANDIDATES_GRID, MAX_DELEGATION_ELECTORS, run_grid
+from .baseline import compare, load_report, save_report
+
+
+def _stage_threshold(value: str) -> tuple[str, float]:
+    """Parse a `STAGE=THRESHOLD` argument."""
+
+    stage, _, threshold = value.partition("=")
+    try:
+        return stage, float(threshold)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected STAGE=THRESHOLD, got {value!r}")
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Time each stage of an election over a grid of sizes.")
+    parser.add_argument("--electors", nargs="+", type=int, default=ELECTORS_GRID, help="Numbers of electors.")
+    parser.add_argument("--candidates", nargs="+", type=int, default=CANDIDATES_GRID, help="Numbers of candidates.")
+    parser.add_argument("--rules", nargs="+", choices=list(VotingRulesConstants.UI), metavar="RULE", default=None,
+                        help="Voting rules to time. Default: all.")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions of each stage, the best time is kept.")
+    parser.add_argument("--max-delegation-electors", type=int, default=MAX_DELEGATION_ELECTORS,
+                        help="Do not time delegations above this number of electors.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the data generation.")
+    parser.add_argument("--output", "-o", default=None, help="Write the report to this JSON file.")
+    parser.add_argument("--baseline", "-b", default=None, help="Compare the report with this JSON report.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown. Default: 0.2.")
+    parser.add_argument("--stage-threshold", type=_stage_threshold, action="append", default=[],
+                        metavar="STAGE=THRESHOLD", help="Allowed relative slowdown of one stage.")
+    parser.add_argument("--min-delta", type=float, default=0.001,
+                        help="Ignore slowdowns smaller than this duration (seconds).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks, save the report and compare it with the baseline.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments. Default = `sys.argv[1:]`.
+
+    Returns:
+        int: 1 if a regression has been found, 0 otherwise.
+    """
+
+    args = _parse_args(argv)
+
+    def progress(point):
+        timings = ", ".join(f"{stage}={time:.4f}s" for stage, time in point["timings"].items())
+        print(f"E={point['nb_electors']} C={point['nb_candidates']}: {timings}", file=sys.stderr)
+
+    report = run_grid(args.electors, args.candidates, args.rules, args.repeat,
+                      args.max_delegation_electors, args.seed, progress)
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline is None:
+        return 0
+
+    stage_thresholds: Dict[str, float] = dict(args.stage_threshold)
+    regressions = compare(report, load_report(args.baseline), args.threshold, stage_thresholds, args.min_delta)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("No regression.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Storage of benchmark reports and comparison with a baseline."""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class Regression:
+    """A stage that became slower than allowed by the threshold."""
+
+    nb_electors: int
+    nb_candidates: int
+    stage: str
+    baseline: float
+    """Baseline time in seconds."""
+    current: float
+    """Current time in seconds."""
+    threshold: float
+    """Allowed relative slowdown (0.2 means 20%)."""
+
+    @property
+    def ratio(self) -> float:
+        """Current time divided by the baseline time."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (f"E={self.nb_electors} C={self.nb_candidates} {self.stage}: "
+                f"{self.baseline:.4f}s -> {self.current:.4f}s (x{self.ratio:.2f}, allowed x{1 + self.threshold:.2f})")
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    """Write a report (cf. `benchmarks.stages.run_grid`) to a JSON file.
+
+    Args:
+        report (Dict[str, Any]): A benchmark report.
+        path (str): Path of the JSON file.
+    """
+
+    with open(path, "w") as file:
+        json.dump(report, file, indent=4)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """Read a report from a JSON file.
+
+    Args:
+        path (str): Path of the JSON file.
+
+    Returns:
+        Dict[str, Any]: A benchmark report.
+    """
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2,
+            stage_thresholds: Optional[Dict[str, float]] = None, min_delta: float = 0.001) -> List[Regression]:
+    """Compare a report with a baseline report. Only the points and stages present in both reports are compared.
+
+    Args:
+        current (Dict[str, Any]): The current report.
+        baseline (Dict[str, Any]): The baseline report.
+        threshold (float): Allowed relative slowdown of every stage. Default = 0.2 (20%).
+        stage_thresholds (Optional[Dict[str, float]]): Allowed relative slowdown for some stages,
+            overrides `threshold`. Default = `None`.
+        min_delta (float): Slowdowns smaller than this duration (in seconds) are ignored as noise. Default = 0.001.
+
+    Returns:
+        List[benchmarks.baseline.Regression]: Stages which became slower than allowed.
+    """
+
+    stage_thresholds = stage_thresholds or dict()
+    baseline_points = {(p["nb_electors"], p["nb_candidates"]): p["timings"] for p in baseline["results"]}
+
+    regressions = []
+    for point in current["results"]:
+        key = (point["nb_electors"], point["nb_candidates"])
+        if key not in baseline_points:
+            continue
+        for stage, current_time in point["timings"].items():
+            baseline_time = baseline_points[key].get(stage)
+            if baseline_time is None:
+                continue
+            allowed = stage_thresholds.get(stage, threshold)
+            if current_time > baseline_time * (1 + allowed) and current_time - baseline_time > min_delta:
+                regressions.append(Regression(*key, stage, baseline_time, current_time, allowed))
+    return regressions
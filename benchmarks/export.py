@@ -0,0 +1,132 @@
+"""Throughput of the SQLite export: rows per second of the step-by-step export (a commit after each statement),
+of the single-transaction export (cf. `sqlite.export_data.ExportData.export`) and of the same export
+with the opt-in `ExportData.FAST_PRAGMAS`.
+
+Usage:
+    `python -m benchmarks.export --electors 100000 1000000`
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.simulate import configure, generate_population
+from sqlite import ExportData
+
+STEP_BY_STEP: str = "step_by_step"
+SINGLE_TRANSACTION: str = "single_transaction"
+FAST: str = "fast"
+"""Names of the export modes."""
+
+
+def _step_by_step(connection: sqlite3.Connection) -> None:
+    """Export people and results with a commit after each statement."""
+
+    ExportData.create_database_people(connection)
+    ExportData.create_database_results(connection)
+
+
+def _single_transaction(connection: sqlite3.Connection) -> None:
+    """Export people and results in a single transaction with the default PRAGMAs."""
+
+    ExportData.export(connection, with_results=True)
+
+
+def _fast(connection: sqlite3.Connection) -> None:
+    """Export people and results in a single transaction with `ExportData.FAST_PRAGMAS`."""
+
+    ExportData.export(connection, with_results=True, pragmas=ExportData.FAST_PRAGMAS)
+
+
+MODES: Dict[str, Callable[[sqlite3.Connection], None]] = {
+    STEP_BY_STEP: _step_by_step,
+    SINGLE_TRANSACTION: _single_transaction,
+    FAST: _fast,
+}
+
+
+def _count_rows(connection: sqlite3.Connection) -> int:
+    """Return the number of rows of all tables of the database."""
+
+    tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    return sum(connection.execute(f"SELECT count(*) FROM {table}").fetchone()[0] for table in tables)
+
+
+def time_export(nb_electors: int, nb_candidates: int, repeat: int = 3, seed: int = 0) -> Dict[str, float]:
+    """Generate an election, compute its results and time each export mode into a new database file.
+
+    Args:
+        nb_electors (int): Number of generated electors.
+        nb_candidates (int): Number of generated candidates.
+        repeat (int): Number of exports of each mode. The best time is kept. Default = 3.
+        seed (int): Seed of the data generation. Default = 0.
+
+    Returns:
+        Dict[str, float]: Rows per second of each mode.
+    """
+
+    random.seed(seed)
+    np.random.seed(seed)
+    election = Election()
+    configure(election, liquid_democracy=False)
+    generate_population(election, nb_electors, nb_candidates)
+    election.start_election(chosen_voting_rules=[rule for rule in VotingRulesConstants.VOTING_RULES_FUNC
+                                                 if rule not in VotingRulesConstants.MULTI_ROUND or nb_candidates >= 3])
+
+    rates = dict()
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, export in MODES.items():
+            best = float("inf")
+            for _ in range(repeat):
+                path = os.path.join(directory, f"{mode}.db")
+                if os.path.exists(path):
+                    os.remove(path)
+                connection = sqlite3.connect(path)
+                start = perf_counter()
+                export(connection)
+                best = min(best, perf_counter() - start)
+                nb_rows = _count_rows(connection)
+                connection.close()
+            rates[mode] = nb_rows / best
+
+    election.delete_all_data()
+    return rates
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Time the export modes and print their rows per second.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments. Default = `sys.argv[1:]`.
+
+    Returns:
+        int: 0.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.export",
+                                     description="Rows per second of the SQLite export modes.")
+    parser.add_argument("--electors", nargs="+", type=int, default=[10_000, 100_000], help="Numbers of electors.")
+    parser.add_argument("--candidates", type=int, default=10, help="Number of candidates.")
+    parser.add_argument("--repeat", type=int, default=3, help="Exports of each mode, the best time is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the data generation.")
+    args = parser.parse_args(argv)
+
+    for nb_electors in args.electors:
+        rates = time_export(nb_electors, args.candidates, args.repeat, args.seed)
+        speedup = rates[SINGLE_TRANSACTION] / rates[STEP_BY_STEP]
+        print(f"E={nb_electors} C={args.candidates}: "
+              + ", ".join(f"{mode}={rate:,.0f} rows/s" for mode, rate in rates.items())
+              + f" (x{speedup:.2f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
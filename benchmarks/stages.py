@@ -0,0 +1,143 @@
+"""Timing of the stages of an election. Data generation is not timed."""
+
+import platform
+import random
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.simulate import configure, generate_population
+from electoral_systems.voting_rules.utls import set_duels_scores
+
+ELECTORS_GRID: List[int] = [1_000, 10_000, 100_000, 1_000_000]
+"""Default numbers of electors."""
+
+CANDIDATES_GRID: List[int] = [3, 10, 30]
+"""Default numbers of candidates."""
+
+MAX_DELEGATION_ELECTORS: int = 100_000
+"""By default, delegations are not timed above this number of electors."""
+
+RANKING: str = "ranking"
+AVERAGES: str = "averages"
+DELEGATIONS: str = "delegations"
+DUELS: str = "duels"
+APPLY_PREFIX: str = "apply_"
+"""Stage names. The time of each voting rule is stored under `APPLY_PREFIX` + the voting rule constant."""
+
+
+def _best_time(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> float:
+    """Return the best time (in seconds) of `repeat` calls of `func`. `setup` is called (not timed) before each call."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def time_stages(nb_electors: int, nb_candidates: int, voting_rules: Optional[Iterable[str]] = None,
+                repeat: int = 3, delegations: bool = True, seed: int = 0) -> Dict[str, float]:
+    """Generate an election and time each stage of `Election.start_election` separately.
+
+    Args:
+        nb_electors (int): Number of generated electors.
+        nb_candidates (int): Number of generated candidates.
+        voting_rules (Optional[Iterable[str]]): Constants of the voting rules to time. Default = every voting rule
+            applicable with `nb_candidates` candidates.
+        repeat (int): Number of repetitions of each stage. The best time is kept. Default = 3.
+        delegations (bool): Time the delegations of liquid democracy. Default = `True`.
+        seed (int): Seed of the data generation. Default = 0.
+
+    Returns:
+        Dict[str, float]: Best time in seconds of each stage.
+    """
+
+    if voting_rules is None:
+        voting_rules = [rule for rule in VotingRulesConstants.VOTING_RULES_FUNC
+                        if rule not in VotingRulesConstants.MULTI_ROUND or nb_candidates >= 3]
+
+    random.seed(seed)
+    np.random.seed(seed)
+    election = Election()
+    configure(election, liquid_democracy=delegations)
+    generate_population(election, nb_electors, nb_candidates)
+    positions_sum = election.average_position_electors
+
+    def reset_averages():
+        election.average_position_electors = positions_sum
+
+    def reset_weights():
+        for elector in election.electors:
+            elector.weight = 1
+
+    def averages():
+        election.set_avg_electors_position()
+        election._calc_proportion_satisfaction()
+
+    def duels():
+        election.duels_scores = set_duels_scores(election.electors, election.candidates, election.profile)
+        # Duels are computed on first access
+        election.duels_scores.matrix
+
+    timings = dict()
+    timings[RANKING] = _best_time(election._define_ranking, repeat)
+    timings[AVERAGES] = _best_time(averages, repeat, setup=reset_averages)
+    if delegations:
+        timings[DELEGATIONS] = _best_time(election._make_delegations, repeat, setup=reset_weights)
+    timings[DUELS] = _best_time(duels, repeat)
+
+    election._init_results_keys(voting_rules)
+    for voting_rule in voting_rules:
+        timings[APPLY_PREFIX + voting_rule] = _best_time(lambda: election.apply_voting_rule(voting_rule), repeat)
+
+    election.delete_all_data()
+    return timings
+
+
+def run_grid(electors_grid: Iterable[int] = ELECTORS_GRID, candidates_grid: Iterable[int] = CANDIDATES_GRID,
+             voting_rules: Optional[Iterable[str]] = None, repeat: int = 3,
+             max_delegation_electors: int = MAX_DELEGATION_ELECTORS, seed: int = 0,
+             progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Time every stage for each pair (number of electors, number of candidates) of the grid.
+
+    Args:
+        electors_grid (Iterable[int]): Numbers of electors. Default = `ELECTORS_GRID`.
+        candidates_grid (Iterable[int]): Numbers of candidates. Default = `CANDIDATES_GRID`.
+        voting_rules (Optional[Iterable[str]]): Constants of the voting rules to time. Default = every voting rule.
+        repeat (int): Number of repetitions of each stage. Default = 3.
+        max_delegation_electors (int): Delegations are timed only up to this number of electors.
+            Default = `MAX_DELEGATION_ELECTORS`.
+        seed (int): Seed of the data generation. Default = 0.
+        progress (Optional[Callable[[Dict[str, Any]], None]]): A function called with each measured point.
+
+    Returns:
+        Dict[str, Any]: A report: `meta` (environment and settings) and `results`, a list of points
+            `{"nb_electors", "nb_candidates", "timings"}`.
+    """
+
+    voting_rules = None if voting_rules is None else list(voting_rules)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": [],
+    }
+    for nb_electors in electors_grid:
+        for nb_candidates in candidates_grid:
+            timings = time_stages(nb_electors, nb_candidates, voting_rules, repeat,
+                                  delegations=nb_electors <= max_delegation_electors, seed=seed)
+            point = {"nb_electors": nb_electors, "nb_candidates": nb_candidates, "timings": timings}
+            report["results"].append(point)
+            if progress is not None:
+                progress(point)
+    return report
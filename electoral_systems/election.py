@@ -1,12 +1,19 @@
-from typing import Set, Optional, List, Union, Dict
+from typing import Set, Optional, List, Union, Dict, Callable
 from math import sqrt
 from random import random
 
-from .utls import Singleton, NameIterator, IdIterator
+import numpy as np
+
+from .utls import Singleton, NameIterator, IdIterator, SpatialIndex
 from .election_constants import RandomConstants, VotingRulesConstants
+from .generation import truncated_normal
 from .extensions.polls import (
     add_elector_data,
+    add_electors_data,
     add_candidate_data,
+    add_candidates_data,
+    remove_elector_data,
+    sequential_sum,
     get_default_directions_data,
     set_avg_electors_positions,
     set_std_deviation,
@@ -14,8 +21,13 @@ from .extensions.polls import (
     change_ranking_electors,
     direction_data_type
 )
-from .extensions.liquid_democracy import choose_delegee, choose_possible_delegees
-from .voting_rules.utls import set_duels_scores, sort_cand_by_value, sort_cand_by_round, duels_type
+from .extensions.liquid_democracy import (DELEGATION_GAP_COEF, choose_delegee_row, delegation_weights,
+                                          possible_delegees_rows)
+from .extensions.incremental import RunningTallies
+from .voting_rules.duels import Duels
+from .voting_rules.mapped_profile import MappedProfile
+from .voting_rules.profile import Profile
+from .voting_rules.utls import set_duels_scores, set_scores, sort_cand_by_value, sort_cand_by_round, duels_type
 
 from people import Candidate, Elector
 
@@ -26,7 +38,12 @@ __pdoc__ = {
     'Election._calc_distance': True,
     'Election._define_ranking': True,
     'Election._calc_proportion_satisfaction': True,
-    'Election._make_delegations': True
+    'Election._make_delegations': True,
+    'Election._take_imported_ranks': True,
+    'Election._add_elector_incremental': True,
+    'Election._add_electors_incremental': True,
+    'Election._refresh_results': True,
+    'Election._update_poll_rankings': True,
 }
 
 
@@ -35,8 +52,20 @@ class Election(metaclass=Singleton):
 
     def __init__(self):
         super().__init__()
-        self.electors: List[Elector] = []
-        """Une liste qui stocke tous les électeurs qui participent dans une élection."""
+        self.electors_loader: Optional[Callable[[], None]] = None
+        """Une fonction qui ajoute les électeurs d'une importation paresseuse lors du premier accès à `electors`
+        (cf. `Election.set_lazy_electors()`), `None` sinon."""
+
+        self.electors_load_error: Optional[str] = None
+        """Le message de l'erreur du dernier chargement des électeurs d'une importation paresseuse qui a échoué,
+        `None` sinon (cf. `Election.load_electors()`)."""
+
+        self._lazy_nb_electors: int = 0
+        self._lazy_started: bool = False
+        # Le nombre des électeurs qui ne sont pas encore chargés (importation paresseuse) et si l'élection
+        # a déjà été lancée avec les résultats importés
+
+        self.electors = []
 
         self.candidates = []
         """Une liste qui stocke tous les candidats qui participent dans une élection."""
@@ -50,6 +79,25 @@ class Election(metaclass=Singleton):
         self.id_iter = IdIterator(0)
         """Un itérateur qui génére des IDs des candidats et des électeurs."""
 
+        self.profile: Profile = Profile([], [])
+        """Un profil de préférences: les classements de tous les électeurs stockés dans une matrice (E×C),
+        ainsi que leurs positions, poids et taux de connaissance. Rempli par `Election._define_ranking()`."""
+
+        self.tallies: Optional[RunningTallies] = None
+        """Les décomptes courants de l'élection. Remplis par `Election.calc_results()` uniquement si le mode incrémental
+        est activé (`incremental_activated`) ou si les sondages sont activés. `None` sinon, ou si un candidat a été
+        ajouté depuis."""
+
+        self.mapped_profile: Optional[MappedProfile] = None
+        """Un profil sur disque attaché par `Election.attach_profile()` (élection hors mémoire), `None` sinon."""
+
+        self.imported_ranks: Optional[tuple[np.ndarray, np.ndarray]] = None
+        """Les classements importés (E×C) et les positions des candidats (C×2) pour lesquelles ils ont été calculés.
+        Remplis par `Election.set_imported_ranks()`, utilisés une seule fois par `Election._define_ranking()`."""
+
+        self._electors_rows: Dict[int, int] = dict()
+        """Un dictionnaire qui associe à l'`id()` de chaque électeur son indice de ligne dans `profile` (mode incrémental)."""
+
         # Stocke les resultats
         self.results: Dict[str, List[Candidate]] = dict()
         """Un dictionnaire qui stocke un classement des candidats (dans l'ordre décroissant) pour chaque règle de vote choisie."""
@@ -60,6 +108,9 @@ class Election(metaclass=Singleton):
 
         # Pour la satisfaction
         self.average_position_electors: tuple[float, float] = (0, 0)
+        self._average_is_mean: bool = False
+        # `True` si `average_position_electors` est déjà une moyenne (cf. `Election.set_avg_electors_position()`),
+        # `False` si c'est encore la somme des positions
         self.proportion_satisfaction: float = 0
         """La distance maximale entre la position moyenne des électeurs et la position de chaque candidat."""
 
@@ -85,6 +136,9 @@ class Election(metaclass=Singleton):
         # Active/désactive un tie-break selon les duels
         self.tie_breaker_activated = True
 
+        # Active/désactive la MAJ incrémentale des résultats lors d'un ajout ou d'une suppression d'un électeur
+        self.incremental_activated = False
+
         # Les constantes de la génération des données
         self.generation_constants = dict()
         for type, default_value in RandomConstants.DEFAULT_VALUES.items():
@@ -111,6 +165,90 @@ class Election(metaclass=Singleton):
         x2, y2 = point2
         return sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
 
+    @property
+    def electors(self) -> List[Elector]:
+        """Une liste qui stocke tous les électeurs qui participent dans une élection. Lors d'une importation paresseuse,
+        les électeurs sont chargés au premier accès. Si ce chargement a échoué, la liste reste vide
+        jusqu'à un nouvel appel de `Election.load_electors()`."""
+
+        if self.electors_load_error is None:
+            self.load_electors()
+        return self._electors
+
+    @electors.setter
+    def electors(self, electors: List[Elector]) -> None:
+        self._electors = electors
+
+    def set_lazy_electors(self, nb_electors: int, average_position: tuple[float, float],
+                          loader: Callable[[], None]) -> None:
+        """Diffère le chargement des électeurs: ils sont ajoutés par `loader` uniquement lorsque quelque chose
+        en a besoin (la carte politique, les sondages, un nouveau calcul des résultats). En attendant, seuls leur nombre
+        et leur position moyenne sont connus, ce qui suffit pour afficher des résultats importés.
+
+        Args:
+            nb_electors (int): Le nombre des électeurs.
+            average_position (tuple[float, float]): La position moyenne des électeurs.
+            loader (Callable[[], None]): Une fonction qui ajoute les électeurs à l'élection
+                (par exemple, avec `Election.add_electors()`).
+        """
+
+        self._lazy_nb_electors = nb_electors
+        self._lazy_started = False
+        self.electors_load_error = None
+        self.average_position_electors = average_position
+
+        def load():
+            # Les électeurs ajoutés cumulent leurs positions dans la position moyenne:
+            # la division n'est faite ici que si l'élection a déjà été lancée
+            self.average_position_electors = (0, 0)
+            self._average_is_mean = False
+            loader()
+            if self._lazy_started and self._electors:
+                self.set_avg_electors_position()
+
+        self.electors_loader = load
+
+    def load_electors(self) -> tuple[bool, str]:
+        """Charge les électeurs d'une importation paresseuse s'ils ne sont pas encore chargés
+        (cf. `Election.set_lazy_electors()`). Si le chargement échoue (par exemple, le fichier importé a été supprimé),
+        les électeurs déjà ajoutés sont retirés et l'élection attend toujours leur chargement.
+
+        Returns:
+            tuple[bool, str]: `True` si les électeurs sont chargés, `False` sinon. Un message.
+        """
+
+        if self.electors_loader is None:
+            return True, "Electors loaded"
+
+        loader, self.electors_loader = self.electors_loader, None
+        average_position, average_is_mean = self.average_position_electors, self._average_is_mean
+        try:
+            loader()
+        except (OSError, ValueError) as error:
+            self._electors = []
+            self.imported_ranks = None
+            self.average_position_electors, self._average_is_mean = average_position, average_is_mean
+            self.electors_loader = loader
+            self.electors_load_error = f"Electors not loaded: {error}"
+            return False, self.electors_load_error
+        self.electors_load_error = None
+        return True, "Electors loaded"
+
+    @property
+    def electors_loaded(self) -> bool:
+        """`False` si les électeurs d'une importation paresseuse ne sont pas encore chargés."""
+
+        return self.electors_loader is None
+
+    @property
+    def nb_electors(self) -> int:
+        """Le nombre des électeurs d'une élection (ceux d'un profil sur disque attaché et ceux qui ne sont pas encore
+        chargés compris)."""
+
+        if self.electors_loader is not None:
+            return self._lazy_nb_electors
+        return len(self._electors) if self.mapped_profile is None else self.mapped_profile.nb_electors
+
     def has_electors_candidates(self) -> bool:
         """Vérifie qu'il existe au moins un électeur et un candidat dans une élection.
 
@@ -118,7 +256,7 @@ class Election(metaclass=Singleton):
             bool: `True` s'il existe au moins un électeur et un candidat dans une élection, sinon `False`.
         """
 
-        if not self.electors and not self.candidates:
+        if not self.nb_electors and not self.candidates:
             return False
         return True
 
@@ -142,30 +280,178 @@ class Election(metaclass=Singleton):
 
         self.electors.append(new_elector)
 
-    def add_elector(self, position: tuple[float, float]) -> None:
+    def add_elector(self, position: tuple[float, float], knowledge: Optional[float] = None) -> None:
         """Ajoute un nouvel électeur dans une élection avec sa position position. 
         Si les sondages sont activés, MAJ des données sur les directions de la carte politique. 
         MAJ des données sur la position moyenne de tous les électeurs participants à l'élection.
+        Si les résultats existent déjà et que le mode incrémental est activé, MAJ des résultats
+        (cf. `Election._add_elector_incremental()`).
 
         Args:
             position (tuple[float, float]): La position d'un électeur sur la carte politique. 
                 Chaque coordonnée doit être bornée entre -1 et 1.
+            knowledge (Optional[float]): Le taux de connaissance d'un électeur. S'il n'est pas donné, il est généré
+                selon les constantes de la génération des données.
         """
 
         knowledge_const = self.generation_constants[RandomConstants.KNOWLEDGE]
         new_elector = Elector(
-            id=next(self.id_iter), position=position, knowledge_const=knowledge_const
+            id=next(self.id_iter), position=position, knowledge_const=knowledge_const,
+            knowledge=-1.0 if knowledge is None else knowledge,
         )
-        x, y = new_elector.position
-
         if self.nb_polls:
-            add_elector_data(self.directions_data, new_elector)
+            add_elector_data(self.directions_data, new_elector,
+                             len(self.electors) + 1 if self._average_is_mean else None)
+
+        if self.incremental_activated and self.tallies is not None:
+            self._add_elector_incremental(new_elector)
+            return
 
         # All electors average
-        x_avg, y_avg = self.average_position_electors
-        x_avg, y_avg = x_avg + x, y_avg + y
-        self.average_position_electors = (x_avg, y_avg)
+        self._update_average_position(new_elector.position, 1)
         self.electors.append(new_elector)
+        # Le profil ne contient pas le nouvel électeur: les décomptes ne sont plus valables
+        self.tallies = None
+
+    def _add_elector_incremental(self, new_elector: Elector) -> None:
+        """Ajoute un électeur à une élection dont les résultats existent déjà (mode incrémental): l'électeur est ajouté
+        au profil, sa contribution est ajoutée aux décomptes courants, puis les résultats sont mis à jour.
+        La position moyenne des électeurs reste une moyenne.
+
+        Args:
+            new_elector (people.elector.Elector): Un nouvel électeur.
+        """
+
+        self._update_average_position(new_elector.position, 1)
+        self.electors.append(new_elector)
+
+        row = self.profile.append(new_elector.position, new_elector.weight, new_elector.knowledge)
+        self._electors_rows[id(new_elector)] = row
+        self.tallies.add(self.profile, row)
+
+        self._calc_proportion_satisfaction()
+        self._refresh_results()
+
+    def _update_average_position(self, position: tuple[float, float], sign: int) -> None:
+        """MAJ de la position moyenne des électeurs avant l'ajout (`sign` = 1) ou la suppression (`sign` = -1)
+        d'un électeur. Avant le début d'une élection, seule la somme des positions est MAJ. Après
+        (cf. `Election.set_avg_electors_position()`), la moyenne est recalculée.
+
+        Args:
+            position (tuple[float, float]): La position d'un électeur ajouté ou supprimé.
+            sign (int): 1 pour un ajout, -1 pour une suppression.
+        """
+
+        x, y = position
+        x_avg, y_avg = self.average_position_electors
+        if not self._average_is_mean:
+            self.average_position_electors = (x_avg + sign * x, y_avg + sign * y)
+            return
+
+        nb_electors = len(self.electors)
+        if nb_electors + sign <= 0:
+            self.average_position_electors = (0, 0)
+            return
+        self.average_position_electors = ((x_avg * nb_electors + sign * x) / (nb_electors + sign),
+                                          (y_avg * nb_electors + sign * y) / (nb_electors + sign))
+
+    def remove_elector(self, elector: Elector) -> None:
+        """Supprime un électeur d'une élection. Si les résultats existent déjà et que le mode incrémental est activé,
+        sa contribution est retirée des décomptes courants et les résultats sont mis à jour. Dans ce cas, le dernier électeur
+        de la liste `electors` prend la place de l'électeur supprimé.
+
+        Args:
+            elector (people.elector.Elector): Un électeur qui participe à une élection.
+        """
+
+        if self.nb_polls:
+            remove_elector_data(self.directions_data, elector,
+                                len(self.electors) - 1 if self._average_is_mean else None)
+        self._update_average_position(elector.position, -1)
+
+        if not self.incremental_activated or self.tallies is None:
+            index = next(i for i, e in enumerate(self.electors) if e is elector)
+            del self.electors[index]
+            # Le profil contient encore l'électeur supprimé: les décomptes ne sont plus valables
+            self.tallies = None
+            return
+
+        row = self._electors_rows.pop(id(elector))
+        self.tallies.remove(self.profile, row)
+        self.profile.remove(row)
+
+        # Le dernier électeur prend la place de l'électeur supprimé (comme dans le profil)
+        last_elector = self.electors.pop()
+        if last_elector is not elector:
+            self.electors[row] = last_elector
+            self._electors_rows[id(last_elector)] = row
+
+        self._calc_proportion_satisfaction()
+        self._refresh_results()
+
+    def attach_profile(self, profile: MappedProfile) -> None:
+        """Attache un profil sur disque pour une élection hors mémoire. Les électeurs ne sont pas créés comme objets
+        Python: leurs données sont lues par blocs dans `profile`, la liste `electors` reste vide. Les candidats sont
+        ajoutés comme d'habitude, le classement, les décomptes et les duels parcourent le profil par blocs.
+        La démocratie liquide, les sondages et le mode incrémental ne sont pas disponibles.
+
+        Args:
+            profile (electoral_systems.voting_rules.mapped_profile.MappedProfile): Un profil sur disque dont les positions
+                sont déjà écrites.
+
+        Raises:
+            ValueError: Si l'élection contient déjà des électeurs.
+        """
+
+        if self.electors:
+            raise ValueError("Cannot attach a profile to an election which already has electors")
+        self.mapped_profile = profile
+        self.average_position_electors = profile.positions_sum()
+        self._average_is_mean = False
+
+    def set_imported_ranks(self, ranks: np.ndarray) -> None:
+        """Garde les classements importés de tous les électeurs. Ils seront utilisés au lieu d'un nouveau classement
+        lors du prochain appel à `Election._define_ranking()`, uniquement si les électeurs et les candidats
+        (leur nombre et leurs positions) n'ont pas changé depuis. Doit être appelée après l'ajout des candidats.
+
+        Args:
+            ranks (numpy.ndarray): Une matrice (E×C) des indices des candidats dans l'ordre de `candidates`,
+                une ligne par électeur dans l'ordre de `electors`.
+        """
+
+        positions = np.array([candidate.position for candidate in self.candidates], dtype=np.float64).reshape(-1, 2)
+        self.imported_ranks = (ranks, positions)
+
+    def _take_imported_ranks(self) -> Optional[np.ndarray]:
+        """Retourne les classements importés s'ils correspondent encore aux électeurs et aux candidats, puis les oublie.
+
+        Returns:
+            Optional[numpy.ndarray]: Les classements (E×C), `None` s'ils n'existent pas ou ne sont plus valides.
+        """
+
+        if self.imported_ranks is None:
+            return None
+        ranks, positions = self.imported_ranks
+        self.imported_ranks = None
+        current = np.array([candidate.position for candidate in self.candidates], dtype=np.float64).reshape(-1, 2)
+        if ranks.shape != (self.nb_electors, len(self.candidates)) or not np.array_equal(current, positions):
+            return None
+        return ranks
+
+    def distance_ranks(self) -> Optional[np.ndarray]:
+        """Retourne les classements du profil s'ils sont les classements par distance de tous les électeurs
+        et de tous les candidats courants, i.e. si une élection a été commencée, qu'aucun électeur ou candidat
+        n'a été ajouté depuis et qu'aucun sondage ne les a modifiés. Utilisée lors d'une exportation.
+
+        Returns:
+            Optional[numpy.ndarray]: La matrice (E×C) `profile.ranks`, `None` si elle n'est pas à jour.
+        """
+
+        profile = self.profile
+        if (self.nb_polls or profile.ranks is None or profile.nb_electors != self.nb_electors
+                or profile.candidates != self.candidates or not self.nb_electors):
+            return None
+        return profile.ranks
 
     def add_candidate_import(self, new_candidate: Candidate) -> None:
         """Ajoute un candidat dont les données sont déjà initialisées. 
@@ -176,20 +462,25 @@ class Election(metaclass=Singleton):
             new_elector (people.elector.Elector): Un nouvel électeur.
         """
 
+        new_candidate.index = len(self.candidates)
         self.candidates.append(new_candidate)
         if self.nb_polls:
             add_candidate_data(self.directions_data, new_candidate)
 
-    def add_candidate(self, position: tuple[float, float], first_name: Optional[str] = "", last_name: Optional[str] = "") -> None:
+    def add_candidate(self, position: tuple[float, float], first_name: Optional[str] = "", last_name: Optional[str] = "",
+                      dogmatism: Optional[float] = None, opposition: Optional[float] = None) -> None:
         """Ajoute un nouveau candidat dans une élection avec sa position position, 
         et éventuellement son nom (`last_name`) et son prénom (`first_name`). Si les sondages sont activés, 
-        MAJ des données sur les directions de la carte politique.
+        MAJ des données sur les directions de la carte politique. Le candidat reçoit l'indice dense suivant
+        (`people.candidate.Candidate.index`), utilisé par toutes les structures de calcul.
 
         Args:
             position (tuple[float, float]): La position d'un candidat sur la carte politique. 
                 Chaque coordonnée doit être bornée entre -1 et 1.
             first_name (Optional[str]): Le prénom d'un candidat.
             last_name (Optional[str]): Le nom d'un candidat.
+            dogmatism (Optional[float]): Le niveau de dogmatisme d'un candidat. S'il n'est pas donné, il est généré.
+            opposition (Optional[float]): Le niveau d'opposition d'un candidat. S'il n'est pas donné, il est généré.
         """
 
         dogmat_const = self.generation_constants[RandomConstants.DOGMATISM]
@@ -203,13 +494,139 @@ class Election(metaclass=Singleton):
             position=position,
             first_name=first_name,
             last_name=last_name,
+            dogmatism=-1.0 if dogmatism is None else dogmatism,
+            opposition=-1.0 if opposition is None else opposition,
             dogmatism_const=dogmat_const,
             opposition_const=oppos_const,
+            index=len(self.candidates),
         )
         if self.nb_polls:
             add_candidate_data(self.directions_data, new_candidate)
 
         self.candidates.append(new_candidate)
+        # Les décomptes ne sont plus valables, il faut relancer une élection
+        self.tallies = None
+
+    def add_electors(self, positions: np.ndarray, weights: Optional[np.ndarray] = None,
+                     knowledge: Optional[np.ndarray] = None, ids: Optional[np.ndarray] = None) -> None:
+        """Ajoute plusieurs électeurs dans une élection en une seule fois (cf. `Election.add_elector()`).
+        La position moyenne et, si les sondages sont activés, les données des directions de la carte politique sont
+        MAJ avec des opérations vectorisées. Si les résultats existent déjà et que le mode incrémental est activé,
+        les électeurs sont ajoutés au profil en une seule opération (cf. `Election._add_electors_incremental()`).
+
+        Args:
+            positions (numpy.ndarray): Les positions des électeurs, un tableau (N×2). Chaque coordonnée doit être bornée
+                entre -1 et 1.
+            weights (Optional[numpy.ndarray]): Les poids des électeurs, un tableau (N,). Par défaut, tous valent 1.
+            knowledge (Optional[numpy.ndarray]): Les taux de connaissance des électeurs, un tableau (N,).
+                S'ils ne sont pas donnés, ils sont générés selon les constantes de la génération des données.
+            ids (Optional[numpy.ndarray]): Les IDs des électeurs, un tableau (N,) (par exemple, lors d'une importation).
+                S'ils ne sont pas donnés, ils sont générés.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        nb_electors = len(positions)
+        if not nb_electors:
+            return
+        weights = np.ones(nb_electors, dtype=np.int64) if weights is None else np.asarray(weights, dtype=np.int64)
+        if knowledge is None:
+            mu, sigma = self.generation_constants[RandomConstants.KNOWLEDGE]
+            knowledge = truncated_normal(mu, sigma, 0, 1, nb_electors)
+        knowledge = np.asarray(knowledge, dtype=np.float64)
+
+        ids = (next(self.id_iter) for _ in range(nb_electors)) if ids is None else np.asarray(ids).tolist()
+        new_electors = [
+            Elector(id=id, position=(x, y), weight=weight, knowledge=elector_knowledge)
+            for id, (x, y), weight, elector_knowledge in zip(ids, positions.tolist(), weights.tolist(),
+                                                             knowledge.tolist())
+        ]
+
+        if self.nb_polls:
+            add_electors_data(self.directions_data, positions)
+
+        if self.incremental_activated and self.tallies is not None:
+            self._add_electors_incremental(new_electors, positions, weights, knowledge)
+            return
+
+        # All electors average
+        x_avg, y_avg = self.average_position_electors
+        self.average_position_electors = (sequential_sum(x_avg, positions[:, 0]), sequential_sum(y_avg, positions[:, 1]))
+        self.electors.extend(new_electors)
+        # Le profil ne contient pas les nouveaux électeurs: les décomptes ne sont plus valables
+        self.tallies = None
+
+    def _add_electors_incremental(self, new_electors: List[Elector], positions: np.ndarray, weights: np.ndarray,
+                                  knowledge: np.ndarray) -> None:
+        """Ajoute plusieurs électeurs à une élection dont les résultats existent déjà (mode incrémental), cf.
+        `Election._add_elector_incremental()`. Les électeurs sont ajoutés au profil et aux décomptes courants
+        en une seule opération, puis les résultats sont mis à jour une seule fois.
+
+        Args:
+            new_electors (List[people.elector.Elector]): Les nouveaux électeurs.
+            positions (numpy.ndarray): Leurs positions, un tableau (N×2).
+            weights (numpy.ndarray): Leurs poids, un tableau (N,).
+            knowledge (numpy.ndarray): Leurs taux de connaissance, un tableau (N,).
+        """
+
+        nb_electors, nb_new = len(self.electors), len(new_electors)
+        x_avg, y_avg = self.average_position_electors
+        self.average_position_electors = (
+            sequential_sum(x_avg * nb_electors, positions[:, 0]) / (nb_electors + nb_new),
+            sequential_sum(y_avg * nb_electors, positions[:, 1]) / (nb_electors + nb_new),
+        )
+        self.electors.extend(new_electors)
+
+        rows = self.profile.extend(positions, weights, knowledge)
+        self._electors_rows.update((id(elector), row) for elector, row in zip(new_electors, rows.tolist()))
+        self.tallies.add_rows(self.profile, rows)
+
+        self._calc_proportion_satisfaction()
+        self._refresh_results()
+
+    def add_candidates(self, positions: np.ndarray, dogmatism: Optional[np.ndarray] = None,
+                       opposition: Optional[np.ndarray] = None) -> None:
+        """Ajoute plusieurs candidats dans une élection en une seule fois (cf. `Election.add_candidate()`).
+        Leurs noms sont générés. Si les sondages sont activés, les données des directions de la carte politique sont
+        MAJ avec des opérations vectorisées.
+
+        Args:
+            positions (numpy.ndarray): Les positions des candidats, un tableau (N×2).
+            dogmatism (Optional[numpy.ndarray]): Les niveaux de dogmatisme des candidats, un tableau (N,).
+                S'ils ne sont pas donnés, ils sont générés.
+            opposition (Optional[numpy.ndarray]): Les niveaux d'opposition des candidats, un tableau (N,).
+                S'ils ne sont pas donnés, ils sont générés.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        nb_candidates = len(positions)
+        if not nb_candidates:
+            return
+        if dogmatism is None:
+            mu, sigma = self.generation_constants[RandomConstants.DOGMATISM]
+            dogmatism = truncated_normal(mu, sigma, 0, 1, nb_candidates)
+        if opposition is None:
+            mu, sigma = self.generation_constants[RandomConstants.OPPOSITION]
+            opposition = truncated_normal(mu, sigma, 0, 1, nb_candidates)
+
+        self.candidates.extend(
+            Candidate(
+                id=next(self.id_iter),
+                position=(x, y),
+                first_name=next(self.first_name_iter),
+                last_name=next(self.last_name_iter),
+                dogmatism=candidate_dogmatism,
+                opposition=candidate_opposition,
+                index=index,
+            )
+            for index, (x, y), candidate_dogmatism, candidate_opposition in zip(
+                range(len(self.candidates), len(self.candidates) + nb_candidates), positions.tolist(), np.asarray(dogmatism, dtype=np.float64).tolist(),
+                np.asarray(opposition, dtype=np.float64).tolist())
+        )
+        if self.nb_polls:
+            add_candidates_data(self.directions_data, positions)
+
+        # Les décomptes ne sont plus valables, il faut relancer une élection
+        self.tallies = None
 
     def apply_voting_rule(self, voting_rule: str) -> None:
         """Applique une règle de vote voting_rule. 
@@ -227,7 +644,7 @@ class Election(metaclass=Singleton):
         func = VotingRulesConstants.VOTING_RULES_FUNC[voting_rule]
 
         if voting_rule in VotingRulesConstants.CONDORCET:
-            result = func(self.electors, self.candidates, self.duels_scores)
+            result = func(self.electors, self.candidates, self.duels_scores, profile=self.profile)
 
         if voting_rule in VotingRulesConstants.ONE_ROUND:
             if voting_rule == VotingRulesConstants.APPROVAL:
@@ -236,16 +653,18 @@ class Election(metaclass=Singleton):
                     self.candidates,
                     VotingRulesConstants.APPROVAL_GAP_COEF,
                     self.duels_scores if self.tie_breaker_activated else None,
+                    profile=self.profile,
                 )
             else:
                 result = func(
                     self.electors,
                     self.candidates,
                     self.duels_scores if self.tie_breaker_activated else None,
+                    profile=self.profile,
                 )
 
         if voting_rule in VotingRulesConstants.MULTI_ROUND:
-            result = func(self.electors, self.candidates)
+            result = func(self.electors, self.candidates, profile=self.profile)
 
         self.results[voting_rule] = result
 
@@ -286,10 +705,24 @@ class Election(metaclass=Singleton):
         return fst_candidate if score == len(self.candidates) - 1 else None
 
     def _define_ranking(self) -> None:
-        """Classe les candidats pour chaque électeur. Doit être appelée uniquement quand tous les candidats ont été ajoutés."""
+        """Classe les candidats pour chaque électeur. Doit être appelée uniquement quand tous les candidats ont été ajoutés.
+        Construit le profil de préférences `profile`: toutes les distances sont calculées en une seule opération vectorisée
+        et tous les classements sont obtenus avec un seul tri. Un profil sur disque attaché est classé par blocs.
+        Les classements importés encore valides sont repris tels quels (cf. `Election.set_imported_ranks()`)."""
+
+        if self.mapped_profile is not None:
+            self.mapped_profile.set_candidates(self.candidates)
+            self.profile = self.mapped_profile
+            if self._take_imported_ranks() is None:
+                self.profile.rank()
+            return
 
-        for elector in self.electors:
-            elector.rank_candidates(self.candidates)
+        self.profile = Profile.from_electors(self.electors, self.candidates)
+        ranks = self._take_imported_ranks()
+        if ranks is None:
+            self.profile.rank()
+        else:
+            self.profile.ranks = ranks
 
     def calc_results(self, imported: Optional[bool] = False) -> None:
         """Calcule les résultats d'une élection : calcule les duels entre les candidats, 
@@ -306,18 +739,39 @@ class Election(metaclass=Singleton):
             self.set_results()
             return
 
-        self.duels_scores = set_duels_scores(self.electors, self.candidates)
+        if self.incremental_activated or self.nb_polls:
+            self.tallies = RunningTallies(self.profile, VotingRulesConstants.APPROVAL_GAP_COEF)
+            self._electors_rows = {id(elector): row for row, elector in enumerate(self.electors)}
+            # Les duels sont une vue sur la matrice de majorité courante
+            self.duels_scores = Duels(self.profile.candidates, matrix=self.tallies.majority)
+        else:
+            self.duels_scores = set_duels_scores(self.electors, self.candidates, self.profile)
         for voting_rule in self.results:
             self.apply_voting_rule(voting_rule)
 
+    def _refresh_results(self) -> None:
+        """MAJ des résultats à partir des décomptes courants (mode incrémental). Les scores des règles de vote
+        positionnelles et de l'approbation sont obtenus en O(C²), les règles Condorcet-cohérentes utilisent la matrice
+        de majorité courante. Les règles de vote à plusieurs tours sont recalculées à partir du profil."""
+
+        duels = self.duels_scores if self.tie_breaker_activated else None
+        for voting_rule in self.results:
+            if not self.tallies.supports(voting_rule):
+                self.apply_voting_rule(voting_rule)
+                continue
+            set_scores(self.profile.candidates, voting_rule, self.tallies.scores(voting_rule))
+            self.results[voting_rule] = sort_cand_by_value(self.candidates, voting_rule, self.profile.nb_electors, duels)
+
     def set_avg_electors_position(self) -> None:
         """Calcule la position moyenne des électeurs. Uniquement la division est faite. 
         La somme de toutes les positions est déjà stockée."""
 
+        nb_electors = self.nb_electors
         x_avg, y_avg = self.average_position_electors
-        x_avg /= len(self.electors)
-        y_avg /= len(self.electors)
+        x_avg /= nb_electors
+        y_avg /= nb_electors
         self.average_position_electors = (x_avg, y_avg)
+        self._average_is_mean = True
 
     def _calc_proportion_satisfaction(self) -> None:
         """Calcule la distance maximale entre la position moyenne des électeurs et la position
@@ -373,7 +827,7 @@ class Election(metaclass=Singleton):
         duels = self.duels_scores if self.tie_breaker_activated else None
         for voting_rule in keys:
             if voting_rule in VotingRulesConstants.ONE_ROUND:
-                result = sort_cand_by_value(self.candidates, voting_rule, nb_electors=len(self.electors), duels=duels)
+                result = sort_cand_by_value(self.candidates, voting_rule, nb_electors=self.nb_electors, duels=duels)
                 self.results[voting_rule] = result
 
             if voting_rule in VotingRulesConstants.MULTI_ROUND:
@@ -389,8 +843,8 @@ class Election(metaclass=Singleton):
                     if voting_rule == VotingRulesConstants.CONDORCET_SIMPSON
                     else False
                 )
-                result = sort_cand_by_value(self.candidates, voting_rule, nb_electors=len(
-                    self.electors), duels=None, scores_asc=sort_asc)
+                result = sort_cand_by_value(self.candidates, voting_rule, nb_electors=self.nb_electors,
+                                            duels=None, scores_asc=sort_asc)
                 self.results[voting_rule] = result
 
     def start_election(self, imported: Optional[bool] = False, chosen_voting_rules: List[str] = None) -> None:
@@ -407,8 +861,32 @@ class Election(metaclass=Singleton):
             imported (Optional[bool]): `True` si les données ont été importées, sinon `False`. 
                 Cf. `Election.calc_results()` <electoral_systems.election.Election>
             chosen_voting_rules (Set[str]): Une liste des constantes des règles de vote choisies.
+
+        Raises:
+            ValueError: Si un profil sur disque est attaché et que la démocratie liquide, les sondages
+                ou le mode incrémental sont activés. Si les électeurs d'une importation paresseuse doivent être chargés
+                et que leur chargement échoue.
         """
 
+        if self.mapped_profile is not None and (self.liquid_democracy_activated or self.nb_polls
+                                                or self.incremental_activated):
+            raise ValueError("Liquid democracy, polls and incremental mode are not available for a mapped profile")
+        if not self.electors_loaded:
+            if imported:
+                # Importation paresseuse: les résultats importés suffisent, les électeurs ne sont pas chargés
+                self._lazy_started = True
+                self._average_is_mean = True
+                self._calc_proportion_satisfaction()
+                if chosen_voting_rules:
+                    self._init_results_keys(chosen_voting_rules)
+                self.calc_results(imported)
+                return
+            # Un nouveau calcul: les électeurs sont chargés, la division de leur position moyenne est faite ci-dessous
+            started, self._lazy_started = self._lazy_started, False
+            success, msg = self.load_electors()
+            if not success:
+                self._lazy_started = started
+                raise ValueError(msg)
         self._define_ranking()
         self.set_avg_electors_position()
         self._calc_proportion_satisfaction()
@@ -425,32 +903,41 @@ class Election(metaclass=Singleton):
         self.calc_results(imported)
 
     def _make_delegations(self) -> None:
-        """Pour une démocratie liquide. Pour chaque électeur décide s'il fera une délégation de son vote.
-        Si oui, MAJ des données de son délégataire et de lui-même."""
-
-        for elector in self.electors:
+        """Pour une démocratie liquide. Pour chaque électeur décide s'il fera une délégation de son vote, et à qui.
+        Puis les délégations sont résolues de façon transitive (cf. `electoral_systems.extensions.liquid_democracy`)
+        et les poids de tous les électeurs sont MAJ."""
+
+        # Index des positions construit une seule fois: une recherche des délégataires ne parcourt que les voisins
+        index = SpatialIndex(self.profile.positions, DELEGATION_GAP_COEF)
+        delegees = np.full(len(self.electors), -1, dtype=np.intp)
+        for row, elector in enumerate(self.electors):
             proba = 1 - elector.knowledge
             # Pas de délégation
             if random() > proba:
                 continue
             # Faire une délégation
-            possible_delegees = choose_possible_delegees(
-                self.electors, elector
-            )
-            delegee = choose_delegee(possible_delegees)
-            if delegee is None:
-                continue
-            delegee.weight += elector.weight
-            elector.weight = 0
+            possible_delegees = possible_delegees_rows(index, row)
+            delegee = choose_delegee_row(possible_delegees, self.profile.knowledge)
+            if delegee is not None:
+                delegees[row] = delegee
+
+        weights = np.fromiter((elector.weight for elector in self.electors), dtype=np.int64, count=len(self.electors))
+        weights = delegation_weights(delegees, self.profile.knowledge, weights)
+        for elector, weight in zip(self.electors, weights.tolist()):
+            elector.weight = weight
+        self.profile.set_weights(weights)
 
     def conduct_poll(self) -> None:
         """Fait un nouveau sondage. Tout d'abord les candidats changent leurs positions. 
         Les électeurs redéfinissent leur classement de candidats. Puis les électeurs changent leur classement. 
-        Cf. `electoral_systems.extensions.polls` pour les détails."""
+        Cf. `electoral_systems.extensions.polls` pour les détails.
+        Si les décomptes courants existent (`tallies`) et qu'aucun candidat n'a quitté l'élection, seuls les changements
+        sont pris en compte (cf. `Election._update_poll_rankings()`). Sinon, tous les résultats sont recalculés."""
 
         voting_rule = self.poll_voting_rule
         winner = self.choose_winner(voting_rule)
         ranking = self.results[voting_rule]
+        previous_positions = [candidate.position for candidate in self.candidates]
 
         # Des candidats changent leurs positions politiques
         change_position_candidates(
@@ -462,26 +949,64 @@ class Election(metaclass=Singleton):
         )
 
         # Des électeurs changent leur classement
-        self._define_ranking()
+        delta = self.tallies is not None and len(self.candidates) == len(previous_positions)
+        if delta:
+            moved = [i for i, (candidate, position) in enumerate(zip(self.candidates, previous_positions))
+                     if candidate.position != position]
+            sorted_rows, sorted_ranks = self.profile.update_candidates(moved)
+        else:
+            self._define_ranking()
 
         # Des électeurs s'adaptent en changeant leur classement intelligemment
         score_winner = winner.scores[voting_rule]
-        change_ranking_electors(
-            self.electors,
+        changed_rows, changed_ranks = change_ranking_electors(
+            self.profile,
             score_winner,
             voting_rule,
             VotingRulesConstants.APPROVAL_GAP_COEF,
         )
         # Recalcule des résultats
-        self.calc_results()
+        if delta:
+            self._update_poll_rankings(np.concatenate((sorted_rows, changed_rows)),
+                                       np.concatenate((sorted_ranks, changed_ranks)))
+        else:
+            self.calc_results()
+
+    def _update_poll_rankings(self, rows: np.ndarray, old_ranks: np.ndarray) -> None:
+        """MAJ des décomptes courants et des résultats après un sondage: seule la contribution des électeurs dont le
+        classement a changé est remplacée.
+
+        Args:
+            rows (numpy.ndarray): Les indices de ligne des électeurs dont le classement a changé, éventuellement répétés
+                (dans l'ordre des changements).
+            old_ranks (numpy.ndarray): Les classements de ces électeurs avant le changement, une matrice (len(rows)×C).
+        """
+
+        # Pour un électeur dont le classement a changé plusieurs fois, le classement avant le sondage est le premier
+        rows, first = np.unique(rows, return_index=True)
+        self.tallies.replace_rows(self.profile, rows, old_ranks[first],
+                                  approval=VotingRulesConstants.APPROVAL in self.results)
+        self._refresh_results()
 
     def delete_all_data(self) -> None:
         """Supprime toutes les données d'une élection. Relance les itérateurs-générateurs des noms, prénoms, IDs.
         Réinitialise le dictionnaire des données des divisions de la carte politique."""
 
+        self.electors_loader = None
+        self.electors_load_error = None
         self.electors.clear()
         self.candidates.clear()
         self.results.clear()
+        self.duels_scores = dict()
+
+        self.average_position_electors = (0, 0)
+        self._average_is_mean = False
+        self.proportion_satisfaction = 0
+        self.profile = Profile([], [])
+        self.mapped_profile = None
+        self.imported_ranks = None
+        self.tallies = None
+        self._electors_rows = dict()
 
         self.first_name_iter.restart()
         self.last_name_iter.restart()
@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Dict, Union, Set, Callable
 
 from .voting_rules import *
@@ -59,6 +60,23 @@ class VotingRulesConstants:
     CONDORCET: Set[str] = {CONDORCET_SIMPLE, CONDORCET_COPELAND, CONDORCET_SIMPSON}
     """Un ensemble des constantes des règles de vote Condorcet-cohérentes."""
 
+    @classmethod
+    def register_positional_rule(cls, voting_rule: str, ui_name: str, vector: scoring.score_vector_type) -> None:
+        """Ajoute une nouvelle règle de vote positionnelle à un tour, définie par son vecteur des scores.
+        Cf. le module `electoral_systems.voting_rules.scoring`.
+
+        Args:
+            voting_rule (str): Une nouvelle constante associée à la règle de vote.
+            ui_name (str): Le nom de la règle de vote pour UI.
+            vector (electoral_systems.voting_rules.scoring.score_vector_type): Une fonction qui retourne le vecteur
+                des scores étant donné le nombre des candidats.
+        """
+
+        scoring.register_score_vector(voting_rule, vector)
+        cls.VOTING_RULES_FUNC[voting_rule] = partial(scoring.apply_positional, voting_rule=voting_rule)
+        cls.UI[voting_rule] = ui_name
+        cls.ONE_ROUND.add(voting_rule)
+
 class RandomConstants:
     """Une classe qui regroupe les constantes utilisées lors de la génération des données."""
 
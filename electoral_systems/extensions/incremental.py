@@ -0,0 +1,152 @@
+"""Un module qui fournit les décomptes courants d'une élection pour le mode incrémental. Les décomptes
+(la matrice des positions, la matrice de majorité et les scores d'approbation) suffisent pour recalculer les résultats
+des règles de vote positionnelles, de l'approbation et des règles Condorcet-cohérentes. Ajouter ou supprimer un électeur
+ne modifie que sa contribution, en O(C²), au lieu de tout recalculer en O(E·C²)."""
+
+from typing import Optional
+
+import numpy as np
+
+from ..voting_rules.approval import approval_scores, within_radius
+from ..voting_rules.constants import APPROVAL
+from ..voting_rules.duels import majority_matrix
+from ..voting_rules.profile import Profile
+from ..voting_rules.scoring import SCORE_VECTORS, position_counts
+
+
+class RunningTallies:
+    """Les décomptes courants d'un profil de préférences. Les candidats sont identifiés par leur indice
+    dans `profile.candidates`."""
+
+    def __init__(self, profile: Profile, approval_gap: float):
+        """Calcule les décomptes de tous les électeurs du profil.
+
+        Args:
+            profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks`
+                est remplie.
+            approval_gap (float): L'écart d'approbation utilisé pour la règle de vote *Approbation*.
+        """
+
+        self.approval_gap: float = approval_gap
+        """L'écart d'approbation."""
+
+        self.position_counts: np.ndarray = position_counts(profile)
+        """La matrice des positions (C×C), cf. `electoral_systems.voting_rules.scoring.position_counts`."""
+
+        self.majority: np.ndarray = majority_matrix(profile)
+        """La matrice de majorité (C×C), cf. `electoral_systems.voting_rules.duels.majority_matrix`."""
+
+        self.approval: Optional[np.ndarray] = approval_scores(profile, approval_gap)
+        """Les scores d'approbation (C,). `None` s'ils ne sont plus à jour (cf. `RunningTallies.replace_rows()`)."""
+
+        # Les paires de positions (i, j), i < j: l'électeur préfère le candidat à la position i à celui à la position j
+        self._pairs = np.triu_indices(profile.nb_candidates, k=1)
+
+    def _update(self, profile: Profile, row: int, sign: int) -> None:
+        """Ajoute (`sign` = 1) ou retire (`sign` = -1) la contribution d'un électeur du profil."""
+
+        ranking = profile.ranks[row].astype(np.intp)
+        weight = sign * int(profile.weights[row])
+        if not weight:
+            return
+
+        self.position_counts[np.arange(ranking.size), ranking] += weight
+        self.majority[ranking[self._pairs[0]], ranking[self._pairs[1]]] += weight
+
+        if self.approval is None:
+            return
+        distances = profile.get_distances()[row, ranking]
+        approved = within_radius(distances, distances[0] + self.approval_gap)
+        self.approval[ranking[approved]] += weight
+
+    def add(self, profile: Profile, row: int) -> None:
+        """Ajoute la contribution d'un électeur du profil (par exemple, un électeur qui vient d'être ajouté).
+
+        Args:
+            profile (electoral_systems.voting_rules.profile.Profile): Le profil de préférences.
+            row (int): L'indice de ligne de l'électeur.
+        """
+
+        self._update(profile, row, 1)
+
+    def remove(self, profile: Profile, row: int) -> None:
+        """Retire la contribution d'un électeur du profil. Doit être appelée avant de le supprimer du profil.
+
+        Args:
+            profile (electoral_systems.voting_rules.profile.Profile): Le profil de préférences.
+            row (int): L'indice de ligne de l'électeur.
+        """
+
+        self._update(profile, row, -1)
+
+    def add_rows(self, profile: Profile, rows: np.ndarray) -> None:
+        """Ajoute la contribution de plusieurs électeurs du profil (par exemple, des électeurs ajoutés en une seule fois),
+        avec une opération vectorisée par décompte.
+
+        Args:
+            profile (electoral_systems.voting_rules.profile.Profile): Le profil de préférences.
+            rows (numpy.ndarray): Les indices de ligne des électeurs.
+        """
+
+        if not len(rows):
+            return
+        added = self._rows_profile(profile, rows, profile.ranks[rows])
+        self.position_counts += position_counts(added)
+        self.majority += majority_matrix(added)
+        if self.approval is not None:
+            self.approval += approval_scores(added, self.approval_gap)
+
+    def replace_rows(self, profile: Profile, rows: np.ndarray, old_ranks: np.ndarray, approval: bool = True) -> None:
+        """Remplace la contribution de certains électeurs dont le classement a changé. Seuls ces électeurs sont parcourus
+        pour la matrice des positions et la matrice de majorité. Les scores d'approbation sont recalculés
+        (une seule opération vectorisée), car les distances aux candidats qui ont bougé changent pour tous les électeurs.
+
+        Args:
+            profile (electoral_systems.voting_rules.profile.Profile): Le profil de préférences déjà mis à jour.
+            rows (numpy.ndarray): Les indices de ligne des électeurs dont le classement a changé.
+            old_ranks (numpy.ndarray): Les anciens classements de ces électeurs, une matrice (len(rows)×C).
+            approval (bool): Si `False`, les scores d'approbation ne sont pas recalculés et ne sont plus disponibles
+                (par exemple, si l'approbation n'est pas une règle de vote choisie). Default = `True`.
+        """
+
+        if len(rows):
+            old = self._rows_profile(profile, rows, old_ranks)
+            new = self._rows_profile(profile, rows, profile.ranks[rows])
+            self.position_counts += position_counts(new) - position_counts(old)
+            self.majority += majority_matrix(new) - majority_matrix(old)
+        self.approval = approval_scores(profile, self.approval_gap) if approval else None
+
+    @staticmethod
+    def _rows_profile(profile: Profile, rows: np.ndarray, ranks: np.ndarray) -> Profile:
+        """Retourne un profil restreint à certaines lignes du profil, avec les classements donnés."""
+
+        rows_profile = Profile(profile.candidates, profile.positions[rows], profile.weights[rows], ranks=ranks)
+        rows_profile.distances = profile.get_distances()[rows]
+        return rows_profile
+
+    def supports(self, voting_rule: str) -> bool:
+        """Vérifie si les scores d'une règle de vote peuvent être obtenus à partir des décomptes avec `scores()`.
+
+        Args:
+            voting_rule (str): Une constante associée à une règle de vote.
+
+        Returns:
+            bool: `True` pour les règles de vote positionnelles et l'approbation (si ses scores sont à jour).
+        """
+
+        return voting_rule in SCORE_VECTORS or (voting_rule == APPROVAL and self.approval is not None)
+
+    def scores(self, voting_rule: str) -> np.ndarray:
+        """Retourne les scores des candidats selon une règle de vote positionnelle ou l'approbation, en O(C²).
+
+        Args:
+            voting_rule (str): Une constante associée à une règle de vote (cf. `RunningTallies.supports()`).
+
+        Returns:
+            numpy.ndarray: Un tableau (C,) des scores.
+        """
+
+        if voting_rule == APPROVAL:
+            return self.approval.copy()
+        nb_candidates = self.position_counts.shape[0]
+        return np.asarray(SCORE_VECTORS[voting_rule](nb_candidates)) @ self.position_counts
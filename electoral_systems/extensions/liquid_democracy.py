@@ -1,10 +1,18 @@
-"""Un module qui fournit la fonctionnalité nécessaire pour la démocratie liquide, i.e. faire les délégations."""
+"""Un module qui fournit la fonctionnalité nécessaire pour la démocratie liquide, i.e. faire les délégations.
+
+Les délégations sont transitives: tous les choix de délégataires sont d'abord enregistrés (un délégataire par électeur
+au plus), puis résolus en une seule passe (`resolve_delegations()`). Le vote de chaque électeur est porté par son
+représentant final, i.e. le premier électeur de la chaîne des délégations qui ne délègue pas. Le résultat ne dépend pas
+de l'ordre des électeurs."""
 
 from math import sqrt
-from random import choices
-from typing import List
+from random import choices, random
+from typing import List, Optional
+
+import numpy as np
 
 from people import Elector
+from ..utls.spatial_index import SpatialIndex
 
 
 DELEGATION_GAP_COEF = 0.1
@@ -68,3 +76,122 @@ def choose_possible_delegees(electors: List[Elector], delegator: Elector) -> Lis
             electors_in_radius.append(elector)
 
     return electors_in_radius
+
+
+def possible_delegees_rows(index: SpatialIndex, delegator_row: int, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Version vectorisée de `choose_possible_delegees()`: seuls les électeurs proches du délégant sont parcourus
+    grâce à un index spatial, construit une seule fois pour toutes les délégations.
+
+    Args:
+        index (electoral_systems.utls.spatial_index.SpatialIndex): Un index spatial des positions des électeurs.
+        delegator_row (int): L'indice (dans l'index) de l'électeur qui veut déléguer.
+        weights (Optional[numpy.ndarray]): Les poids courants des électeurs, un tableau (E,). Si donné, les électeurs
+            de poids nul sont exclus. Default = `None`.
+
+    Returns:
+        numpy.ndarray: Les indices croissants des électeurs qui peuvent être considérés comme des délégataires.
+    """
+
+    rows = index.query(index.positions[delegator_row], DELEGATION_GAP_COEF)
+    keep = rows != delegator_row
+    if weights is not None:
+        keep &= weights[rows] != 0
+    return rows[keep]
+
+
+def choose_delegee_row(rows: np.ndarray, knowledge: np.ndarray) -> Optional[int]:
+    """Version vectorisée de `choose_delegee()`. Le délégataire est choisi selon la même loi,
+    avec le même tirage pseudo-aléatoire (`random.choices` tire un seul nombre avec `random.random`).
+
+    Args:
+        rows (numpy.ndarray): Les indices des électeurs qui peuvent être les délégataires (cf. `possible_delegees_rows()`).
+        knowledge (numpy.ndarray): Les taux de connaissance de tous les électeurs, un tableau (E,).
+
+    Returns:
+        Optional[int]: L'indice du délégataire choisi, `None` s'il n'y a aucun délégataire possible.
+    """
+
+    if len(rows) == 0:
+        return None
+
+    if len(rows) == 1:
+        return int(rows[0])
+
+    # Sommes cumulées séquentielles, comme dans choose_delegee et random.choices
+    rows_knowledge = knowledge[rows]
+    total_knowledge = np.cumsum(rows_knowledge)[-1]
+    cum_weights = np.cumsum(rows_knowledge / total_knowledge)
+    chosen = np.searchsorted(cum_weights[:-1], random() * cum_weights[-1], side="right")
+    return int(rows[chosen])
+
+
+def resolve_delegations(delegees: np.ndarray, knowledge: np.ndarray) -> np.ndarray:
+    """Résout les délégations transitives: pour chaque électeur, retourne son représentant final.
+    Les chaînes sont parcourues par sauts doublés (chaque étape double la longueur des chemins parcourus),
+    en O(E log E) opérations vectorisées.
+
+    Les délégations peuvent former des cycles (A délègue à B, B délègue à A). Dans chaque cycle, l'électeur
+    dont le taux de connaissance est le plus élevé (le plus petit indice en cas d'égalité) ne délègue pas: il représente
+    tous les électeurs du cycle et ceux qui leur délèguent.
+
+    Args:
+        delegees (numpy.ndarray): Pour chaque électeur, l'indice de son délégataire, ou -1 s'il ne délègue pas.
+            Un tableau (E,).
+        knowledge (numpy.ndarray): Les taux de connaissance des électeurs, un tableau (E,).
+
+    Returns:
+        numpy.ndarray: Pour chaque électeur, l'indice de son représentant final (lui-même s'il ne délègue pas).
+    """
+
+    nb_electors = len(delegees)
+    rows = np.arange(nb_electors)
+    successors = np.where(delegees < 0, rows, delegees)
+    if not nb_electors:
+        return successors
+
+    # Priorité de chaque électeur pour casser les cycles (0 = le plus prioritaire)
+    order = np.lexsort((rows, -np.asarray(knowledge, dtype=np.float64)))
+    priority = np.empty(nb_electors, dtype=np.intp)
+    priority[order] = rows
+
+    # Après k étapes, targets[i] est l'électeur atteint après 2**k délégations depuis i, et best[i] l'électeur
+    # le plus prioritaire rencontré entre-temps
+    nb_steps = max(1, int(np.ceil(np.log2(nb_electors))) + 1)
+    targets, best = successors.copy(), rows.copy()
+    for _ in range(nb_steps):
+        best_next = best[targets]
+        best = np.where(priority[best_next] < priority[best], best_next, best)
+        targets = targets[targets]
+
+    # Un électeur qui n'aboutit pas à un représentant aboutit dans un cycle, dont best donne l'électeur le plus prioritaire
+    in_cycle = successors[targets] != targets
+    if in_cycle.any():
+        breakers = np.unique(best[targets[in_cycle]])
+        successors[breakers] = breakers
+        targets = successors.copy()
+        for _ in range(nb_steps):
+            targets = targets[targets]
+    return targets
+
+
+def delegation_weights(delegees: np.ndarray, knowledge: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Calcule les poids des électeurs après les délégations transitives (cf. `resolve_delegations()`).
+    Le poids de chaque électeur est transmis à son représentant final.
+
+    Args:
+        delegees (numpy.ndarray): Pour chaque électeur, l'indice de son délégataire, ou -1 s'il ne délègue pas.
+        knowledge (numpy.ndarray): Les taux de connaissance des électeurs, un tableau (E,).
+        weights (Optional[numpy.ndarray]): Les poids des électeurs avant les délégations. Default = `None`, tous égaux à 1.
+
+    Returns:
+        numpy.ndarray: Les nouveaux poids (int64), un tableau (E,). Le poids d'un électeur qui a délégué est 0.
+    """
+
+    representatives = resolve_delegations(delegees, knowledge)
+    if weights is None:
+        return np.bincount(representatives, minlength=len(delegees)).astype(np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    # bincount avec des poids travaille en float64: les poids sont additionnés exactement avec np.add.at
+    new_weights = np.zeros(len(delegees), dtype=np.int64)
+    np.add.at(new_weights, representatives, weights)
+    return new_weights
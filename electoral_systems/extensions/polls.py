@@ -7,18 +7,21 @@ Il est possible d'effectuer les sondages pour les règles de vote à un tour:
 """
 
 from math import sqrt
-from numpy import std
+import numpy as np
+from numpy import roll
 from random import random
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Optional
 
 from people import Elector, Candidate
+from ..voting_rules.approval import ranked_distances, within_radius
+from ..voting_rules.profile import Profile
 
 # Pour une génération des docs uniquement
 __pdoc__ = {
     '_get_default_direction_data' : True,
 }
 
-direction_data_type = Dict[str, Union[int, List[Elector], float, tuple[float, float]]]
+direction_data_type = Dict[str, Union[int, 'DirectionStats', float, tuple[float, float]]]
 "Un type des données pour chaque direction (division) de la carte politique."
 
 AVG:str = "AVG"
@@ -27,8 +30,9 @@ AVG:str = "AVG"
 STD_DEV:str = "STD"
 """Un écart-type des positions des électeurs. Valeur associée sera du type `float`."""
 
-ELECTORS:str = "ELECS"
-"""Une liste des électeurs. Valeur associée sera du type `List[people.elector.Elector]`."""
+STATS:str = "STATS"
+"""Les statistiques en ligne des positions des électeurs (pour l'écart-type).
+Valeur associée sera du type `electoral_systems.extensions.polls.DirectionStats`."""
 
 NB_CANDIDATES:str = "NBC"
 """Un nombre des candidats. Valeur associée sera du type `int`."""
@@ -51,6 +55,102 @@ SW = "SW"
 CENTER = "CNT"
 """La direction (division) de la carte politique centre. Le centre est le carré borné entre -0.3 et 0.3."""
 
+ALLIANCE_GAP: float = 0.15
+"""La distance maximale (exclue) entre deux candidats pour qu'ils puissent former une alliance."""
+
+
+class DirectionStats:
+    """Les statistiques en ligne des positions des électeurs d'une direction de la carte politique: le nombre
+    des électeurs, la position moyenne et la somme des carrés des écarts à la moyenne pour chaque axe
+    (algorithme de Welford). Les électeurs ne sont pas stockés. Deux statistiques calculées séparément
+    (par exemple, sur des parties des électeurs) peuvent être fusionnées avec `DirectionStats.merge()`."""
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        """Initialise les statistiques d'une direction vide."""
+
+        self.count: int = 0
+        """Le nombre des électeurs."""
+
+        self.mean: np.ndarray = np.zeros(2)
+        """La position moyenne des électeurs (X, Y)."""
+
+        self.m2: np.ndarray = np.zeros(2)
+        """La somme des carrés des écarts à la moyenne pour chaque axe (X, Y)."""
+
+    def add(self, position: tuple[float, float]) -> None:
+        """Ajoute la position d'un électeur en O(1).
+
+        Args:
+            position (tuple[float, float]): La position d'un électeur.
+        """
+
+        position = np.asarray(position, dtype=np.float64)
+        self.count += 1
+        delta = position - self.mean
+        self.mean = self.mean + delta / self.count
+        self.m2 = self.m2 + delta * (position - self.mean)
+
+    def remove(self, position: tuple[float, float]) -> None:
+        """Retire la position d'un électeur déjà ajoutée, en O(1) (l'opération inverse de `DirectionStats.add()`).
+
+        Args:
+            position (tuple[float, float]): La position d'un électeur.
+        """
+
+        if self.count <= 1:
+            self.__init__()
+            return
+        position = np.asarray(position, dtype=np.float64)
+        mean = (self.mean * self.count - position) / (self.count - 1)
+        self.m2 = np.maximum(self.m2 - (position - mean) * (position - self.mean), 0)
+        self.mean = mean
+        self.count -= 1
+
+    def add_positions(self, positions: np.ndarray) -> None:
+        """Ajoute les positions de plusieurs électeurs avec des opérations vectorisées.
+
+        Args:
+            positions (numpy.ndarray): Les positions des électeurs, un tableau (N×2).
+        """
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        if not len(positions):
+            return
+        other = DirectionStats()
+        other.count = len(positions)
+        other.mean = positions.mean(axis=0)
+        other.m2 = ((positions - other.mean) ** 2).sum(axis=0)
+        self.merge(other)
+
+    def merge(self, other: 'DirectionStats') -> None:
+        """Ajoute les statistiques calculées sur d'autres électeurs (formule de Chan et al.).
+
+        Args:
+            other (electoral_systems.extensions.polls.DirectionStats): Les statistiques à ajouter.
+        """
+
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.count / count
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+
+    def std(self) -> tuple[float, float]:
+        """Retourne l'écart-type (de la population) des positions pour chaque axe.
+
+        Returns:
+            tuple[float, float]: Les écarts-types selon X et Y. (0, 0) s'il n'y a aucun électeur.
+        """
+
+        if not self.count:
+            return (0.0, 0.0)
+        std_x, std_y = np.sqrt(self.m2 / self.count)
+        return (float(std_x), float(std_y))
+
 
 def calc_distance(point1: tuple[float, float], point2: tuple[float, float]) -> float:
     """Calcule la distance euclidienne entre 2 points.
@@ -67,15 +167,20 @@ def calc_distance(point1: tuple[float, float], point2: tuple[float, float]) -> f
     return sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
 
 
-def add_elector_data(directions_data: Dict[str, direction_data_type], new_elector: Elector) -> None:
-    """MAJ des données (`AVG`, `NB_ELECTORS`, `ELECTORS`) d'une case d'un dictionnaire `directions_data` selon la position d'un électeur. 
+def add_elector_data(directions_data: Dict[str, direction_data_type], new_elector: Elector,
+                     total_nb_electors: Optional[int] = None) -> None:
+    """MAJ des données (`AVG`, `NB_ELECTORS`, `STATS`) d'une case d'un dictionnaire `directions_data` selon la position d'un électeur. 
     La valeur correspondante à `AVG` est remplie juste avec la somme. Un appel à la fonction `set_avg_electors_positions`
     est nécessaire pour la division.
+    Si l'élection a déjà commencé (`total_nb_electors` est donné), seules les statistiques `STATS` sont MAJ,
+    puis les autres données en sont dérivées (cf. `derive_directions_data()`).
 
     Args:
         directions_data (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Un dictionnaire qui stocke
             les données pour chaque division de la carte politique.
         new_elector (people.elector.Elector): Un nouvel électeur dans une élection.
+        total_nb_electors (Optional[int]): Le nombre des électeurs après l'ajout, si l'élection a déjà commencé.
+            Default = `None`.
     """
 
     x, y = new_elector.position
@@ -84,13 +189,20 @@ def add_elector_data(directions_data: Dict[str, direction_data_type], new_electo
         in_center(new_elector.position),
         choose_direction(new_elector.position),
     }
+    if total_nb_electors is not None:
+        for direction in directions:
+            if direction:
+                directions_data[direction][STATS].add(new_elector.position)
+        derive_directions_data(directions_data, total_nb_electors)
+        return
+
     for direction in directions:
         if direction:
             x_avg, y_avg = directions_data[direction][AVG]
             x_avg, y_avg = x_avg + x, y_avg + y
 
             directions_data[direction][AVG] = (x_avg, y_avg)
-            directions_data[direction][ELECTORS].append(new_elector)
+            directions_data[direction][STATS].add(new_elector.position)
             directions_data[direction][NB_ELECTORS] += 1
 
 
@@ -112,6 +224,131 @@ def add_candidate_data(directions_data: Dict[str, direction_data_type], new_cand
             directions_data[direction][NB_CANDIDATES] += 1
 
 
+def directions_masks(positions: np.ndarray) -> Dict[str, np.ndarray]:
+    """Version vectorisée de `in_center()` et `choose_direction()`: pour chaque direction de la carte politique,
+    retourne un masque des positions qui lui appartiennent. Une position au centre appartient aussi à l'une
+    des quatre autres directions.
+
+    Args:
+        positions (numpy.ndarray): Un tableau (N×2) des positions dont chaque coordonnée est bornée entre -1 et 1.
+
+    Returns:
+        Dict[str, numpy.ndarray]: Un dictionnaire qui à chaque direction associe un tableau (N,) des booléens.
+    """
+
+    x, y = positions[:, 0], positions[:, 1]
+    return {
+        CENTER: (np.abs(x) < 0.3) & (np.abs(y) < 0.3),
+        NE: (x > 0) & (y > 0),
+        SE: (x > 0) & (y < 0),
+        NW: (x < 0) & (y > 0),
+        SW: (x < 0) & (y < 0),
+    }
+
+
+def sequential_sum(start: float, values: np.ndarray) -> float:
+    """Retourne `start` + la somme des valeurs, additionnées dans l'ordre. Contrairement à `numpy.sum`
+    (sommation par paires), le résultat est identique à celui d'une suite d'ajouts un par un.
+
+    Args:
+        start (float): La valeur initiale.
+        values (numpy.ndarray): Les valeurs à ajouter, un tableau (N,).
+
+    Returns:
+        float: La somme.
+    """
+
+    if not len(values):
+        return start
+    return float(np.cumsum(np.concatenate(([start], values)))[-1])
+
+
+def add_electors_data(directions_data: Dict[str, direction_data_type], positions: np.ndarray) -> None:
+    """Version vectorisée de `add_elector_data()` pour plusieurs électeurs ajoutés en une seule fois.
+    Les sommes et les nombres des électeurs sont identiques à ceux d'une suite d'appels à `add_elector_data()`.
+
+    Args:
+        directions_data (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Un dictionnaire qui stocke
+            les données pour chaque division de la carte politique.
+        positions (numpy.ndarray): Les positions des nouveaux électeurs, un tableau (N×2).
+    """
+
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    for direction, mask in directions_masks(positions).items():
+        rows = np.flatnonzero(mask)
+        if not rows.size:
+            continue
+        data = directions_data[direction]
+        x_avg, y_avg = data[AVG]
+        data[AVG] = (sequential_sum(x_avg, positions[rows, 0]), sequential_sum(y_avg, positions[rows, 1]))
+        data[STATS].add_positions(positions[rows])
+        data[NB_ELECTORS] += rows.size
+
+
+def add_candidates_data(directions_data: Dict[str, direction_data_type], positions: np.ndarray) -> None:
+    """Version vectorisée de `add_candidate_data()` pour plusieurs candidats ajoutés en une seule fois.
+
+    Args:
+        directions_data (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Un dictionnaire qui stocke
+            les données pour chaque division de la carte politique.
+        positions (numpy.ndarray): Les positions des nouveaux candidats, un tableau (N×2).
+    """
+
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    for direction, mask in directions_masks(positions).items():
+        directions_data[direction][NB_CANDIDATES] += int(np.count_nonzero(mask))
+
+
+def remove_elector_data(directions_data: Dict[str, direction_data_type], elector: Elector,
+                        total_nb_electors: Optional[int] = None) -> None:
+    """MAJ des données d'une case d'un dictionnaire `directions_data` après la suppression d'un électeur
+    (l'opération inverse de `add_elector_data()`).
+
+    Args:
+        directions_data (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Un dictionnaire qui stocke
+            les données pour chaque division de la carte politique.
+        elector (people.elector.Elector): Un électeur supprimé d'une élection.
+        total_nb_electors (Optional[int]): Le nombre des électeurs après la suppression, si l'élection a déjà commencé.
+            Default = `None`.
+    """
+
+    x, y = elector.position
+    directions = {in_center(elector.position), choose_direction(elector.position)}
+    if total_nb_electors is not None:
+        for direction in directions:
+            if direction:
+                directions_data[direction][STATS].remove(elector.position)
+        derive_directions_data(directions_data, total_nb_electors)
+        return
+
+    for direction in directions:
+        if direction:
+            x_avg, y_avg = directions_data[direction][AVG]
+            directions_data[direction][AVG] = (x_avg - x, y_avg - y)
+            directions_data[direction][STATS].remove(elector.position)
+            directions_data[direction][NB_ELECTORS] -= 1
+
+
+def merge_directions_data(directions_data: Dict[str, direction_data_type],
+                          other: Dict[str, direction_data_type]) -> None:
+    """Ajoute à `directions_data` les données calculées séparément sur d'autres électeurs et candidats
+    (par exemple, lors d'un ajout en parallèle). Les deux dictionnaires doivent être dans l'état d'ajout,
+    i.e. avant l'appel à `set_avg_electors_positions()`.
+
+    Args:
+        directions_data (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Le dictionnaire à MAJ.
+        other (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Les données à ajouter.
+    """
+
+    for direction, data in other.items():
+        target = directions_data[direction]
+        (x_sum, y_sum), (x_other, y_other) = target[AVG], data[AVG]
+        target[AVG] = (x_sum + x_other, y_sum + y_other)
+        target[NB_ELECTORS] += data[NB_ELECTORS]
+        target[NB_CANDIDATES] += data[NB_CANDIDATES]
+        target[STATS].merge(data[STATS])
+
+
 def get_default_directions_data() -> Dict[str, direction_data_type]:
     """Retourne un dictionnaire dont chaque clé correpond à la division de la carte politique et 
     chaque valeur est un dictionnaire avec les données remises par défaut.
@@ -129,12 +366,12 @@ def get_default_directions_data() -> Dict[str, direction_data_type]:
 
 def _get_default_direction_data() -> direction_data_type:
     """Retourne un dictionnaire dont les clés correpondent aux constantes
-    `AVG`, `STD_DEV`, `NB_ELECTORS`, `ELECTORS`, `NB_CANDIDATES` et les valeurs
+    `AVG`, `STD_DEV`, `NB_ELECTORS`, `STATS`, `NB_CANDIDATES` et les valeurs
     sont remises aux valeurs par défaut:  
         - `AVG` -> (0, 0)  
         - `STD_DEV` -> 0  
         - `NB_ELECTORS` -> 0  
-        - `ELECTORS` -> []  
+        - `STATS` -> des statistiques vides  
         - `NB_CANDIDATES` -> 0  
 
     Returns:
@@ -145,7 +382,7 @@ def _get_default_direction_data() -> direction_data_type:
         AVG: (0, 0),
         STD_DEV: 0,
         NB_ELECTORS: 0,
-        ELECTORS: [],  # Pour écart-type
+        STATS: DirectionStats(),  # Pour écart-type
         NB_CANDIDATES: 0,
     }
 
@@ -207,8 +444,9 @@ def set_avg_electors_positions(directions_data: Dict[str, direction_data_type])
 def set_std_deviation(directions_data: Dict[str, direction_data_type], total_nb_electors: int) -> None:
     """Calcule l'écart-type des positions des électeurs pour chaque direction de la carte politique. 
     Remet à l'échelle le nombre des électeurs par rapport aux autres paramètres en divisant le nombre des 
-    électeurs dans chaque directions par `total_nb_electors`. Supprime les données stockées dans une liste 
-    des électeurs pour chaque direction. La fonction doit être appelée après la fonction `set_avg_electors_positions`.
+    électeurs dans chaque directions par `total_nb_electors`. L'écart-type est obtenu à partir des statistiques
+    en ligne (`STATS`), qui sont gardées pour les MAJ après le début de l'élection (cf. `derive_directions_data()`).
+    La fonction doit être appelée après la fonction `set_avg_electors_positions`.
 
     Args:
         directions_data (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Un dictionnaire qui stocke les données
@@ -217,21 +455,38 @@ def set_std_deviation(directions_data: Dict[str, direction_data_type], total_nb_
     """
 
     for direction in directions_data:
-        direct_electors = directions_data[direction][ELECTORS]
+        stats = directions_data[direction][STATS]
 
-        if len(direct_electors) == 0:
+        if stats.count == 0:
             continue
 
-        direct_x = [elector.position[0] for elector in direct_electors]
-        direct_y = [elector.position[1] for elector in direct_electors]
-
+        std_x, std_y = stats.std()
         # Prendre la valeur moyenne entre les axes
-        directions_data[direction][STD_DEV] = (
-            std(direct_x) + std(direct_y)
-        ) / 2
+        directions_data[direction][STD_DEV] = (std_x + std_y) / 2
         # To make it equal to other parameters
         directions_data[direction][NB_ELECTORS] /= total_nb_electors
-        directions_data[direction][ELECTORS].clear()
+
+
+def derive_directions_data(directions_data: Dict[str, direction_data_type], total_nb_electors: int) -> None:
+    """Recalcule la position moyenne, l'écart-type et la proportion des électeurs de chaque direction à partir
+    des statistiques en ligne (`STATS`). Utilisée après l'ajout ou la suppression d'un électeur une fois que
+    l'élection a commencé, i.e. après `set_avg_electors_positions()` et `set_std_deviation()`.
+
+    Args:
+        directions_data (Dict[str, electoral_systems.extensions.polls.direction_data_type]): Un dictionnaire qui stocke les données
+            pour chaque division de la carte politique.
+        total_nb_electors (int): Le nombre d'électeurs qui participent dans une élection.
+    """
+
+    for data in directions_data.values():
+        stats = data[STATS]
+        if not stats.count:
+            data[AVG], data[STD_DEV], data[NB_ELECTORS] = (0, 0), 0, 0
+            continue
+        std_x, std_y = stats.std()
+        data[AVG] = (float(stats.mean[0]), float(stats.mean[1]))
+        data[STD_DEV] = (std_x + std_y) / 2
+        data[NB_ELECTORS] = stats.count / total_nb_electors
 
 
 def get_avg_directions_positions(directions_data: Dict[str, direction_data_type], chosen_directions: List[str]) -> List[tuple[float, float]]:
@@ -370,9 +625,9 @@ def alliance_formed(candidate: Candidate, possible_allies: List[Candidate]) -> b
         bool: `True` si le candidat a fait une alliance. Sinon, `False`.
     """
 
+    # Au plus C candidats, qui bougent pendant un sondage: une recherche linéaire suffit
     for ally in possible_allies:
-        dist = calc_distance(candidate.position, ally.position)
-        if dist < 0.15:
+        if calc_distance(candidate.position, ally.position) < ALLIANCE_GAP:
             return True
     return False
 
@@ -415,7 +670,8 @@ def change_position_candidates(candidates: List[Candidate], winner: Candidate,
         move_in_direction(directions_data, candidate, travel_dist)
 
 
-def change_ranking_electors(electors: List[Elector], score_winner: int, voting_rule: str, approval_gap: float) -> None:
+def change_ranking_electors(profile: Profile, score_winner: int, voting_rule: str,
+                            approval_gap: float) -> tuple[np.ndarray, np.ndarray]:
     """Change les positions des électeurs selon les résultats d'une élection.  
     - Plus le taux de connaissance est élevé, plus il est probable qu'un électeur va changer son placement.  
     - Les candidats sont choisis dans une cercle dont le rayon maximale dépend du rayon utilisé dans la règle  
@@ -428,29 +684,39 @@ def change_ranking_electors(electors: List[Elector], score_winner: int, voting_r
             Un électeur arrête de considérer les candidats qui se trouvent en dehors de son cercle ou qui sont 
             placés plus bas que le gagnant actuel.
     Args:
-        electors (List[people.elector.Electors]): Une liste de tous les électeurs participant encore à une élection.
+        profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences des électeurs participant encore
+            à une élection. Les classements (la matrice `ranks`) sont modifiés sur place.
         score_winner (int): Le score du gagnant courant d'une élection.
         voting_rule (str): Une constante correpondante à la règle de vote pour laquelle le sondage est effectué.
         approval_gap (float): Un rayon du cercle utilisée dans la règle de vote par approbation.
-    """
 
-    for elector in electors:
-        if random() < elector.knowledge: #l'electeur ne change pas de vote grâce à son taux de connaissance
-            continue
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Les indices de ligne des électeurs dont le classement a changé
+            et leurs classements avant le changement, une matrice (len(rows)×C).
+    """
 
-        # Réarranger le placement
-        for i, candidate in enumerate(elector.candidates_ranked):
-            circle_limit = (1 - elector.knowledge) * approval_gap
+    candidates = profile.candidates
+    changed_rows, old_ranks = [], []
+    # Les cercles d'acceptance de tous les électeurs, leur rayon dépend du taux de connaissance
+    circle_limits = (1 - profile.knowledge) * approval_gap
+    in_circle = within_radius(ranked_distances(profile), circle_limits, inclusive=True)
+    nb_considered = in_circle.sum(axis=1).tolist()
 
-            if elector.dist_from_one_cand(candidate) > circle_limit: #le candidat est en dehors de son cercle d'acceptance
-                break
+    for row, knowledge in enumerate(profile.knowledge.tolist()):
+        if random() < knowledge: #l'electeur ne change pas de vote grâce à son taux de connaissance
+            continue
 
-            score_ratio = candidate.scores[voting_rule] / score_winner
+        ranking = profile.ranks[row]
+        # Réarranger le placement parmi les candidats dans son cercle d'acceptance
+        for i in range(nb_considered[row]):
+            score_ratio = candidates[ranking[i]].scores[voting_rule] / score_winner
             if random() < score_ratio: #vote pour ce candidat
-                # Nouveau candidat
-                chosen_candidate = candidate
-                # Décaler les candidats vers la droite
-                for j in range(i, 0, -1):
-                    elector.candidates_ranked[j] = elector.candidates_ranked[j - 1]
-                elector.candidates_ranked[0] = chosen_candidate
+                if i:
+                    changed_rows.append(row)
+                    old_ranks.append(ranking.copy())
+                # Décaler les candidats vers la droite, placer le nouveau candidat en premier
+                ranking[:i + 1] = roll(ranking[:i + 1], 1)
                 break
+
+    old_ranks = np.array(old_ranks, dtype=profile.ranks.dtype).reshape(-1, profile.nb_candidates)
+    return np.array(changed_rows, dtype=np.intp), old_ranks
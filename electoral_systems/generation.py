@@ -0,0 +1,165 @@
+"""Un module qui fournit la génération aléatoire des positions sur la carte politique selon les réglages
+`electoral_systems.election_constants.RandomConstants`. Le module ne dépend pas de l'interface graphique:
+il est utilisé à la fois par la carte politique (`graphics`) et par les simulations sans interface
+(`electoral_systems.simulate`).
+
+Les fonctions `generate_electors()` et `generate_candidates()` génèrent toute une population en une seule fois:
+toutes les positions et tous les paramètres (taux de connaissance, dogmatisme, opposition) sont tirés sous forme
+de tableaux, selon les mêmes lois (normales tronquées) que la génération d'une seule personne."""
+
+from typing import Dict, Union
+
+import numpy as np
+from numpy import clip
+from numpy.random import normal
+
+from .election_constants import RandomConstants
+
+# Pour une génération des docs uniquement
+__pdoc__ = {
+    'normal': False,
+}
+
+generation_constants_type = Dict[str, Union[tuple[float, float], float, int]]
+"""Un type des constantes de la génération des données (cf. `electoral_systems.election.Election.generation_constants`)."""
+
+
+def generate_coordinate(mu: float, sigma: float, limit: float) -> float:
+    """Génère une coordonnée (X ou Y) selon la loi normale de paramètres `mu` et `sigma`.
+    La valeur absolue de la coordonnée générée est bornée par `limit`.
+
+    Args:
+        mu (float): La moyenne de la loi normale.
+        sigma (float): L'écart-type de la loi normale. Un réel strictement positif.
+        limit (float): La borne supérieure et inférieure d'une coordonnée.
+
+    Returns:
+        float: Une coordonnée générée et bornée.
+    """
+
+    coordinate = normal(mu, sigma)
+
+    # Le nombre maximal des tentatives. Sans lui, une boucle infinie est possible.
+    max_iterations = 5
+    while abs(coordinate) > limit and max_iterations:
+        coordinate = normal(mu, sigma)
+        max_iterations -= 1
+
+    coordinate = clip(coordinate, -limit, limit)
+
+    return coordinate
+
+
+def generate_position(generation_constants: generation_constants_type) -> tuple[float, float]:
+    """Génère une position sur la carte politique selon la loi normale. La coordonnée Y dépend de la coordonnée X
+    selon l'orientation (`RandomConstants.ORIENTATION`).
+
+    Args:
+        generation_constants (electoral_systems.generation.generation_constants_type): Les constantes de la génération
+            des données.
+
+    Returns:
+        tuple[float, float]: Une position générée dont chaque coordonnée est bornée entre -1 et 1.
+    """
+
+    economical_constants = generation_constants[RandomConstants.ECONOMICAL]
+    social_constants = generation_constants[RandomConstants.SOCIAL]
+    coef_dir = generation_constants[RandomConstants.ORIENTATION]
+
+    mu, sigma = economical_constants[0], economical_constants[1]
+    x = generate_coordinate(mu, sigma, limit=1)
+
+    mu, sigma = coef_dir * x + social_constants[0], social_constants[1]
+    y = generate_coordinate(mu, sigma, limit=1)
+    return (x, y)
+
+
+def truncated_normal(mu: Union[float, np.ndarray], sigma: float, lower_limit: float, upper_limit: float,
+                     size: int, max_iterations: int = 10) -> np.ndarray:
+    """Génère `size` valeurs selon la loi normale, bornées entre `lower_limit` et `upper_limit`. Comme pour
+    une seule valeur (cf. `generate_coordinate()`), les valeurs hors des bornes sont tirées à nouveau
+    (au plus `max_iterations` fois), puis les valeurs restantes sont ramenées aux bornes. Chaque tirage est vectorisé.
+
+    Args:
+        mu (Union[float, numpy.ndarray]): La moyenne de la loi normale, une pour toutes les valeurs ou un tableau (size,).
+        sigma (float): L'écart-type de la loi normale. Un réel strictement positif.
+        lower_limit (float): La borne inférieure.
+        upper_limit (float): La borne supérieure.
+        size (int): Le nombre des valeurs.
+        max_iterations (int): Le nombre maximal des nouveaux tirages. Default = 10.
+
+    Returns:
+        numpy.ndarray: Un tableau (size,) des valeurs générées et bornées.
+    """
+
+    mu = np.broadcast_to(np.asarray(mu, dtype=np.float64), (size,))
+    values = normal(mu, sigma)
+    for _ in range(max_iterations):
+        outside = np.flatnonzero((values < lower_limit) | (values > upper_limit))
+        if not outside.size:
+            break
+        values[outside] = normal(mu[outside], sigma)
+
+    return clip(values, lower_limit, upper_limit)
+
+
+def generate_positions(generation_constants: generation_constants_type, size: int) -> np.ndarray:
+    """Génère `size` positions sur la carte politique, cf. `generate_position()`. La coordonnée Y de chaque position
+    dépend de sa coordonnée X selon l'orientation (`RandomConstants.ORIENTATION`).
+
+    Args:
+        generation_constants (electoral_systems.generation.generation_constants_type): Les constantes de la génération
+            des données.
+        size (int): Le nombre des positions.
+
+    Returns:
+        numpy.ndarray: Un tableau (size×2) des positions dont chaque coordonnée est bornée entre -1 et 1.
+    """
+
+    economical_constants = generation_constants[RandomConstants.ECONOMICAL]
+    social_constants = generation_constants[RandomConstants.SOCIAL]
+    coef_dir = generation_constants[RandomConstants.ORIENTATION]
+
+    x = truncated_normal(economical_constants[0], economical_constants[1], -1, 1, size, max_iterations=5)
+    y = truncated_normal(coef_dir * x + social_constants[0], social_constants[1], -1, 1, size, max_iterations=5)
+    return np.column_stack((x, y))
+
+
+def generate_electors(generation_constants: generation_constants_type, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Génère les données de `size` électeurs: leurs positions et leurs taux de connaissance.
+
+    Args:
+        generation_constants (electoral_systems.generation.generation_constants_type): Les constantes de la génération
+            des données.
+        size (int): Le nombre des électeurs.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Les positions (size×2) et les taux de connaissance (size,).
+    """
+
+    positions = generate_positions(generation_constants, size)
+    mu, sigma = generation_constants[RandomConstants.KNOWLEDGE]
+    knowledge = truncated_normal(mu, sigma, 0, 1, size)
+    return positions, knowledge
+
+
+def generate_candidates(generation_constants: generation_constants_type,
+                        size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Génère les données de `size` candidats: leurs positions, leurs niveaux de dogmatisme et d'opposition.
+
+    Args:
+        generation_constants (electoral_systems.generation.generation_constants_type): Les constantes de la génération
+            des données.
+        size (int): Le nombre des candidats.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Les positions (size×2), les niveaux de dogmatisme (size,)
+            et d'opposition (size,).
+    """
+
+    positions = generate_positions(generation_constants, size)
+    mu, sigma = generation_constants[RandomConstants.DOGMATISM]
+    dogmatism = truncated_normal(mu, sigma, 0, 1, size)
+    mu, sigma = generation_constants[RandomConstants.OPPOSITION]
+    opposition = truncated_normal(mu, sigma, 0, 1, size)
+    return positions, dogmatism, opposition
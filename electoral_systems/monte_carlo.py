@@ -0,0 +1,252 @@
+"""Un module qui permet de comparer les règles de vote sur un grand nombre d'élections générées aléatoirement
+(méthode de Monte-Carlo). Les élections sont réparties par lots entre plusieurs processus
+(`concurrent.futures.ProcessPoolExecutor`). Chaque lot utilise ses propres flux pseudo-aléatoires, dérivés de la graine
+avec `numpy.random.SeedSequence`: les résultats ne dépendent que de la graine et de la taille des lots,
+pas du nombre des processus.
+
+Chaque processus ne renvoie que des résultats agrégés (`MonteCarloResults`): le nombre des fois que les gagnants
+de deux règles de vote coïncident et le nombre des fois que chaque règle de vote élit le gagnant de Condorcet.
+
+Exemple:
+    `python -m electoral_systems.monte_carlo --runs 10000 --electors 1000 --candidates 5 --rules BRD CC EB --seed 1`
+"""
+
+import argparse
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .election import Election
+from .election_constants import VotingRulesConstants
+from .simulate import configure, election_record, generate_population, generation_constants_type
+from .voting_rules.duels import condorcet_winner
+
+# Pour une génération des docs uniquement
+__pdoc__ = {
+    '_run_batch': True,
+    '_seed_generators': True,
+    '_parse_args': True,
+}
+
+
+class MonteCarloResults:
+    """Les résultats agrégés d'un ensemble d'élections. Deux instances peuvent être fusionnées avec
+    `MonteCarloResults.merge()`."""
+
+    def __init__(self, voting_rules: Iterable[str]):
+        """Initialise les compteurs à 0.
+
+        Args:
+            voting_rules (Iterable[str]): Les constantes des règles de vote comparées.
+        """
+
+        self.voting_rules: List[str] = sorted(set(voting_rules))
+        """Les constantes des règles de vote comparées (triées)."""
+
+        self.nb_runs: int = 0
+        """Le nombre des élections effectuées."""
+
+        self.nb_condorcet_winners: int = 0
+        """Le nombre des élections dans lesquelles un gagnant de Condorcet existe."""
+
+        self.condorcet_hits: Dict[str, int] = {rule: 0 for rule in self.voting_rules}
+        """Pour chaque règle de vote, le nombre des élections où elle a élu le gagnant de Condorcet."""
+
+        self.no_winner: Dict[str, int] = {rule: 0 for rule in self.voting_rules}
+        """Pour chaque règle de vote, le nombre des élections sans gagnant."""
+
+        self.agreements: Dict[tuple[str, str], int] = {pair: 0 for pair in combinations(self.voting_rules, 2)}
+        """Pour chaque paire des règles de vote, le nombre des élections où leurs gagnants coïncident."""
+
+        self.records: List[Dict[str, Any]] = []
+        """Les données de chaque élection (cf. `electoral_systems.simulate.election_record`), remplies uniquement
+        si elles sont demandées (`keep_records`), par exemple pour les enregistrer avec `sqlite.run_store.RunStore`."""
+
+    def add_run(self, winners: Dict[str, Optional[int]], condorcet: Optional[int]) -> None:
+        """Ajoute les résultats d'une élection.
+
+        Args:
+            winners (Dict[str, Optional[int]]): L'ID du gagnant pour chaque règle de vote (`None` s'il n'y a pas de gagnant).
+            condorcet (Optional[int]): L'ID du gagnant de Condorcet, `None` s'il n'existe pas.
+        """
+
+        self.nb_runs += 1
+        if condorcet is not None:
+            self.nb_condorcet_winners += 1
+
+        for rule in self.voting_rules:
+            winner = winners[rule]
+            if winner is None:
+                self.no_winner[rule] += 1
+            elif winner == condorcet:
+                self.condorcet_hits[rule] += 1
+
+        for rule1, rule2 in self.agreements:
+            if winners[rule1] is not None and winners[rule1] == winners[rule2]:
+                self.agreements[(rule1, rule2)] += 1
+
+    def merge(self, other: 'MonteCarloResults') -> None:
+        """Ajoute les compteurs d'autres résultats (obtenus pour les mêmes règles de vote).
+
+        Args:
+            other (electoral_systems.monte_carlo.MonteCarloResults): Les résultats à ajouter.
+        """
+
+        if other.voting_rules != self.voting_rules:
+            raise ValueError("Cannot merge results of different voting rules")
+
+        self.nb_runs += other.nb_runs
+        self.nb_condorcet_winners += other.nb_condorcet_winners
+        for rule in self.voting_rules:
+            self.condorcet_hits[rule] += other.condorcet_hits[rule]
+            self.no_winner[rule] += other.no_winner[rule]
+        for pair in self.agreements:
+            self.agreements[pair] += other.agreements[pair]
+        self.records.extend(other.records)
+
+    def condorcet_efficiency(self, voting_rule: str) -> float:
+        """Retourne la proportion des élections avec un gagnant de Condorcet où la règle de vote l'a élu."""
+
+        return self.condorcet_hits[voting_rule] / self.nb_condorcet_winners if self.nb_condorcet_winners else 0
+
+    def agreement_rate(self, voting_rule1: str, voting_rule2: str) -> float:
+        """Retourne la proportion des élections où les gagnants des deux règles de vote coïncident."""
+
+        pair = tuple(sorted((voting_rule1, voting_rule2)))
+        return self.agreements[pair] / self.nb_runs if self.nb_runs else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne les résultats sous forme d'un dictionnaire sérialisable en JSON."""
+
+        return {
+            "nb_runs": self.nb_runs,
+            "nb_condorcet_winners": self.nb_condorcet_winners,
+            "condorcet_hits": dict(self.condorcet_hits),
+            "condorcet_efficiency": {rule: self.condorcet_efficiency(rule) for rule in self.voting_rules},
+            "no_winner": dict(self.no_winner),
+            "agreements": {f"{rule1}/{rule2}": count for (rule1, rule2), count in self.agreements.items()},
+            "agreement_rate": {f"{rule1}/{rule2}": self.agreement_rate(rule1, rule2)
+                               for rule1, rule2 in self.agreements},
+        }
+
+
+def _seed_generators(seed_sequence: np.random.SeedSequence) -> None:
+    """Initialise les générateurs pseudo-aléatoires globaux du processus (`numpy.random` pour la génération
+    des données et `random` pour les délégations et les sondages) à partir d'un flux indépendant."""
+
+    state = seed_sequence.generate_state(4)
+    np.random.seed(state)
+    random.seed(int.from_bytes(state.tobytes(), "little"))
+
+
+def _run_batch(seed_sequence: np.random.SeedSequence, nb_runs: int, nb_electors: int, nb_candidates: int,
+               voting_rules: List[str], liquid_democracy: bool, tie_breaker: bool,
+               generation_constants: Optional[generation_constants_type], keep_records: bool = False) -> MonteCarloResults:
+    """Effectue un lot d'élections dans le processus courant et retourne les résultats agrégés."""
+
+    _seed_generators(seed_sequence)
+    election = Election()
+    results = MonteCarloResults(voting_rules)
+    for _ in range(nb_runs):
+        configure(election, liquid_democracy=liquid_democracy, tie_breaker=tie_breaker,
+                  generation_constants=generation_constants)
+        generate_population(election, nb_electors, nb_candidates)
+        election.start_election(chosen_voting_rules=voting_rules)
+
+        winners = dict()
+        for rule in voting_rules:
+            winner = election.choose_winner(rule)
+            winners[rule] = None if winner is None else winner.id
+
+        index = condorcet_winner(election.duels_scores.matrix)
+        condorcet = None if index is None else election.candidates[index].id
+        results.add_run(winners, condorcet)
+        if keep_records:
+            results.records.append(election_record(election))
+    return results
+
+
+def run_monte_carlo(nb_runs: int, nb_electors: int, nb_candidates: int, voting_rules: Iterable[str],
+                    seed: Optional[int] = None, max_workers: Optional[int] = None, batch_size: int = 100,
+                    liquid_democracy: bool = False, tie_breaker: bool = True,
+                    generation_constants: Optional[generation_constants_type] = None,
+                    keep_records: bool = False) -> MonteCarloResults:
+    """Effectue `nb_runs` élections aléatoires réparties par lots entre plusieurs processus, et agrège leurs résultats.
+
+    Args:
+        nb_runs (int): Le nombre total des élections.
+        nb_electors (int): Le nombre des électeurs générés dans chaque élection.
+        nb_candidates (int): Le nombre des candidats générés dans chaque élection.
+        voting_rules (Iterable[str]): Les constantes des règles de vote à comparer.
+        seed (Optional[int]): La graine. Si `None`, une graine est choisie par le système. Default = `None`.
+        max_workers (Optional[int]): Le nombre maximal des processus. Par défaut, le nombre des cœurs.
+        batch_size (int): Le nombre des élections par lot. Default = 100.
+        liquid_democracy (bool): Active la démocratie liquide. Default = `False`.
+        tie_breaker (bool): Active la résolution des égalités selon les duels. Default = `True`.
+        generation_constants (Optional[electoral_systems.simulate.generation_constants_type]): Les constantes
+            de la génération des données à modifier. Default = `None`.
+        keep_records (bool): Garde aussi les données de chaque élection (`MonteCarloResults.records`). Default = `False`.
+
+    Returns:
+        electoral_systems.monte_carlo.MonteCarloResults: Les résultats agrégés de toutes les élections.
+    """
+
+    voting_rules = sorted(set(voting_rules))
+    batches = [batch_size] * (nb_runs // batch_size)
+    if nb_runs % batch_size:
+        batches.append(nb_runs % batch_size)
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(batches))
+
+    results = MonteCarloResults(voting_rules)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run_batch, seed_sequence, size, nb_electors, nb_candidates, voting_rules,
+                            liquid_democracy, tie_breaker, generation_constants, keep_records)
+            for seed_sequence, size in zip(seed_sequences, batches)
+        ]
+        for future in futures:
+            results.merge(future.result())
+    return results
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Analyse les arguments de la ligne de commande."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m electoral_systems.monte_carlo",
+        description="Compare voting rules over many random elections on several processes.",
+    )
+    parser.add_argument("--runs", type=int, default=1000, help="Number of elections.")
+    parser.add_argument("--electors", type=int, default=1000, help="Number of generated electors per election.")
+    parser.add_argument("--candidates", type=int, default=5, help="Number of generated candidates per election.")
+    parser.add_argument("--rules", nargs="+", choices=list(VotingRulesConstants.UI), metavar="RULE",
+                        default=[VotingRulesConstants.BORDA, VotingRulesConstants.CONDORCET_COPELAND,
+                                 VotingRulesConstants.EXHAUSTIVE_BALLOT],
+                        help=f"Voting rules to compare, among: {', '.join(VotingRulesConstants.UI)}.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random streams.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes. Default: number of cores.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Number of elections per batch.")
+    parser.add_argument("--liquid-democracy", action="store_true", help="Activate liquid democracy.")
+    parser.add_argument("--no-tie-breaker", action="store_true", help="Do not resolve ties with duels.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Le point d'entrée de la ligne de commande. Écrit les résultats agrégés au format JSON sur la sortie standard.
+
+    Args:
+        argv (Optional[List[str]]): Les arguments de la ligne de commande. Par défaut, `sys.argv[1:]`.
+    """
+
+    args = _parse_args(argv)
+    results = run_monte_carlo(args.runs, args.electors, args.candidates, args.rules, args.seed, args.workers,
+                              args.batch_size, args.liquid_democracy, not args.no_tie_breaker)
+    print(json.dumps(results.to_dict(), indent=4))
+
+
+if __name__ == "__main__":
+    main()
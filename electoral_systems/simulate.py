@@ -0,0 +1,281 @@
+"""Un module qui permet de lancer des élections sans interface graphique (par exemple, sur un serveur sans écran).
+La population est générée selon les réglages `electoral_systems.election_constants.RandomConstants`,
+l'élection est effectuée avec `electoral_systems.election.Election.start_election` pour les règles de vote choisies,
+et les gagnants, les scores et les durées de chaque étape sont écrits au format JSON lines (un objet JSON par ligne).
+Le module n'importe pas `PySide6`.
+
+Exemple:
+    `python -m electoral_systems.simulate --electors 10000 --candidates 5 --rules PS BRD AL --runs 100 --seed 1`
+"""
+
+import argparse
+import json
+import random
+import sys
+from time import perf_counter
+from typing import Any, Dict, IO, Iterable, List, Optional
+
+import numpy as np
+
+from .election import Election
+from .election_constants import RandomConstants, VotingRulesConstants
+from .generation import generate_candidates, generate_electors, generation_constants_type
+from .voting_rules.duels import Duels, condorcet_winner
+
+from people import Candidate
+
+# Pour une génération des docs uniquement
+__pdoc__ = {
+    '_parse_args': True,
+    '_candidate_data': True,
+}
+
+
+def configure(election: Election, nb_polls: int = 0, liquid_democracy: bool = False, tie_breaker: bool = True,
+              poll_voting_rule: str = VotingRulesConstants.PLURALITY_SIMPLE,
+              generation_constants: Optional[generation_constants_type] = None) -> None:
+    """Supprime toutes les données d'une élection et applique les réglages donnés. Les constantes de la génération
+    qui ne sont pas données gardent leurs valeurs par défaut.
+
+    Args:
+        election (electoral_systems.election.Election): L'élection.
+        nb_polls (int): Le nombre des sondages à effectuer après l'élection. Default = 0.
+        liquid_democracy (bool): Active la démocratie liquide. Default = `False`.
+        tie_breaker (bool): Active la résolution des égalités selon les duels. Default = `True`.
+        poll_voting_rule (str): Une constante de la règle de vote utilisée pour les sondages. Default = `PLURALITY_SIMPLE`.
+        generation_constants (Optional[electoral_systems.simulate.generation_constants_type]): Les constantes
+            de la génération des données à modifier. Default = `None`.
+    """
+
+    election.delete_all_data()
+    election.set_default_settings()
+    election.nb_polls = nb_polls
+    election.liquid_democracy_activated = liquid_democracy
+    election.tie_breaker_activated = tie_breaker
+    election.poll_voting_rule = poll_voting_rule
+    if generation_constants:
+        election.generation_constants.update(generation_constants)
+
+
+def generate_population(election: Election, nb_electors: int, nb_candidates: int) -> None:
+    """Génère et ajoute à une élection les candidats puis les électeurs (dans le même ordre que la carte politique).
+    Toutes les données sont générées en une seule fois (cf. `electoral_systems.generation`).
+
+    Args:
+        election (electoral_systems.election.Election): L'élection déjà configurée.
+        nb_electors (int): Le nombre des électeurs à générer.
+        nb_candidates (int): Le nombre des candidats à générer.
+    """
+
+    election.add_candidates(*generate_candidates(election.generation_constants, nb_candidates))
+    positions, knowledge = generate_electors(election.generation_constants, nb_electors)
+    election.add_electors(positions, knowledge=knowledge)
+
+
+def _candidate_data(candidate: Candidate, voting_rule: str) -> Dict[str, Any]:
+    """Retourne les données d'un candidat (ID, nom, score selon `voting_rule`) sérialisables en JSON."""
+
+    score = candidate.scores.get(voting_rule)
+    return {
+        "id": candidate.id,
+        "name": f"{candidate.first_name} {candidate.last_name}",
+        "score": score,
+    }
+
+
+def summarize_results(election: Election) -> Dict[str, Dict[str, Any]]:
+    """Retourne, pour chaque règle de vote appliquée, le gagnant, son taux de satisfaction et le classement final
+    des candidats avec leurs scores. Pour les règles à plusieurs tours, le score est la liste des scores par tour.
+
+    Args:
+        election (electoral_systems.election.Election): Une élection dont les résultats ont été calculés.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Un dictionnaire sérialisable en JSON, indexé par les constantes des règles de vote.
+    """
+
+    summary = dict()
+    for voting_rule, result in election.results.items():
+        winner = election.choose_winner(voting_rule)
+        ranking = result[-1] if voting_rule in VotingRulesConstants.MULTI_ROUND else result
+        summary[voting_rule] = {
+            "winner": None if winner is None else _candidate_data(winner, voting_rule),
+            "satisfaction": None if winner is None else election.calc_satisfaction(winner),
+            "ranking": [_candidate_data(candidate, voting_rule) for candidate in ranking],
+        }
+    return summary
+
+
+def election_record(election: Election) -> Dict[str, Any]:
+    """Retourne les données d'une élection à garder dans un historique des élections (cf. `sqlite.run_store`):
+    les candidats, les scores et le gagnant de chaque règle de vote appliquée, et le gagnant de Condorcet.
+    Les électeurs ne sont pas inclus.
+
+    Args:
+        election (electoral_systems.election.Election): Une élection dont les résultats ont été calculés.
+
+    Returns:
+        Dict[str, Any]: Un dictionnaire sérialisable en JSON. Les scores de chaque règle de vote sont dans l'ordre
+            de `candidates` (une liste par candidat pour les règles à plusieurs tours).
+    """
+
+    winners = dict()
+    for voting_rule in election.results:
+        winner = election.choose_winner(voting_rule)
+        winners[voting_rule] = None if winner is None else winner.id
+
+    duels = election.duels_scores
+    index = condorcet_winner(duels.matrix) if isinstance(duels, Duels) and duels.candidates else None
+    return {
+        "nb_electors": election.nb_electors,
+        "candidates": [
+            {
+                "id": c.id,
+                "position": list(c.position),
+                "first_name": c.first_name,
+                "last_name": c.last_name,
+                "dogmatism": c.dogmatism,
+                "opposition": c.opposition,
+            }
+            for c in election.candidates
+        ],
+        "scores": {voting_rule: [c.scores.get(voting_rule) for c in election.candidates] for voting_rule in winners},
+        "winners": winners,
+        "condorcet": None if index is None else duels.candidates[index].id,
+    }
+
+
+def run_simulation(nb_electors: int, nb_candidates: int, voting_rules: Iterable[str], nb_polls: int = 0,
+                   liquid_democracy: bool = False, tie_breaker: bool = True,
+                   poll_voting_rule: str = VotingRulesConstants.PLURALITY_SIMPLE,
+                   generation_constants: Optional[generation_constants_type] = None) -> Dict[str, Any]:
+    """Effectue une élection complète: la configuration, la génération de la population, l'élection et les sondages.
+
+    Args:
+        nb_electors (int): Le nombre des électeurs à générer.
+        nb_candidates (int): Le nombre des candidats à générer.
+        voting_rules (Iterable[str]): Les constantes des règles de vote à appliquer.
+        nb_polls (int): Le nombre des sondages à effectuer après l'élection. Default = 0.
+        liquid_democracy (bool): Active la démocratie liquide. Default = `False`.
+        tie_breaker (bool): Active la résolution des égalités selon les duels. Default = `True`.
+        poll_voting_rule (str): Une constante de la règle de vote utilisée pour les sondages. Default = `PLURALITY_SIMPLE`.
+        generation_constants (Optional[electoral_systems.simulate.generation_constants_type]): Les constantes
+            de la génération des données à modifier. Default = `None`.
+
+    Returns:
+        Dict[str, Any]: Un dictionnaire sérialisable en JSON avec la taille de l'élection, les durées de chaque étape
+            (en secondes) et les résultats (cf. `summarize_results()`).
+    """
+
+    election = Election()
+    configure(election, nb_polls, liquid_democracy, tie_breaker, poll_voting_rule, generation_constants)
+    timings = dict()
+
+    start = perf_counter()
+    generate_population(election, nb_electors, nb_candidates)
+    timings["generation"] = perf_counter() - start
+
+    start = perf_counter()
+    election.start_election(chosen_voting_rules=list(voting_rules))
+    timings["election"] = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(nb_polls):
+        election.conduct_poll()
+    timings["polls"] = perf_counter() - start
+
+    return {
+        "nb_electors": len(election.electors),
+        "nb_candidates": len(election.candidates),
+        "timings": timings,
+        "results": summarize_results(election),
+    }
+
+
+def write_record(record: Dict[str, Any], output: IO[str]) -> None:
+    """Écrit un enregistrement sur une ligne au format JSON.
+
+    Args:
+        record (Dict[str, Any]): Un dictionnaire sérialisable en JSON.
+        output (IO[str]): Un fichier texte ouvert en écriture.
+    """
+
+    output.write(json.dumps(record, default=float) + "\n")
+    output.flush()
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Analyse les arguments de la ligne de commande."""
+
+    defaults = RandomConstants.DEFAULT_VALUES
+    parser = argparse.ArgumentParser(
+        prog="python -m electoral_systems.simulate",
+        description="Run elections without a graphical interface and write the results as JSON lines.",
+    )
+    parser.add_argument("--electors", type=int, default=1000, help="Number of generated electors.")
+    parser.add_argument("--candidates", type=int, default=5, help="Number of generated candidates.")
+    parser.add_argument("--rules", nargs="+", choices=list(VotingRulesConstants.UI), metavar="RULE",
+                        default=list(VotingRulesConstants.UI),
+                        help=f"Voting rules to apply, among: {', '.join(VotingRulesConstants.UI)}. Default: all.")
+    parser.add_argument("--runs", type=int, default=1, help="Number of elections to run.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random generators.")
+    parser.add_argument("--polls", type=int, default=0, help="Number of polls conducted after each election.")
+    parser.add_argument("--poll-rule", default=VotingRulesConstants.PLURALITY_SIMPLE,
+                        choices=sorted(VotingRulesConstants.ONE_ROUND), help="Voting rule used for polls.")
+    parser.add_argument("--liquid-democracy", action="store_true", help="Activate liquid democracy.")
+    parser.add_argument("--no-tie-breaker", action="store_true", help="Do not resolve ties with duels.")
+
+    generation = parser.add_argument_group("generation settings")
+    generation.add_argument("--economical", nargs=2, type=float, metavar=("MU", "SIGMA"),
+                            default=defaults[RandomConstants.ECONOMICAL])
+    generation.add_argument("--social", nargs=2, type=float, metavar=("MU", "SIGMA"),
+                            default=defaults[RandomConstants.SOCIAL])
+    generation.add_argument("--orientation", type=int, choices=(-1, 0, 1),
+                            default=defaults[RandomConstants.ORIENTATION])
+    generation.add_argument("--knowledge", nargs=2, type=float, metavar=("MU", "SIGMA"),
+                            default=defaults[RandomConstants.KNOWLEDGE])
+    generation.add_argument("--dogmatism", nargs=2, type=float, metavar=("MU", "SIGMA"),
+                            default=defaults[RandomConstants.DOGMATISM])
+    generation.add_argument("--opposition", nargs=2, type=float, metavar=("MU", "SIGMA"),
+                            default=defaults[RandomConstants.OPPOSITION])
+    generation.add_argument("--travel-dist", type=float, default=defaults[RandomConstants.TRAVEL_DIST])
+
+    parser.add_argument("--output", "-o", default="-", help="Output file. Default: standard output.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Le point d'entrée de la ligne de commande.
+
+    Args:
+        argv (Optional[List[str]]): Les arguments de la ligne de commande. Par défaut, `sys.argv[1:]`.
+    """
+
+    args = _parse_args(argv)
+    if args.seed is not None:
+        random.seed(args.seed)
+        np.random.seed(args.seed)
+
+    generation_constants = {
+        RandomConstants.ECONOMICAL: tuple(args.economical),
+        RandomConstants.SOCIAL: tuple(args.social),
+        RandomConstants.ORIENTATION: args.orientation,
+        RandomConstants.KNOWLEDGE: tuple(args.knowledge),
+        RandomConstants.DOGMATISM: tuple(args.dogmatism),
+        RandomConstants.OPPOSITION: tuple(args.opposition),
+        RandomConstants.TRAVEL_DIST: args.travel_dist,
+    }
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for run in range(args.runs):
+            record = run_simulation(args.electors, args.candidates, args.rules, args.polls, args.liquid_democracy,
+                                    not args.no_tie_breaker, args.poll_rule, generation_constants)
+            write_record({"run": run, "seed": args.seed, **record}, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
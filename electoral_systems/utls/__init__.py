@@ -1,3 +1,4 @@
 from .singleton import Singleton
 from .name_iterator import NameIterator
 from .id_iterator import IdIterator
+from .spatial_index import SpatialIndex
@@ -0,0 +1,97 @@
+from math import floor
+from typing import Sequence
+
+import numpy as np
+
+
+class SpatialIndex:
+    """Une grille uniforme sur des positions de la carte politique. Elle permet de trouver les positions situées
+    dans un cercle sans parcourir toutes les positions: seules les cases de la grille qui touchent le cercle sont
+    parcourues. Si la taille des cases est de l'ordre du rayon des requêtes, une requête coûte O(1) en moyenne
+    (pour des positions réparties de façon homogène) au lieu de O(N)."""
+
+    def __init__(self, positions: Sequence[tuple[float, float]], cell_size: float):
+        """Construit la grille en O(N log N): les positions sont triées selon l'indice de leur case.
+
+        Args:
+            positions (Sequence[tuple[float, float]]): Les positions indexées, un tableau (N×2).
+            cell_size (float): La taille (strictement positive) d'une case, de préférence le rayon des requêtes.
+        """
+
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+
+        self.positions: np.ndarray = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        """Les positions indexées (N×2). Les indices retournés par les requêtes sont les indices de ligne."""
+
+        self.cell_size: float = cell_size
+        """La taille d'une case."""
+
+        cells = np.floor(self.positions / cell_size).astype(np.int64)
+        self._origin = cells.min(axis=0) if len(cells) else np.zeros(2, dtype=np.int64)
+        cells -= self._origin
+        self._shape = cells.max(axis=0) + 1 if len(cells) else np.ones(2, dtype=np.int64)
+
+        # Indice linéaire de la case de chaque position, les positions sont triées par case (tri stable)
+        keys = cells[:, 0] * self._shape[1] + cells[:, 1]
+        self._order = np.argsort(keys, kind="stable")
+        self._keys = keys[self._order]
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def _candidates(self, position: tuple[float, float], radius: float) -> np.ndarray:
+        """Retourne les indices des positions situées dans les cases qui touchent le carré circonscrit au cercle."""
+
+        x, y = position
+        low_x, low_y = (floor((x - radius) / self.cell_size) - self._origin[0],
+                        floor((y - radius) / self.cell_size) - self._origin[1])
+        high_x, high_y = (floor((x + radius) / self.cell_size) - self._origin[0],
+                          floor((y + radius) / self.cell_size) - self._origin[1])
+        low_x, low_y = max(low_x, 0), max(low_y, 0)
+        high_x, high_y = min(high_x, self._shape[0] - 1), min(high_y, self._shape[1] - 1)
+        if low_x > high_x or low_y > high_y:
+            return np.empty(0, dtype=np.intp)
+
+        # Les cases d'une même colonne sont contiguës dans l'ordre des clés
+        columns = np.arange(low_x, high_x + 1) * self._shape[1]
+        starts = np.searchsorted(self._keys, columns + low_y, side="left")
+        ends = np.searchsorted(self._keys, columns + high_y, side="right")
+        return np.concatenate([self._order[start:end] for start, end in zip(starts, ends)])
+
+    def query(self, position: tuple[float, float], radius: float, inclusive: bool = True) -> np.ndarray:
+        """Retourne les indices des positions situées dans le cercle de centre `position` et de rayon `radius`.
+        La distance est calculée comme `math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)`, le résultat est donc identique
+        à celui d'un parcours de toutes les positions.
+
+        Args:
+            position (tuple[float, float]): Le centre du cercle.
+            radius (float): Le rayon du cercle.
+            inclusive (bool): Si `True`, une position située exactement sur le cercle est retournée. Default = `True`.
+
+        Returns:
+            numpy.ndarray: Les indices des positions dans le cercle, triés par ordre croissant.
+        """
+
+        indices = self._candidates(position, radius)
+        if not indices.size:
+            return indices
+        x, y = position
+        points = self.positions[indices]
+        distances = np.sqrt((points[:, 0] - x) ** 2 + (points[:, 1] - y) ** 2)
+        inside = distances <= radius if inclusive else distances < radius
+        return np.sort(indices[inside])
+
+    def any_within(self, position: tuple[float, float], radius: float, inclusive: bool = True) -> bool:
+        """Vérifie s'il existe au moins une position dans le cercle de centre `position` et de rayon `radius`.
+
+        Args:
+            position (tuple[float, float]): Le centre du cercle.
+            radius (float): Le rayon du cercle.
+            inclusive (bool): Si `True`, une position située exactement sur le cercle est prise en compte. Default = `True`.
+
+        Returns:
+            bool: `True` si au moins une position est dans le cercle.
+        """
+
+        return bool(self.query(position, radius, inclusive).size)
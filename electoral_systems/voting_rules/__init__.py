@@ -2,8 +2,13 @@ __all__ = [
     "approval",
     "borda",
     "condorcet",
+    "duels",
+    "elimination",
     "exhaustive_ballot",
+    "mapped_profile",
     "plurality",
+    "profile",
+    "scoring",
     "veto",
     "tie",
 ]
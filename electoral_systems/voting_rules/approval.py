@@ -1,13 +1,91 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
 
 from .constants import APPROVAL
-from .utls import duels_type, init_scores, sort_cand_by_value
+from .profile import Profile
+from .utls import duels_type, get_profile, set_scores, sort_cand_by_value, weighted_count
 
 from people import Candidate, Elector
 
 
+def ranked_distances(profile: Profile) -> np.ndarray:
+    """Retourne les distances entre chaque électeur et les candidats dans l'ordre de son classement.
+    Les distances sont lues dans la matrice (E×C) gardée par le profil, elles ne sont pas recalculées.
+
+    Args:
+        profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks` est remplie.
+
+    Returns:
+        numpy.ndarray: Une matrice (E×C) dont la case `[e, k]` est la distance entre l'électeur `e` et le candidat
+            placé à la position `k` dans son classement.
+    """
+
+    return np.take_along_axis(profile.get_distances(), profile.ranks.astype(np.intp), axis=1)
+
+
+def within_radius(distances: np.ndarray, radius: Union[float, np.ndarray], inclusive: bool = False) -> np.ndarray:
+    """Retourne un masque des candidats qu'un électeur considère en parcourant son classement: les candidats
+    sont considérés jusqu'au premier candidat dont la distance dépasse le rayon (exclu).
+
+    Args:
+        distances (numpy.ndarray): Une matrice (E×C) des distances dans l'ordre des classements (cf. `ranked_distances()`).
+        radius (Union[float, numpy.ndarray]): Le rayon du cercle, un pour tous ou un par électeur (tableau (E,)).
+        inclusive (bool): Si `True`, un candidat situé exactement sur le cercle est considéré. Default = `False`.
+
+    Returns:
+        numpy.ndarray: Une matrice (E×C) des booléens dans l'ordre des classements.
+    """
+
+    radius = np.asarray(radius, dtype=np.float64)
+    if radius.ndim:
+        radius = radius[:, np.newaxis]
+    inside = distances <= radius if inclusive else distances < radius
+    return np.logical_and.accumulate(inside, axis=-1)
+
+
+def approval_mask(profile: Profile, gap: Union[float, Sequence[float]]) -> np.ndarray:
+    """Retourne un masque des candidats approuvés par chaque électeur. Un électeur approuve les candidats de son classement
+    tant qu'ils sont dans son cercle d'approbation de rayon `gap` + la distance au candidat classé premier.
+
+    Args:
+        profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks` est remplie.
+        gap (Union[float, Sequence[float]]): L'écart d'approbation, un pour tous ou un par électeur.
+
+    Returns:
+        numpy.ndarray: Une matrice (E×C) des booléens dans l'ordre des classements.
+    """
+
+    distances = ranked_distances(profile)
+    return within_radius(distances, distances[:, 0] + np.asarray(gap, dtype=np.float64))
+
+
+def approval_scores(profile: Profile, gap: Union[float, Sequence[float]]) -> np.ndarray:
+    """Calcule les scores de tous les candidats selon la règle de vote *Approbation*.
+
+    Args:
+        profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks` est remplie.
+        gap (Union[float, Sequence[float]]): L'écart d'approbation, un pour tous ou un par électeur.
+
+    Returns:
+        numpy.ndarray: Un tableau (C,) des entiers: pour chaque candidat, la somme des poids des électeurs qui l'approuvent.
+    """
+
+    gap = np.asarray(gap, dtype=np.float64)
+    scores = np.zeros(profile.nb_candidates, dtype=np.int64)
+    start = 0
+    for chunk in profile.chunks():
+        stop = start + chunk.nb_electors
+        approved = approval_mask(chunk, gap[start:stop] if gap.ndim else gap)
+        # Chaque candidat approuvé reçoit le poids de l'électeur
+        weights = np.broadcast_to(chunk.weights[:, np.newaxis], approved.shape)
+        scores += weighted_count(chunk.ranks[approved], weights[approved], profile.nb_candidates)
+        start = stop
+    return scores
+
+
 def apply_approval(electors: List[Elector], candidates: List[Candidate],
-                   gap: float, duels: Optional[duels_type] = None) -> List[Candidate]:
+                   gap: Union[float, Sequence[float]], duels: Optional[duels_type] = None, profile: Optional[Profile] = None) -> List[Candidate]:
     """Applique la règle de vote Approbation. Il n'est possible d'appliquer cette règle de vote s'il existe 
     au moins 2 candidats. Principe d'une règle de vote Approbation:  
     - Chaque électeur doit placer tous les candidats selon ses préférences dans l'ordre décroissant.  
@@ -18,24 +96,18 @@ def apply_approval(electors: List[Elector], candidates: List[Candidate],
 
     Args:
         electors (List[people.elector.Elector]): Une liste de tous les électeurs participant à une élection.
-            Leur liste `candidates_ranked` doit être remplie.
+            Leur liste `candidates_ranked` doit être remplie si `profile` n'est pas donné.
         candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
+        gap (Union[float, Sequence[float]]): L'écart d'approbation, un pour tous les électeurs ou un par électeur.
         duels (electoral_systems.voting_rules.utls.duels_type): Un dictionnaire qui associe à chaque duel des candidats (gagnant, perdant) le nombre de fois
             que le candidat-gagnant a battu le candidat-perdant. Default = `None`.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il n'est pas donné,
+            il est construit à partir des listes `candidates_ranked` des électeurs. Default = `None`.
     Returns:
         List[people.candidate.Candidate]: Une liste des candidats triés dans l'ordre décroissant selon leurs score selon
             la règle de vote *Approbation*.
     """
     
-    init_scores(candidates, APPROVAL, 0)
-    for elector in electors:
-        dist_max = elector.dist_from_one_cand(
-            elector.candidates_ranked[0]) + gap
-
-        for candidate in elector.candidates_ranked:
-            if elector.dist_from_one_cand(candidate) < dist_max:
-                candidate.add_score(APPROVAL, elector.weight)
-            else:
-                break
-
-    return sort_cand_by_value(candidates, APPROVAL, len(electors), duels)
+    profile = get_profile(electors, candidates, profile)
+    set_scores(profile.candidates, APPROVAL, approval_scores(profile, gap))
+    return sort_cand_by_value(candidates, APPROVAL, profile.nb_electors, duels)
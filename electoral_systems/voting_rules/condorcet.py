@@ -1,13 +1,15 @@
 """Ce module fournit des fonctions nécessaires pour les règles de vote Condorcet-cohérentes"""
-from typing import List
+from typing import List, Optional
 
 from .constants import CONDORCET_SIMPLE, CONDORCET_COPELAND, CONDORCET_SIMPSON
+from .profile import Profile
 from .utls import duels_type, init_scores, sort_cand_by_value
 
 from people import Candidate, Elector
 
 
-def apply_condorcet_simple(electors: List[Elector], candidates: List[Candidate], duels: duels_type) -> List[Candidate]:
+def apply_condorcet_simple(electors: List[Elector], candidates: List[Candidate], duels: duels_type,
+                           profile: Optional[Profile] = None) -> List[Candidate]:
     """Applique la régle de vote *Condorcet*. Il n'est possible d'appliquer cette règle de vote que s'il existe au moins 2 candidats.
     Principe d'une règle du vote *Condorcet*:  
         - Chaque électeur doit placer tous les candidats selon ses préférences dans l'ordre décroissant.  
@@ -20,19 +22,23 @@ def apply_condorcet_simple(electors: List[Elector], candidates: List[Candidate],
         candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
         duels (electoral_systems.voting_rules.utls.duels_type): Un dictionnaire qui associe à chaque duel des candidats (gagnant, perdant) 
             le nombre des fois que le candidat-gagnant a battu le candidat-perdant.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il est donné,
+            le nombre des électeurs est lu dans le profil. Default = `None`.
 
     Returns:
         List[people.candidate.Candidate]: Une liste des candidats triés dans l'ordre décroissant selon leur score selon
             la règle de vote *Condorcet. Le premier candidat n'est pas forcément le gagnant.
     """
     
+    nb_electors = len(profile) if profile is not None else len(electors)
     init_scores(candidates, CONDORCET_SIMPLE, 0)
     for winner, _ in duels:
         winner.add_score(CONDORCET_SIMPLE, 1)
-    return sort_cand_by_value(candidates, CONDORCET_SIMPLE, nb_electors=len(electors), duels=None)
+    return sort_cand_by_value(candidates, CONDORCET_SIMPLE, nb_electors=nb_electors, duels=None)
 
 
-def apply_condorcet_copeland(electors: List[Elector], candidates: List[Candidate], duels: duels_type) -> List[Candidate]:
+def apply_condorcet_copeland(electors: List[Elector], candidates: List[Candidate], duels: duels_type,
+                             profile: Optional[Profile] = None) -> List[Candidate]:
     """Applique la régle de vote *Copeland*. Il n'est possible d'appliquer cette règle de vote que s'il existe au moins 2 candidats.
     Principe d'une règle de vote *Copeland*:  
         - Chaque électeur doit placer tous les candidats selon ses préférences dans l'ordre décroissant.  
@@ -45,13 +51,16 @@ def apply_condorcet_copeland(electors: List[Elector], candidates: List[Candidate
         candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
         duels (electoral_systems.voting_rules.utls.duels_type): Un dictionnaire qui associe à chaque duel des candidats (gagnant, perdant) 
             le nombre des fois que le candidat-gagnant a battu le candidat-perdant.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il est donné,
+            le nombre des électeurs est lu dans le profil. Default = `None`.
 
     Returns:
         List[people.candidate.Candidate]: Une liste des candidats triés dans l'ordre décroissant selon leurs scores selon
             la règle de vote *Copeland*.
     """
 
-    nb_electors = len(electors)  # Pour déterminer s'il existe une égalité
+    # Pour déterminer s'il existe une égalité
+    nb_electors = len(profile) if profile is not None else len(electors)
     init_scores(candidates, CONDORCET_COPELAND, 0)
     for (winner, loser), score in duels.items():
         if nb_electors % 2 == 0 and score == nb_electors // 2:
@@ -60,10 +69,11 @@ def apply_condorcet_copeland(electors: List[Elector], candidates: List[Candidate
             continue
         winner.add_score(CONDORCET_COPELAND, 1)
 
-    return sort_cand_by_value(candidates, CONDORCET_COPELAND, nb_electors=len(electors), duels=None)
+    return sort_cand_by_value(candidates, CONDORCET_COPELAND, nb_electors=nb_electors, duels=None)
 
 
-def apply_condorcet_simpson(electors: List[Elector], candidates: List[Candidate], duels: duels_type) -> List[Candidate]:
+def apply_condorcet_simpson(electors: List[Elector], candidates: List[Candidate], duels: duels_type,
+                            profile: Optional[Profile] = None) -> List[Candidate]:
     """Applique la régle de vote *Simpson*. Il n'est possible d'appliquer cette règle de vote que s'il existe au moins 2 candidats.
     Principe d'une règle du vote *Simpson*:  
         - Chaque électeur doit placer tous les candidats selon ses préférences dans l'ordre décroissant.  
@@ -76,16 +86,19 @@ def apply_condorcet_simpson(electors: List[Elector], candidates: List[Candidate]
         candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
         duels (electoral_systems.voting_rules.utls.duels_type): Un dictionnaire qui associe à chaque duel des candidats (gagnant, perdant) 
             le nombre des fois que le candidat-gagnant a battu le candidat-perdant.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il est donné,
+            le nombre des électeurs est lu dans le profil. Default = `None`.
 
     Returns:
         List[people.candidate.Candidate]: Une liste des candidats triés dans l'ordre croissant selon leurs scores selon
             la règle de vote *Simpson*.
     """
 
+    nb_electors = len(profile) if profile is not None else len(electors)
     init_scores(candidates, CONDORCET_SIMPSON, 0)
     for (_, loser), score in duels.items():
         current_score = loser.scores[CONDORCET_SIMPSON]
         loser.init_score(CONDORCET_SIMPSON, max(current_score, score))
         current_score = loser.scores[CONDORCET_SIMPSON]
 
-    return sort_cand_by_value(candidates, CONDORCET_SIMPSON, nb_electors=len(electors), duels=None, scores_asc=True)
+    return sort_cand_by_value(candidates, CONDORCET_SIMPSON, nb_electors=nb_electors, duels=None, scores_asc=True)
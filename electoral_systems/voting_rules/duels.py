@@ -0,0 +1,121 @@
+"""Un module qui fournit le calcul vectorisé des duels entre les candidats. Les duels sont stockés dans une matrice
+de majorité pondérée (C×C). La classe `Duels` expose cette matrice comme un dictionnaire
+`electoral_systems.voting_rules.utls.duels_type` (en lecture seule) pour les règles de vote, la résolution des égalités,
+l'exportation et l'affichage des graphes."""
+
+from collections.abc import Mapping
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from people import Candidate
+from .profile import Profile, index_candidates
+
+
+def majority_matrix(profile: Profile) -> np.ndarray:
+    """Calcule la matrice de majorité pondérée à partir des positions des candidats dans les classements des électeurs.
+
+    Args:
+        profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks` est remplie.
+
+    Returns:
+        numpy.ndarray: Une matrice (C×C) des entiers dont la case `[a, b]` est la somme des poids des électeurs
+            qui préfèrent le candidat `a` au candidat `b`.
+    """
+
+    nb_candidates = profile.nb_candidates
+    matrix = np.zeros((nb_candidates, nb_candidates), dtype=np.int64)
+    if not profile.nb_electors:
+        return matrix
+
+    for chunk in profile.chunks():
+        positions = chunk.rank_positions()
+        for candidate in range(nb_candidates):
+            # Les électeurs qui placent `candidate` avant chacun des autres candidats
+            prefers = positions[:, candidate, np.newaxis] < positions
+            matrix[candidate] += chunk.weights @ prefers
+    return matrix
+
+
+def condorcet_winner(matrix: np.ndarray) -> Optional[int]:
+    """Retourne l'indice du gagnant de Condorcet, i.e. du candidat qui bat strictement tous les autres en duel.
+
+    Args:
+        matrix (numpy.ndarray): Une matrice de majorité (C×C). Cf. `majority_matrix()`.
+
+    Returns:
+        Optional[int]: L'indice du gagnant de Condorcet, `None` s'il n'existe pas.
+    """
+
+    nb_candidates = matrix.shape[0]
+    wins = (matrix > matrix.T).sum(axis=1)
+    winners = np.flatnonzero(wins == nb_candidates - 1)
+    return int(winners[0]) if winners.size else None
+
+
+class Duels(Mapping):
+    """Une vue (en lecture seule) d'une matrice de majorité sous la forme d'un dictionnaire des duels
+    `{(gagnant, perdant): score}`. Pour chaque paire de candidats, une seule clé existe: celle du gagnant du duel.
+    En cas d'égalité, le candidat placé le premier dans `candidates` est considéré comme le gagnant.
+    La matrice est calculée uniquement lors du premier accès à un score."""
+
+    def __init__(self, candidates: Sequence[Candidate], matrix: Optional[np.ndarray] = None,
+                 profile: Optional[Profile] = None):
+        """Initialise une vue des duels. Au moins un des paramètres `matrix` et `profile` doit être donné.
+        Un candidat est retrouvé dans la matrice par son indice dense `people.candidate.Candidate.index`.
+
+        Args:
+            candidates (Sequence[people.candidate.Candidate]): Les candidats dans l'ordre des lignes de la matrice.
+            matrix (Optional[numpy.ndarray]): Une matrice de majorité (C×C) déjà calculée. Default = `None`.
+            profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil à partir duquel la matrice
+                sera calculée lors du premier accès. Default = `None`.
+        """
+
+        self.candidates: List[Candidate] = list(candidates)
+        """Les candidats dans l'ordre des lignes de la matrice."""
+        index_candidates(self.candidates)
+
+        self._matrix = matrix
+        self._profile = profile
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """La matrice de majorité (C×C). Cf. `majority_matrix()`."""
+
+        if self._matrix is None:
+            self._matrix = majority_matrix(self._profile)
+            self._profile = None
+        return self._matrix
+
+    def _oriented(self, i: int, j: int) -> tuple[int, int]:
+        """Retourne la paire (gagnant, perdant) des indices des candidats `i` et `j` (`i` < `j`)."""
+
+        matrix = self.matrix
+        return (i, j) if matrix[i, j] >= matrix[j, i] else (j, i)
+
+    def _registered(self, candidate: Candidate) -> bool:
+        """Vérifie que l'indice dense du candidat désigne bien ce candidat dans `candidates`."""
+
+        return 0 <= candidate.index < len(self.candidates) and self.candidates[candidate.index] is candidate
+
+    def __getitem__(self, pair: tuple[Candidate, Candidate]) -> int:
+        winner, loser = pair
+        i, j = winner.index, loser.index
+        if not (self._registered(winner) and self._registered(loser)) or i == j \
+                or self._oriented(min(i, j), max(i, j)) != (i, j):
+            raise KeyError(pair)
+        return int(self.matrix[i, j])
+
+    def __iter__(self) -> Iterator[tuple[Candidate, Candidate]]:
+        nb_candidates = len(self.candidates)
+        for i in range(nb_candidates):
+            for j in range(i + 1, nb_candidates):
+                winner, loser = self._oriented(i, j)
+                yield self.candidates[winner], self.candidates[loser]
+
+    def __len__(self) -> int:
+        nb_candidates = len(self.candidates)
+        return nb_candidates * (nb_candidates - 1) // 2
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())})"
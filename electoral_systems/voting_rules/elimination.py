@@ -0,0 +1,89 @@
+"""Un module qui fournit un moteur d'élimination pour les règles de vote à plusieurs tours.
+Le moteur garde pour chaque électeur un curseur dans son classement: la position de son candidat préféré
+parmi les candidats qui participent encore à une élection. Après une élimination, seuls les électeurs dont le candidat
+courant vient d'être éliminé avancent leur curseur. Chaque tour se réduit ainsi à un seul décompte pondéré.
+Pour un profil sur disque (cf. `electoral_systems.voting_rules.mapped_profile`), aucun tableau par électeur n'est gardé:
+chaque décompte parcourt les classements par blocs et cherche le premier candidat qui participe encore."""
+
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .mapped_profile import MappedProfile
+from .profile import Profile
+
+
+class EliminationRounds:
+    """Un moteur d'élimination associé à un profil de préférences. Les candidats sont identifiés par leur indice
+    dans `profile.candidates`."""
+
+    def __init__(self, profile: Profile):
+        """Initialise le moteur: tous les candidats participent et chaque électeur vote pour son candidat classé premier.
+
+        Args:
+            profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks`
+                est remplie.
+        """
+
+        self.profile: Profile = profile
+        """Le profil de préférences des électeurs."""
+
+        self.remaining: np.ndarray = np.ones(profile.nb_candidates, dtype=bool)
+        """Un tableau (C,) des booléens: `True` si le candidat participe encore à une élection."""
+
+        self.streaming: bool = isinstance(profile, MappedProfile)
+        """`True` si le profil est sur disque: les curseurs ne sont pas gardés, les décomptes parcourent les blocs."""
+
+        self.cursors: Optional[np.ndarray] = None if self.streaming else np.zeros(profile.nb_electors, dtype=np.intp)
+        """Un tableau (E,) des positions du candidat courant dans le classement de chaque électeur
+        (`None` pour un profil sur disque)."""
+
+        self.choices: Optional[np.ndarray] = None if self.streaming else profile.ranks[:, 0].astype(np.intp)
+        """Un tableau (E,) des indices du candidat pour lequel chaque électeur vote dans le tour courant
+        (`None` pour un profil sur disque)."""
+
+    def keep(self, indices: Iterable[int]) -> None:
+        """Élimine tous les candidats sauf ceux de `indices`, puis avance les curseurs des électeurs concernés.
+
+        Args:
+            indices (Iterable[int]): Les indices des candidats qui passent au tour suivant.
+        """
+
+        remaining = np.zeros_like(self.remaining)
+        remaining[list(indices)] = True
+        self.remaining &= remaining
+        self._advance()
+
+    def _advance(self) -> None:
+        """Avance le curseur de chaque électeur dont le candidat courant a été éliminé jusqu'au prochain candidat
+        qui participe encore. Les électeurs dont le candidat courant participe encore ne sont pas parcourus."""
+
+        if self.streaming or not self.remaining.any():
+            return
+        ranks = self.profile.ranks
+        moving = np.flatnonzero(~self.remaining[self.choices])
+        while moving.size:
+            self.cursors[moving] += 1
+            self.choices[moving] = ranks[moving, self.cursors[moving]]
+            moving = moving[~self.remaining[self.choices[moving]]]
+
+    def tally(self) -> np.ndarray:
+        """Compte les votes du tour courant.
+
+        Returns:
+            numpy.ndarray: Un tableau (C,) des entiers: la somme des poids des électeurs qui votent pour chaque candidat.
+        """
+
+        nb_candidates = self.profile.nb_candidates
+        if not self.streaming:
+            counts = np.bincount(self.choices, weights=self.profile.weights, minlength=nb_candidates)
+            return np.rint(counts).astype(np.int64)
+
+        counts = np.zeros(nb_candidates, dtype=np.float64)
+        for chunk in self.profile.chunks():
+            ranks = chunk.ranks.astype(np.intp)
+            # La position du premier candidat qui participe encore dans chaque classement
+            first = self.remaining[ranks].argmax(axis=1)
+            choices = ranks[np.arange(len(ranks)), first]
+            counts += np.bincount(choices, weights=chunk.weights, minlength=nb_candidates)
+        return np.rint(counts).astype(np.int64)
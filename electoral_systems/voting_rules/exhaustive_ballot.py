@@ -1,12 +1,14 @@
-from typing import List
+from typing import List, Optional
 
 from .constants import EXHAUSTIVE_BALLOT
+from .profile import Profile
 from .utls import apply_voting_rule_rounds
 
 from people import Candidate, Elector
 
 
-def apply_exhaustive_ballot(electors: List[Elector], candidates: List[Candidate]) -> List[List[Candidate]]:
+def apply_exhaustive_ballot(electors: List[Elector], candidates: List[Candidate],
+                            profile: Optional[Profile] = None) -> List[List[Candidate]]:
     """Applique la règle de vote *Éliminations successives*. Il n'est possible d'appliquer cette règle de vote que s'il existe au 
     moins 3 candidats.  
     Notons **N**: le nombre des candidats. Il existe au plus **N-1** tours (moins si un candidat a reçu la majorité
@@ -19,8 +21,10 @@ def apply_exhaustive_ballot(electors: List[Elector], candidates: List[Candidate]
 
     Args:
         electors (List[people.elector.Elector]): Une liste de tous les électeurs participant à une élection.
-            Leur liste `candidates_ranked` doit être remplie.
+            Leur liste `candidates_ranked` doit être remplie si `profile` n'est pas donné.
         candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il n'est pas donné,
+            il est construit à partir des listes `candidates_ranked` des électeurs. Default = `None`.
 
     Returns:
         List[people.candidate.Candidate]: Une liste des listes (classement dans l'ordre décroissant) des candidats par tour.
@@ -29,4 +33,4 @@ def apply_exhaustive_ballot(electors: List[Elector], candidates: List[Candidate]
 
     max_rounds = len(candidates) - 1
     elimination_index = -1  # i.e. éliminer tout le monde sauf le dernier
-    return apply_voting_rule_rounds(electors, candidates, EXHAUSTIVE_BALLOT, max_rounds, elimination_index)
+    return apply_voting_rule_rounds(electors, candidates, EXHAUSTIVE_BALLOT, max_rounds, elimination_index, profile)
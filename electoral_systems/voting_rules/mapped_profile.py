@@ -0,0 +1,246 @@
+"""Un module qui fournit un profil de préférences stocké sur disque, pour les élections hors mémoire (des dizaines
+de millions d'électeurs). Les tableaux par électeur sont des fichiers `.npy` d'un même répertoire, projetés en mémoire
+avec `numpy.memmap`: ils ne sont jamais chargés en entier. Le classement, les décomptes des règles de vote et les duels
+parcourent le profil par blocs de `chunk_size` lignes (cf. `electoral_systems.voting_rules.profile.Profile.chunks()`).
+La mémoire utilisée est donc bornée par la taille d'un bloc et non par le nombre des électeurs."""
+
+import os
+import tempfile
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from people import Candidate
+from .profile import Profile, _rank_dtype, index_candidates
+
+# Pour une génération des docs uniquement
+__pdoc__ = {
+    'MappedProfile._resize': True,
+}
+
+DEFAULT_CHUNK_SIZE: int = 250_000
+"""Le nombre des lignes d'un bloc par défaut. Un bloc de C candidats utilise de l'ordre de `16 * C * DEFAULT_CHUNK_SIZE`
+octets (les distances et le tri)."""
+
+POSITIONS_FILE: str = "positions.npy"
+WEIGHTS_FILE: str = "weights.npy"
+KNOWLEDGE_FILE: str = "knowledge.npy"
+RANKS_FILE: str = "ranks.npy"
+"""Les noms des fichiers des tableaux par électeur dans le répertoire d'un profil."""
+
+
+class MappedProfile(Profile):
+    """Un profil de préférences dont les tableaux par électeur (positions, poids, taux de connaissance, classements)
+    sont des fichiers `.npy` projetés en mémoire. Le nombre des électeurs est fixé à la création du profil.
+    Les distances ne sont jamais gardées pour tout le profil: elles sont calculées bloc par bloc."""
+
+    def __init__(self, directory: str, candidates: Sequence[Candidate], positions: np.memmap, weights: np.memmap,
+                 knowledge: np.memmap, ranks: Optional[np.memmap] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 mode: str = "r+"):
+        """Initialise un profil à partir des tableaux déjà projetés. Utiliser `MappedProfile.create()`
+        ou `MappedProfile.open()`.
+
+        Args:
+            directory (str): Le répertoire des fichiers du profil.
+            candidates (Sequence[people.candidate.Candidate]): Les candidats.
+            positions (numpy.memmap): Les positions des électeurs (E×2).
+            weights (numpy.memmap): Les poids des électeurs (E,).
+            knowledge (numpy.memmap): Les taux de connaissance des électeurs (E,).
+            ranks (numpy.memmap): Les classements des électeurs (E×C), `None` s'ils ne sont pas encore calculés.
+            chunk_size (int): Le nombre des lignes d'un bloc. Default = `DEFAULT_CHUNK_SIZE`.
+            mode (str): Le mode d'ouverture des fichiers (cf. `MappedProfile.open()`). Default = "r+".
+
+        Raises:
+            ValueError: Si `chunk_size` n'est pas strictement positif.
+        """
+
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        super().__init__(candidates, positions, weights, knowledge, ranks)
+
+        self.directory: str = directory
+        """Le répertoire des fichiers du profil."""
+
+        self.chunk_size: int = chunk_size
+        """Le nombre des lignes d'un bloc."""
+
+        self.mode: str = mode
+        """Le mode d'ouverture des fichiers: seul "r+" permet d'écrire dans les fichiers du profil."""
+
+        # Les tableaux projetés, pour `MappedProfile.flush()`
+        self._maps: List[np.memmap] = [positions, weights, knowledge]
+
+    @classmethod
+    def create(cls, directory: str, candidates: Sequence[Candidate], nb_electors: int,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> 'MappedProfile':
+        """Crée les fichiers d'un nouveau profil: les positions valent 0, les poids 1 et les taux de connaissance 0.
+        Les positions (et éventuellement les poids et les taux de connaissance) sont ensuite écrites bloc par bloc,
+        par exemple `profile.positions[start:stop] = positions`.
+
+        Args:
+            directory (str): Le répertoire des fichiers, créé s'il n'existe pas. Les fichiers existants sont écrasés.
+            candidates (Sequence[people.candidate.Candidate]): Les candidats.
+            nb_electors (int): Le nombre des électeurs.
+            chunk_size (int): Le nombre des lignes d'un bloc. Default = `DEFAULT_CHUNK_SIZE`.
+
+        Returns:
+            electoral_systems.voting_rules.mapped_profile.MappedProfile: Un nouveau profil, non classé.
+
+        Raises:
+            ValueError: Si `nb_electors` n'est pas strictement positif.
+        """
+
+        if nb_electors <= 0:
+            raise ValueError(f"nb_electors must be positive, got {nb_electors}")
+        os.makedirs(directory, exist_ok=True)
+
+        def new_file(name, dtype, shape):
+            return np.lib.format.open_memmap(os.path.join(directory, name), mode="w+", dtype=dtype, shape=shape)
+
+        positions = new_file(POSITIONS_FILE, np.float64, (nb_electors, 2))
+        weights = new_file(WEIGHTS_FILE, np.int64, (nb_electors,))
+        knowledge = new_file(KNOWLEDGE_FILE, np.float64, (nb_electors,))
+        profile = cls(directory, candidates, positions, weights, knowledge, chunk_size=chunk_size)
+        for start, stop in profile.bounds():
+            weights[start:stop] = 1
+        ranks_path = os.path.join(directory, RANKS_FILE)
+        if os.path.exists(ranks_path):
+            os.remove(ranks_path)
+        return profile
+
+    @classmethod
+    def open(cls, directory: str, candidates: Sequence[Candidate], chunk_size: int = DEFAULT_CHUNK_SIZE,
+             mode: str = "r+") -> 'MappedProfile':
+        """Ouvre les fichiers d'un profil existant. Les classements sont repris s'ils existent et correspondent
+        au nombre des candidats.
+
+        Args:
+            directory (str): Le répertoire des fichiers.
+            candidates (Sequence[people.candidate.Candidate]): Les candidats, dans l'ordre des classements enregistrés.
+            chunk_size (int): Le nombre des lignes d'un bloc. Default = `DEFAULT_CHUNK_SIZE`.
+            mode (str): Le mode d'ouverture de `numpy.load`: "r+" (lecture et écriture), "r" (lecture seule)
+                ou "c" (copie sur écriture: les modifications restent en mémoire, les fichiers ne changent pas).
+                Dans les deux derniers cas, `MappedProfile.rank()` n'écrit pas dans le fichier des classements.
+                Default = "r+".
+
+        Returns:
+            electoral_systems.voting_rules.mapped_profile.MappedProfile: Le profil.
+        """
+
+        def load(name):
+            return np.load(os.path.join(directory, name), mmap_mode=mode)
+
+        ranks = None
+        if os.path.exists(os.path.join(directory, RANKS_FILE)):
+            ranks = load(RANKS_FILE)
+            if ranks.shape[1] != len(candidates):
+                ranks = None
+        return cls(directory, candidates, load(POSITIONS_FILE), load(WEIGHTS_FILE), load(KNOWLEDGE_FILE), ranks,
+                   chunk_size, mode)
+
+    def bounds(self) -> Iterator[tuple[int, int]]:
+        """Itère sur les bornes (début, fin) des blocs de lignes.
+
+        Returns:
+            Iterator[tuple[int, int]]: Les bornes de chaque bloc, la fin est exclue.
+        """
+
+        for start in range(0, self.nb_electors, self.chunk_size):
+            yield start, min(start + self.chunk_size, self.nb_electors)
+
+    def rows(self, start: int, stop: int) -> Profile:
+        """Retourne un profil en mémoire restreint aux lignes `start` à `stop` (exclue). Les tableaux sont des vues
+        sur les fichiers, seules les lignes du bloc sont lues.
+
+        Args:
+            start (int): La première ligne.
+            stop (int): La ligne qui suit la dernière ligne.
+
+        Returns:
+            electoral_systems.voting_rules.profile.Profile: Un profil des électeurs du bloc.
+        """
+
+        ranks = None if self.ranks is None else self.ranks[start:stop]
+        return Profile(self.candidates, self.positions[start:stop], self.weights[start:stop],
+                       self.knowledge[start:stop], ranks)
+
+    def chunks(self) -> Iterator[Profile]:
+        """Itère sur le profil par blocs de `chunk_size` lignes (cf. `MappedProfile.rows()`).
+
+        Returns:
+            Iterator[electoral_systems.voting_rules.profile.Profile]: Les profils en mémoire des blocs,
+                dans l'ordre des lignes.
+        """
+
+        for start, stop in self.bounds():
+            yield self.rows(start, stop)
+
+    def set_candidates(self, candidates: Sequence[Candidate]) -> None:
+        """Remplace les candidats du profil (par exemple, si des candidats ont été ajoutés depuis sa création).
+        Les classements doivent ensuite être recalculés avec `MappedProfile.rank()`.
+
+        Args:
+            candidates (Sequence[people.candidate.Candidate]): Les candidats.
+        """
+
+        self.candidates = list(candidates)
+        index_candidates(self.candidates)
+
+    def rank(self) -> None:
+        """Classe les candidats pour chaque électeur, bloc par bloc: les distances d'un bloc sont calculées,
+        triées (tri stable, cf. `electoral_systems.voting_rules.profile.Profile.rank()`) puis écrites dans le fichier
+        des classements. Si le profil a été ouvert en lecture seule ou en copie sur écriture, le fichier des classements
+        ne change pas: les classements sont écrits dans sa copie en mémoire ou dans un fichier temporaire anonyme."""
+
+        shape = (self.nb_electors, self.nb_candidates)
+        if self.ranks is None or self.ranks.shape != shape or not self.ranks.flags.writeable:
+            dtype = _rank_dtype(self.nb_candidates)
+            if self.mode == "r+":
+                self.ranks = np.lib.format.open_memmap(os.path.join(self.directory, RANKS_FILE), mode="w+",
+                                                       dtype=dtype, shape=shape)
+            else:
+                self.ranks = np.memmap(tempfile.TemporaryFile(), mode="w+", dtype=dtype, shape=shape)
+        for start, stop in self.bounds():
+            chunk = Profile(self.candidates, self.positions[start:stop])
+            self.ranks[start:stop] = np.argsort(chunk.get_distances(), axis=1, kind="stable")
+        if self.mode == "r+":
+            self.ranks.flush()
+
+    def set_weights(self, weights: Sequence[int]) -> None:
+        """Remplace les poids des électeurs dans le fichier des poids.
+
+        Args:
+            weights (Sequence[int]): Les nouveaux poids, un par électeur.
+        """
+
+        self.weights[:] = weights
+
+    def positions_sum(self) -> tuple[float, float]:
+        """Calcule la somme des positions des électeurs bloc par bloc.
+
+        Returns:
+            tuple[float, float]: La somme des abscisses et la somme des ordonnées.
+        """
+
+        total = np.zeros(2, dtype=np.float64)
+        for start, stop in self.bounds():
+            total += self.positions[start:stop].sum(axis=0)
+        return float(total[0]), float(total[1])
+
+    def flush(self) -> None:
+        """Écrit sur disque les modifications des tableaux projetés, si le profil a été ouvert en écriture."""
+
+        if self.mode != "r+":
+            return
+        for array in self._maps + [self.ranks]:
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def _resize(self, nb_electors: int) -> None:
+        """Le nombre des électeurs d'un profil sur disque est fixé à sa création.
+
+        Raises:
+            ValueError: Toujours.
+        """
+
+        raise ValueError("The number of electors of a mapped profile is fixed at creation")
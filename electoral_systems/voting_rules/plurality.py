@@ -3,13 +3,15 @@
 from typing import List, Optional
 from .constants import PLURALITY_SIMPLE, PLURALITY_2_ROUNDS
 
-from .utls import duels_type, init_scores, sort_cand_by_value, apply_voting_rule_rounds
+from .profile import Profile
+from .scoring import apply_positional
+from .utls import duels_type, apply_voting_rule_rounds
 
 from people import Candidate, Elector
 
 
 def apply_plurality_simple(electors: List[Elector], candidates: List[Candidate],
-                           duels: Optional[duels_type] = None) -> List[Candidate]:
+                           duels: Optional[duels_type] = None, profile: Optional[Profile] = None) -> List[Candidate]:
     """Applique la règle de vote *Pluralité à 1 tour*. Il n'est possible d'appliquer cette règle de vote que s'il existe au 
     moins 2 candidats.  
     Principe d'une règle de vote *Pluralité à 1 tour*:  
@@ -18,24 +20,23 @@ def apply_plurality_simple(electors: List[Elector], candidates: List[Candidate],
 
     Args:
         electors (List[people.elector.Elector]): Une liste de tous les électeurs participant à une élection.
-            Leur liste `candidates_ranked` doit être remplie.
+            Leur liste `candidates_ranked` doit être remplie si `profile` n'est pas donné.
         candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
         duels (electoral_systems.voting_rules.utls.duels_type): Un dictionnaire qui associe à chaque duel des candidats
             (gagnant, perdant) le nombre des fois que le candidat-gagnant a battu le candidat-perdant. Default = `None`.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il n'est pas donné,
+            il est construit à partir des listes `candidates_ranked` des électeurs. Default = `None`.
         
     Returns:
         List[people.candidate.Candidate]:  Une liste des candidats triés dans l'ordre décroissant selon leurs scores dans
             la règle de vote *Pluralité à 1 tour*
     """
 
-    init_scores(candidates, PLURALITY_SIMPLE, 0)
-    for elector in electors:
-        elector.candidates_ranked[0].add_score(
-            PLURALITY_SIMPLE, elector.weight)
-    return sort_cand_by_value(candidates, PLURALITY_SIMPLE, len(electors), duels)
+    return apply_positional(electors, candidates, duels, profile, voting_rule=PLURALITY_SIMPLE)
 
 
-def apply_plurality_rounds(electors: List[Elector], candidates: List[Candidate]) -> List[List[Candidate]]:
+def apply_plurality_rounds(electors: List[Elector], candidates: List[Candidate],
+                           profile: Optional[Profile] = None) -> List[List[Candidate]]:
     """Applique une règle de vote *Pluralité à 2 tours*. Il n'est possible d'appliquer cette règle du vote que s'il existe 
     au moins 3 candidats.  
     Principe d'une règle de vote *Pluralité à 2 tours*:   
@@ -49,8 +50,10 @@ def apply_plurality_rounds(electors: List[Elector], candidates: List[Candidate])
 
     Args:
         electors (List[people.elector.Elector]): Une liste de tous les électeurs participant à une élection.
-            Leur liste `candidates_ranked` doit être remplie.
+            Leur liste `candidates_ranked` doit être remplie si `profile` n'est pas donné.
         candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il n'est pas donné,
+            il est construit à partir des listes `candidates_ranked` des électeurs. Default = `None`.
 
     Returns:
         List[people.candidate.Candidate]: Une liste des listes (classement dans l'ordre décroissant) des candidats par tour. La longueur de la liste correpond
@@ -60,5 +63,5 @@ def apply_plurality_rounds(electors: List[Elector], candidates: List[Candidate])
     max_rounds = 2
     elimination_index = 2  # i.e. on ne considère que 2 premiers candidats dans le 2ème tour
     res = apply_voting_rule_rounds(
-        electors, candidates, PLURALITY_2_ROUNDS, max_rounds, elimination_index)
+        electors, candidates, PLURALITY_2_ROUNDS, max_rounds, elimination_index, profile)
     return res
@@ -0,0 +1,342 @@
+"""Un module qui fournit un profil de préférences d'une élection stocké sous forme de tableaux NumPy.
+Le profil remplace les listes `candidates_ranked` de chaque électeur: les classements de tous les électeurs
+sont stockés dans une seule matrice d'entiers (E×C) où E est le nombre des électeurs et C le nombre des candidats.
+Les règles de vote du paquet `electoral_systems.voting_rules` lisent directement cette matrice."""
+
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from people import Candidate, Elector
+
+# Pour une génération des docs uniquement
+__pdoc__ = {
+    '_rank_dtype': True,
+    'Profile._resize': True,
+}
+
+_ROW_ARRAYS = ("positions", "weights", "knowledge", "ranks", "distances")
+"""Les noms des tableaux du profil qui ont une ligne par électeur."""
+
+
+def _rank_dtype(nb_candidates: int) -> np.dtype:
+    """Retourne le plus petit type d'entier non signé capable de stocker un indice de candidat.
+
+    Args:
+        nb_candidates (int): Le nombre des candidats.
+
+    Returns:
+        numpy.dtype: `uint8`, `uint16` ou `uint32`.
+    """
+
+    if nb_candidates <= np.iinfo(np.uint8).max + 1:
+        return np.dtype(np.uint8)
+    if nb_candidates <= np.iinfo(np.uint16).max + 1:
+        return np.dtype(np.uint16)
+    return np.dtype(np.uint32)
+
+
+def index_candidates(candidates: Sequence[Candidate]) -> None:
+    """Attribue à chaque candidat son indice dense (`people.candidate.Candidate.index`) dans `candidates`.
+    Les structures de calcul (classements, duels, scores) utilisent cet indice au lieu de hacher les candidats.
+
+    Args:
+        candidates (Sequence[people.candidate.Candidate]): Les candidats, dans l'ordre des lignes des matrices.
+    """
+
+    for i, candidate in enumerate(candidates):
+        candidate.index = i
+
+
+class Profile:
+    """Un profil de préférences. Les candidats sont identifiés par leur indice dans la liste `candidates`,
+    les électeurs par leur indice de ligne dans les tableaux."""
+
+    def __init__(self, candidates: Sequence[Candidate], positions: np.ndarray,
+                 weights: Optional[np.ndarray] = None, knowledge: Optional[np.ndarray] = None,
+                 ranks: Optional[np.ndarray] = None):
+        """Initialise un profil. Si `ranks` n'est pas donné, un appel à `Profile.rank()` est nécessaire
+        avant d'appliquer une règle de vote.
+
+        Args:
+            candidates (Sequence[people.candidate.Candidate]): Les candidats. L'ordre définit l'indice de chaque candidat.
+            positions (numpy.ndarray): Les positions des électeurs, un tableau (E×2).
+            weights (Optional[numpy.ndarray]): Les poids des électeurs, un tableau (E,). Par défaut, tous les poids valent 1.
+            knowledge (Optional[numpy.ndarray]): Les taux de connaissance des électeurs, un tableau (E,).
+                Par défaut, tous valent 0.
+            ranks (Optional[numpy.ndarray]): Les classements des électeurs, une matrice (E×C) des indices des candidats
+                dans l'ordre décroissant des préférences.
+        """
+
+        self.candidates: List[Candidate] = list(candidates)
+        """Une liste des candidats. L'indice d'un candidat dans cette liste est utilisé dans toutes les matrices."""
+        index_candidates(self.candidates)
+
+        self.positions: np.ndarray = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        """Les positions des électeurs sur la carte politique, un tableau (E×2)."""
+
+        nb_electors = self.positions.shape[0]
+
+        self.weights: np.ndarray = (np.ones(nb_electors, dtype=np.int64) if weights is None
+                                    else np.asarray(weights, dtype=np.int64))
+        """Les poids des électeurs, un tableau (E,)."""
+
+        self.knowledge: np.ndarray = (np.zeros(nb_electors, dtype=np.float64) if knowledge is None
+                                      else np.asarray(knowledge, dtype=np.float64))
+        """Les taux de connaissance des électeurs, un tableau (E,)."""
+
+        self.ranks: Optional[np.ndarray] = ranks
+        """Une matrice (E×C) dont la ligne `e` est le classement de l'électeur `e` (les indices des candidats,
+        du plus préféré au moins préféré). `None` tant que `Profile.rank()` n'a pas été appelée."""
+
+        self.distances: Optional[np.ndarray] = None
+        """Une matrice (E×C) des distances euclidiennes entre chaque électeur et chaque candidat.
+        Remplie par `Profile.get_distances()`."""
+
+        # Les tableaux sous-jacents (avec une capacité de réserve) utilisés par `Profile.append()`
+        self._buffers: Dict[str, np.ndarray] = dict()
+
+    @classmethod
+    def from_electors(cls, electors: Sequence[Elector], candidates: Sequence[Candidate]) -> 'Profile':
+        """Construit un profil (non classé) à partir des positions, des poids et des taux de connaissance des électeurs.
+
+        Args:
+            electors (Sequence[people.elector.Elector]): Les électeurs.
+            candidates (Sequence[people.candidate.Candidate]): Les candidats.
+
+        Returns:
+            electoral_systems.voting_rules.profile.Profile: Un nouveau profil. Les classements ne sont pas encore calculés.
+        """
+
+        nb_electors = len(electors)
+        positions = np.fromiter((coord for e in electors for coord in e.position),
+                                dtype=np.float64, count=2 * nb_electors)
+        weights = np.fromiter((e.weight for e in electors), dtype=np.int64, count=nb_electors)
+        knowledge = np.fromiter((e.knowledge for e in electors), dtype=np.float64, count=nb_electors)
+        return cls(candidates, positions, weights, knowledge)
+
+    @classmethod
+    def from_rankings(cls, electors: Sequence[Elector], candidates: Sequence[Candidate]) -> 'Profile':
+        """Construit un profil à partir des listes `candidates_ranked` déjà remplies des électeurs.
+        Utile quand les classements ont été définis manuellement (par exemple, dans les tests).
+
+        Args:
+            electors (Sequence[people.elector.Elector]): Les électeurs dont les listes `candidates_ranked` sont remplies.
+            candidates (Sequence[people.candidate.Candidate]): Les candidats.
+
+        Returns:
+            electoral_systems.voting_rules.profile.Profile: Un nouveau profil avec les classements des électeurs.
+        """
+
+        profile = cls.from_electors(electors, candidates)
+        ranks = np.empty((len(electors), len(profile.candidates)), dtype=_rank_dtype(len(profile.candidates)))
+        for row, elector in enumerate(electors):
+            ranks[row] = [candidate.index for candidate in elector.candidates_ranked]
+        profile.ranks = ranks
+        return profile
+
+    @property
+    def nb_electors(self) -> int:
+        """Le nombre des électeurs du profil."""
+        return self.positions.shape[0]
+
+    @property
+    def nb_candidates(self) -> int:
+        """Le nombre des candidats du profil."""
+        return len(self.candidates)
+
+    def __len__(self) -> int:
+        return self.nb_electors
+
+    def chunks(self) -> Iterator['Profile']:
+        """Itère sur le profil par blocs de lignes. Les décomptes des règles de vote et les duels sont des sommes
+        sur les blocs. Un profil en mémoire est un seul bloc, un profil sur disque
+        (cf. `electoral_systems.voting_rules.mapped_profile.MappedProfile`) en a plusieurs.
+
+        Returns:
+            Iterator[electoral_systems.voting_rules.profile.Profile]: Les profils des blocs, dans l'ordre des lignes.
+        """
+
+        yield self
+
+    def candidates_positions(self) -> np.ndarray:
+        """Retourne les positions des candidats.
+
+        Returns:
+            numpy.ndarray: Un tableau (C×2) des positions des candidats.
+        """
+
+        return np.array([c.position for c in self.candidates], dtype=np.float64).reshape(-1, 2)
+
+    def get_distances(self) -> np.ndarray:
+        """Retourne la matrice des distances entre les électeurs et les candidats. Elle est calculée en une seule opération
+        vectorisée lors du premier appel, puis gardée dans `distances`.
+
+        Returns:
+            numpy.ndarray: Une matrice (E×C) des distances euclidiennes.
+        """
+
+        if self.distances is None:
+            cand_positions = self.candidates_positions()
+            diff_x = cand_positions[np.newaxis, :, 0] - self.positions[:, 0, np.newaxis]
+            diff_y = cand_positions[np.newaxis, :, 1] - self.positions[:, 1, np.newaxis]
+            self.distances = np.sqrt(diff_x ** 2 + diff_y ** 2)
+        return self.distances
+
+    def rank(self) -> None:
+        """Classe les candidats pour chaque électeur: calcule toutes les distances électeur-candidat en une seule opération
+        vectorisée, puis trie chaque ligne avec un seul `argsort`. Le tri est stable, i.e. en cas d'égalité des distances,
+        l'ordre de la liste `candidates` est conservé (comme `people.elector.Elector.pos_to_rank`).
+        """
+
+        self.distances = None
+        self.ranks = np.argsort(self.get_distances(), axis=1, kind="stable").astype(
+            _rank_dtype(self.nb_candidates), copy=False)
+
+    def update_candidates(self, indices: Sequence[int]) -> tuple[np.ndarray, np.ndarray]:
+        """MAJ du profil après le déplacement de certains candidats: seules les colonnes des distances de ces candidats
+        sont recalculées, puis seuls les classements qui ne sont plus triés sont recalculés. Le résultat est identique
+        à celui de `Profile.rank()`. Les classements modifiés sur place depuis le dernier tri (par exemple, lors d'un sondage)
+        sont aussi triés à nouveau.
+
+        Args:
+            indices (Sequence[int]): Les indices des candidats qui ont bougé.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Les indices de ligne des électeurs dont le classement a été trié à nouveau
+                et leurs classements avant le tri, une matrice (len(rows)×C).
+        """
+
+        distances = self.get_distances()
+        indices = np.asarray(indices, dtype=np.intp)
+        if indices.size:
+            cand_positions = self.candidates_positions()[indices]
+            diff_x = cand_positions[np.newaxis, :, 0] - self.positions[:, 0, np.newaxis]
+            diff_y = cand_positions[np.newaxis, :, 1] - self.positions[:, 1, np.newaxis]
+            distances[:, indices] = np.sqrt(diff_x ** 2 + diff_y ** 2)
+
+        # Un classement est trié ssi chaque candidat est plus proche que le suivant (ou à égalité, avec un indice inférieur)
+        ranks = self.ranks.astype(np.intp)
+        ranked = np.take_along_axis(distances, ranks, axis=1)
+        closer = ranked[:, :-1] < ranked[:, 1:]
+        tied_in_order = (ranked[:, :-1] == ranked[:, 1:]) & (ranks[:, :-1] < ranks[:, 1:])
+        rows = np.flatnonzero(~(closer | tied_in_order).all(axis=1))
+        old_ranks = self.ranks[rows]
+        self.ranks[rows] = np.argsort(distances[rows], axis=1, kind="stable")
+        return rows, old_ranks
+
+    def set_weights(self, weights: Sequence[int]) -> None:
+        """Remplace les poids des électeurs (par exemple, après des délégations).
+
+        Args:
+            weights (Sequence[int]): Les nouveaux poids, un par électeur.
+        """
+
+        self.weights = np.asarray(weights, dtype=np.int64)
+
+    def _resize(self, nb_electors: int) -> None:
+        """Change le nombre des lignes de tous les tableaux par électeur. Les tableaux sont des vues sur des tableaux
+        sous-jacents dont la capacité double quand elle est insuffisante: un ajout coûte O(C) en moyenne.
+
+        Args:
+            nb_electors (int): Le nouveau nombre des électeurs.
+        """
+
+        for name in _ROW_ARRAYS:
+            array = getattr(self, name)
+            if array is None:
+                continue
+            buffer = self._buffers.get(name)
+            if buffer is None or array.base is not buffer or buffer.shape[0] < nb_electors:
+                capacity = max(nb_electors, 2 * array.shape[0], 16)
+                buffer = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+                buffer[:min(array.shape[0], nb_electors)] = array[:nb_electors]
+                self._buffers[name] = buffer
+            setattr(self, name, buffer[:nb_electors])
+
+    def append(self, position: tuple[float, float], weight: int = 1, knowledge: float = 0) -> int:
+        """Ajoute un électeur à la fin du profil. Si le profil est déjà classé, calcule ses distances aux candidats
+        et son classement (un tri stable de C distances).
+
+        Args:
+            position (tuple[float, float]): La position de l'électeur.
+            weight (int): Le poids de l'électeur. Default = 1.
+            knowledge (float): Le taux de connaissance de l'électeur. Default = 0.
+
+        Returns:
+            int: L'indice de ligne du nouvel électeur.
+        """
+
+        return int(self.extend([position], [weight], [knowledge])[0])
+
+    def extend(self, positions: np.ndarray, weights: Optional[np.ndarray] = None,
+               knowledge: Optional[np.ndarray] = None) -> np.ndarray:
+        """Ajoute plusieurs électeurs à la fin du profil en une seule opération. Si le profil est déjà classé,
+        calcule leurs distances aux candidats et leurs classements (un seul tri stable).
+
+        Args:
+            positions (numpy.ndarray): Les positions des électeurs, un tableau (N×2).
+            weights (Optional[numpy.ndarray]): Les poids des électeurs, un tableau (N,). Default = `None`, tous égaux à 1.
+            knowledge (Optional[numpy.ndarray]): Les taux de connaissance des électeurs, un tableau (N,).
+                Default = `None`, tous égaux à 0.
+
+        Returns:
+            numpy.ndarray: Les indices de ligne des nouveaux électeurs.
+        """
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        start, stop = self.nb_electors, self.nb_electors + len(positions)
+        self._resize(stop)
+        self.positions[start:stop] = positions
+        self.weights[start:stop] = 1 if weights is None else weights
+        self.knowledge[start:stop] = 0 if knowledge is None else knowledge
+
+        if self.distances is not None or self.ranks is not None:
+            cand_positions = self.candidates_positions()
+            diff_x = cand_positions[np.newaxis, :, 0] - positions[:, 0, np.newaxis]
+            diff_y = cand_positions[np.newaxis, :, 1] - positions[:, 1, np.newaxis]
+            distances = np.sqrt(diff_x ** 2 + diff_y ** 2)
+            if self.distances is not None:
+                self.distances[start:stop] = distances
+            if self.ranks is not None:
+                self.ranks[start:stop] = np.argsort(distances, axis=1, kind="stable")
+        return np.arange(start, stop)
+
+    def remove(self, row: int) -> None:
+        """Supprime un électeur du profil en O(C): la dernière ligne prend la place de la ligne supprimée.
+
+        Args:
+            row (int): L'indice de ligne de l'électeur à supprimer.
+        """
+
+        last = self.nb_electors - 1
+        for name in _ROW_ARRAYS:
+            array = getattr(self, name)
+            if array is not None:
+                array[row] = array[last]
+        self._resize(last)
+
+    def rank_positions(self) -> np.ndarray:
+        """Retourne la position de chaque candidat dans le classement de chaque électeur (l'inverse de `ranks`).
+
+        Returns:
+            numpy.ndarray: Une matrice (E×C) dont la case `[e, c]` est la place du candidat `c` dans le classement
+                de l'électeur `e` (0 pour le candidat préféré).
+        """
+
+        positions = np.empty_like(self.ranks)
+        np.put_along_axis(positions, self.ranks.astype(np.intp),
+                          np.arange(self.nb_candidates, dtype=self.ranks.dtype)[np.newaxis, :], axis=1)
+        return positions
+
+    def ranked_candidates(self, row: int) -> List[Candidate]:
+        """Retourne le classement d'un électeur sous forme de liste des candidats.
+
+        Args:
+            row (int): L'indice d'un électeur dans le profil.
+
+        Returns:
+            List[people.candidate.Candidate]: Le classement, du plus préféré au moins préféré.
+        """
+
+        return [self.candidates[i] for i in self.ranks[row]]
@@ -0,0 +1,167 @@
+"""Un module qui fournit un moteur générique pour les règles de vote positionnelles (*scoring rules*).
+Une règle positionnelle est définie par un vecteur des scores `s` de longueur C: le candidat placé à la position `k`
+dans le classement d'un électeur reçoit `s[k]` points (multipliés par le poids de l'électeur).
+Les scores de tous les candidats sont calculés en une seule opération à partir de la matrice des positions
+(cf. `position_counts()`), sans boucle sur les électeurs.
+
+Les règles *Pluralité à 1 tour*, *Borda* et *Veto* sont des configurations de ce moteur. D'autres vecteurs
+(k-approbation, Dowdall, Borda tronqué, ...) peuvent être ajoutés avec `register_score_vector()`."""
+
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .constants import PLURALITY_SIMPLE, BORDA, VETO
+from .profile import Profile
+from .utls import duels_type, get_profile, set_scores, sort_cand_by_value
+
+from people import Candidate, Elector
+
+score_vector_type = Callable[[int], Sequence[float]]
+"""Un type d'une fonction qui, étant donné le nombre des candidats C, retourne un vecteur des scores de longueur C."""
+
+
+def plurality_vector(nb_candidates: int) -> List[int]:
+    """Le vecteur des scores de la règle *Pluralité à 1 tour*: `(1, 0, ..., 0)`."""
+
+    return [1] + [0] * (nb_candidates - 1)
+
+
+def borda_vector(nb_candidates: int) -> List[int]:
+    """Le vecteur des scores de la règle *Borda*: `(C-1, C-2, ..., 0)`."""
+
+    return list(range(nb_candidates - 1, -1, -1))
+
+
+def veto_vector(nb_candidates: int) -> List[int]:
+    """Le vecteur des scores de la règle *Veto*: `(1, ..., 1, 0)`."""
+
+    return [1] * (nb_candidates - 1) + [0]
+
+
+def dowdall_vector(nb_candidates: int) -> List[float]:
+    """Le vecteur des scores de la règle *Dowdall* (Nauru): `(1, 1/2, 1/3, ..., 1/C)`."""
+
+    return [1 / (k + 1) for k in range(nb_candidates)]
+
+
+def k_approval(k: int) -> score_vector_type:
+    """Construit le vecteur des scores de la règle *k-approbation*: les `k` premiers candidats reçoivent 1 point,
+    les autres 0 point.
+
+    Args:
+        k (int): Le nombre des candidats approuvés par chaque électeur.
+
+    Returns:
+        electoral_systems.voting_rules.scoring.score_vector_type: Une fonction qui retourne le vecteur des scores.
+    """
+
+    def vector(nb_candidates: int) -> List[int]:
+        nb_approved = min(k, nb_candidates)
+        return [1] * nb_approved + [0] * (nb_candidates - nb_approved)
+
+    return vector
+
+
+def truncated_borda(k: int) -> score_vector_type:
+    """Construit le vecteur des scores de la règle *Borda tronqué*: seuls les `k` premiers candidats reçoivent des points,
+    `k` points pour le premier, `k-1` pour le deuxième, et ainsi de suite. Les autres reçoivent 0 point.
+
+    Args:
+        k (int): Le nombre des candidats qui reçoivent des points.
+
+    Returns:
+        electoral_systems.voting_rules.scoring.score_vector_type: Une fonction qui retourne le vecteur des scores.
+    """
+
+    def vector(nb_candidates: int) -> List[int]:
+        return [max(k - position, 0) for position in range(nb_candidates)]
+
+    return vector
+
+
+SCORE_VECTORS: Dict[str, score_vector_type] = {
+    PLURALITY_SIMPLE: plurality_vector,
+    BORDA: borda_vector,
+    VETO: veto_vector,
+}
+"""Un dictionnaire qui associe à chaque constante d'une règle de vote positionnelle la fonction de son vecteur des scores."""
+
+
+def register_score_vector(voting_rule: str, vector: score_vector_type) -> None:
+    """Enregistre une nouvelle règle de vote positionnelle (ou remplace une règle existante).
+
+    Args:
+        voting_rule (str): Une constante associée à la règle de vote.
+        vector (electoral_systems.voting_rules.scoring.score_vector_type): Une fonction qui retourne le vecteur des scores
+            étant donné le nombre des candidats.
+    """
+
+    SCORE_VECTORS[voting_rule] = vector
+
+
+def position_counts(profile: Profile) -> np.ndarray:
+    """Calcule la matrice des positions pondérée avec un seul `bincount` par bloc de la matrice des classements.
+
+    Args:
+        profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks` est remplie.
+
+    Returns:
+        numpy.ndarray: Une matrice (C×C) des entiers dont la case `[k, c]` est la somme des poids des électeurs
+            qui placent le candidat `c` à la position `k`.
+    """
+
+    nb_candidates = profile.nb_candidates
+    counts = np.zeros(nb_candidates * nb_candidates, dtype=np.float64)
+    for chunk in profile.chunks():
+        # Indice aplati (position, candidat) de chaque case de la matrice des classements
+        flat = np.arange(nb_candidates, dtype=np.intp) * nb_candidates + chunk.ranks
+        counts += np.bincount(flat.ravel(), weights=np.repeat(chunk.weights, nb_candidates),
+                              minlength=nb_candidates * nb_candidates)
+    return np.rint(counts).astype(np.int64).reshape(nb_candidates, nb_candidates)
+
+
+def positional_scores(profile: Profile, vector: Sequence[float]) -> np.ndarray:
+    """Calcule les scores de tous les candidats selon un vecteur des scores.
+
+    Args:
+        profile (electoral_systems.voting_rules.profile.Profile): Un profil de préférences dont la matrice `ranks` est remplie.
+        vector (Sequence[float]): Un vecteur des scores de longueur C.
+
+    Returns:
+        numpy.ndarray: Un tableau (C,) des scores, dans l'ordre de `profile.candidates`. Les scores sont entiers
+            si le vecteur ne contient que des entiers.
+    """
+
+    vector = np.asarray(vector)
+    if vector.shape != (profile.nb_candidates,):
+        raise ValueError(f"Score vector of length {vector.size} given for {profile.nb_candidates} candidates")
+    return vector @ position_counts(profile)
+
+
+def apply_positional(electors: List[Elector], candidates: List[Candidate], duels: Optional[duels_type] = None,
+                     profile: Optional[Profile] = None, *, voting_rule: str,
+                     vector: Optional[Sequence[float]] = None) -> List[Candidate]:
+    """Applique une règle de vote positionnelle.
+
+    Args:
+        electors (List[people.elector.Elector]): Une liste de tous les électeurs participant à une élection.
+            Leur liste `candidates_ranked` doit être remplie si `profile` n'est pas donné.
+        candidates (List[people.candidate.Candidate]): Une liste de tous les candidats qui participent à une élection.
+        duels (electoral_systems.voting_rules.utls.duels_type): Un dictionnaire qui associe à chaque duel des candidats
+            (gagnant, perdant) le nombre des fois que le candidat-gagnant a battu le candidat-perdant. Default = `None`.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences. S'il n'est pas donné,
+            il est construit à partir des listes `candidates_ranked` des électeurs. Default = `None`.
+        voting_rule (str): Une constante associée à la règle de vote. Les scores des candidats sont stockés sous cette clé.
+        vector (Optional[Sequence[float]]): Un vecteur des scores de longueur C. S'il n'est pas donné, il est obtenu
+            à partir du registre `SCORE_VECTORS`. Default = `None`.
+
+    Returns:
+        List[people.candidate.Candidate]: Une liste des candidats triés dans l'ordre décroissant selon leurs scores.
+    """
+
+    profile = get_profile(electors, candidates, profile)
+    if vector is None:
+        vector = SCORE_VECTORS[voting_rule](profile.nb_candidates)
+    set_scores(profile.candidates, voting_rule, positional_scores(profile, vector))
+    return sort_cand_by_value(candidates, voting_rule, profile.nb_electors, duels)
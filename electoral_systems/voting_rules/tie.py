@@ -1,11 +1,22 @@
-"""Un module fournit la fonctionnalité pour résoudre les égalités en fonction des duels entre les candidats."""
+"""Un module fournit la fonctionnalité pour résoudre les égalités en fonction des duels entre les candidats.
+`tie_break_keys` calcule, à partir de la matrice de majorité, une clé de tri qui donne le même classement
+que les échanges 2 à 2 de `resolve_ties`."""
 
 from itertools import combinations
-from typing import List, Dict
+from typing import List, Mapping
+
+import numpy as np
 
 from people import Candidate
+from .duels import Duels
+
+# Pour une génération des docs uniquement
+__pdoc__ = {
+    '_beats': True,
+    '_group_keys': True,
+}
 
-duels_type = Dict[tuple[Candidate, Candidate], int]
+duels_type = Mapping[tuple[Candidate, Candidate], int]
 
 
 def get_ties(ranking: List[Candidate], voting_rule: str) -> List[List[int]]:
@@ -65,3 +76,81 @@ def resolve_ties(ranking: List[Candidate], nb_electors: int, voting_rule: str, d
                 if (nb_electors % 2 == 0 and duels[(candidate2, candidate1)] == nb_electors // 2):
                     continue
                 ranking[index1], ranking[index2] = ranking[index2], ranking[index1]
+
+
+def _beats(group: List[Candidate], nb_electors: int, duels: duels_type) -> np.ndarray:
+    """Retourne une matrice (k×k) des booléens dont la case `[a, b]` vaut `True` si `resolve_ties` place le candidat
+    `group[a]` devant `group[b]`: le duel (`group[a]`, `group[b]`) existe et ce n'est pas une égalité
+    (un nombre pair d'électeurs et un score égal à la moitié).
+
+    Args:
+        group (List[people.candidate.Candidate]): Les candidats d'une égalité.
+        nb_electors (int): Un nombre des électeurs qui participent à une élection.
+        duels (electoral_systems.voting_rules.utls.duels_type): Les duels. Si ce sont des
+            `electoral_systems.voting_rules.duels.Duels`, la matrice de majorité est lue directement.
+
+    Returns:
+        numpy.ndarray: Une matrice (k×k) des booléens.
+    """
+
+    if isinstance(duels, Duels):
+        indices = np.fromiter((candidate.index for candidate in group), dtype=np.intp, count=len(group))
+        scores = duels.matrix[np.ix_(indices, indices)]
+        # En cas d'égalité, le gagnant du duel est le candidat placé le premier dans la matrice (cf. Duels)
+        beats = (scores > scores.T) | ((scores == scores.T) & (indices[:, np.newaxis] < indices))
+    else:
+        scores = np.array([[duels.get((a, b), -1) for b in group] for a in group], dtype=np.int64)
+        beats = (scores >= 0) & (scores.T < 0)
+    if nb_electors % 2 == 0:
+        beats &= scores != nb_electors // 2
+    return beats
+
+
+def _group_keys(beats: np.ndarray) -> np.ndarray:
+    """Retourne la place de chaque candidat d'une égalité après sa résolution par les duels.
+
+    Args:
+        beats (numpy.ndarray): Une matrice (k×k) des victoires dans l'ordre initial des candidats (cf. `_beats`).
+
+    Returns:
+        numpy.ndarray: Un tableau (k,) des places (de 0 à k-1).
+    """
+
+    size = beats.shape[0]
+    wins = beats.sum(axis=1)
+    # Les victoires forment un ordre total: le nombre de victoires dans l'égalité suffit
+    if np.array_equal(np.sort(wins), np.arange(size)):
+        return size - 1 - wins
+
+    # Sinon (un cycle ou un duel à égalité), le résultat des échanges 2 à 2 dépend de l'ordre initial
+    order = list(range(size))
+    for index1, index2 in combinations(range(size), 2):
+        if beats[order[index2], order[index1]]:
+            order[index1], order[index2] = order[index2], order[index1]
+    keys = np.empty(size, dtype=np.intp)
+    keys[order] = np.arange(size)
+    return keys
+
+
+def tie_break_keys(ranking: List[Candidate], scores: np.ndarray, nb_electors: int, duels: duels_type) -> np.ndarray:
+    """Calcule une clé de tri qui résout les égalités selon les duels. Trier `ranking` selon (`scores`, clé)
+    donne le même classement que `resolve_ties`. Seuls les duels à l'intérieur d'une égalité sont lus.
+
+    Args:
+        ranking (List[Candidate]): Un classement des candidats triés selon `scores` (puis par l'ordre alphabétique).
+        scores (numpy.ndarray): Un tableau (C,) des clés de tri des scores dans l'ordre de `ranking`.
+        nb_electors (int): Un nombre des électeurs qui participent à une élection.
+        duels (electoral_systems.voting_rules.utls.duels_type): Un dictionnaire qui associe à chaque duel des candidats
+            (gagnant, perdant) le nombre de fois que le candidat-gagnant a battu le candidat-perdant.
+
+    Returns:
+        numpy.ndarray: Un tableau (C,) des places de chaque candidat dans son égalité (0 s'il n'est pas à égalité).
+    """
+
+    keys = np.zeros(len(ranking), dtype=np.intp)
+    starts = np.flatnonzero(np.r_[True, scores[1:] != scores[:-1]])
+    ends = np.r_[starts[1:], len(ranking)]
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if end - start > 1:
+            keys[start:end] = _group_keys(_beats(ranking[start:end], nb_electors, duels))
+    return keys
@@ -1,23 +1,43 @@
 """Un module qui fournit les fonctions auxiliaires nécessaires pour appliquer les différentes règles de vote.
 De plus, il permet de factoriser des algorithmes pour les règles de vote à plusieurs tours."""
 
-from itertools import combinations, permutations
-from typing import Dict, List, Union, Optional
+from typing import List, Mapping, Union, Optional
 
-from .tie import resolve_ties
+import numpy as np
+
+from .duels import Duels
+from .elimination import EliminationRounds
+from .profile import Profile
+from .tie import tie_break_keys
 from people import Candidate, Elector
 
 # Pour une génération des docs uniquement
 __pdoc__ = {
     '_has_majority':True,
-    '_simplify_duels':True,
     '_set_score_round':True,
-    '_choose_next_cand':True,
 }
 
-duels_type = Dict[tuple[Candidate, Candidate], int]
+duels_type = Mapping[tuple[Candidate, Candidate], int]
 """Un type des données des duels entre les candidat."""
 
+def get_profile(electors: List[Elector], candidates: List[Candidate], profile: Optional[Profile] = None) -> Profile:
+    """Retourne le profil de préférences à utiliser dans une règle de vote. Si `profile` est donné (le cas d'une élection),
+    il est retourné tel quel. Sinon, un profil est construit à partir des listes `candidates_ranked` des électeurs.
+
+    Args:
+        electors (List[people.elector.Elector]): Une liste des électeurs participant à une élection.
+        candidates (List[people.candidate.Candidate]): Une liste des candidats participant à une élection.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil déjà classé. Default = `None`.
+
+    Returns:
+        electoral_systems.voting_rules.profile.Profile: Un profil dont la matrice `ranks` est remplie.
+    """
+
+    if profile is not None:
+        return profile
+    return Profile.from_rankings(electors, candidates)
+
+
 def init_scores(candidates: List[Candidate], voting_rule: str,
                 new_score: Union[int, float, List[int]], list_type: Optional[bool] = False) -> None:
     """Initialise les scores avec `new_score`de tous les candidats `candidates` selon une règle de vote `voting_rule`.
@@ -34,6 +54,35 @@ def init_scores(candidates: List[Candidate], voting_rule: str,
         candidate.init_score(voting_rule, new_score, list_type)
 
 
+def weighted_count(indices: np.ndarray, weights: np.ndarray, nb_candidates: int) -> np.ndarray:
+    """Compte, pour chaque candidat, la somme des poids des électeurs dont l'indice du candidat apparaît dans `indices`.
+
+    Args:
+        indices (numpy.ndarray): Un tableau (E,) des indices des candidats (un par électeur).
+        weights (numpy.ndarray): Un tableau (E,) des poids des électeurs.
+        nb_candidates (int): Le nombre des candidats.
+
+    Returns:
+        numpy.ndarray: Un tableau (C,) des entiers.
+    """
+
+    counts = np.bincount(indices, weights=weights, minlength=nb_candidates)
+    return np.rint(counts).astype(np.int64)
+
+
+def set_scores(candidates: List[Candidate], voting_rule: str, scores: np.ndarray) -> None:
+    """Initialise les scores des candidats `candidates` selon une règle de vote `voting_rule` avec les valeurs de `scores`.
+
+    Args:
+        candidates (List[people.candidate.Candidate]): Une liste des candidats.
+        voting_rule (str): Une constante associée à une règle de vote.
+        scores (numpy.ndarray): Un tableau (C,) des scores, dans l'ordre de `candidates`.
+    """
+
+    for candidate, score in zip(candidates, scores.tolist()):
+        candidate.init_score(voting_rule, score)
+
+
 def sort_cand_by_value(candidates: List[Candidate], voting_rule: str, nb_electors: int,
                        duels: duels_type = None, scores_asc: bool = False) -> List[Candidate]:
     """Trie les candidats `candidates` selon leurs score selon une règle de vote `voting_rule`. Utiliser uniquement 
@@ -54,16 +103,16 @@ def sort_cand_by_value(candidates: List[Candidate], voting_rule: str, nb_elector
         List[people.candidate.Candidate]: Une liste des candidats triée et toutes les égalités résolues.
     """
 
-    lst = [(candidate, candidate.scores[voting_rule])
-           for candidate in candidates]
+    sign = 1 if scores_asc else -1
+    ranking = sorted(candidates, key=lambda c: (sign * c.scores[voting_rule], c.first_name, c.last_name))
+    if not duels:
+        return ranking
 
-    if not scores_asc:
-        ranking = [c for (c, _) in sorted(lst, key=lambda e: (-e[1], e[0]))]
-    else:
-        ranking = [c for (c, _) in sorted(lst, key=lambda e: (e[1], e[0]))]
-    if duels:
-        resolve_ties(ranking, nb_electors, voting_rule, duels)
-    return ranking
+    # Une seule clé lexicographique: (score, place dans l'égalité selon les duels, ordre alphabétique)
+    scores = np.array([sign * candidate.scores[voting_rule] for candidate in ranking])
+    keys = tie_break_keys(ranking, scores, nb_electors, duels)
+    order = np.lexsort((np.arange(len(ranking)), keys, scores))
+    return [ranking[i] for i in order.tolist()]
 
 
 def sort_cand_by_round(candidates: List[Candidate], voting_rule: str, round: int) -> List[Candidate]:
@@ -80,10 +129,7 @@ def sort_cand_by_round(candidates: List[Candidate], voting_rule: str, round: int
     Returns:
         List[people.candidate.Candidate]: Une liste des candidats triée et toutes les égalités résolues.
     """
-    lst = [(candidate, candidate.scores[voting_rule][round]) for candidate in candidates]
-
-    ranking = [c for (c, _) in sorted(lst, key=lambda e: (-e[1], e[0]))]
-    return ranking
+    return sorted(candidates, key=lambda c: (-c.scores[voting_rule][round], c.first_name, c.last_name))
 
 
 def _has_majority(candidates_sorted: List[Candidate], nb_electors: int, voting_rule: str, round: int) -> bool:
@@ -102,59 +148,30 @@ def _has_majority(candidates_sorted: List[Candidate], nb_electors: int, voting_r
     return candidates_sorted[0].scores[voting_rule][round] > nb_electors / 2
 
 
-def set_duels_scores(electors: List[Elector], candidates: List[Candidate]) -> duels_type:
-    """Calculee les duels et les scores pour chaque duels. 
+def set_duels_scores(electors: List[Elector], candidates: List[Candidate], profile: Optional[Profile] = None) -> duels_type:
+    """Calcule les duels et les scores pour chaque duels. Les scores sont obtenus avec une matrice de majorité pondérée
+    (cf. `electoral_systems.voting_rules.duels.majority_matrix`), calculée uniquement lors du premier accès aux duels.
 
     Args:
         electors (List[people.elector.Elector]): Une liste des électeurs participant à une élection.
         candidates (List[people.candidate.Candidate]): Une liste des candidats participant à une élection.
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences.
+            S'il n'est pas donné, les listes `candidates_ranked` des électeurs sont utilisées. Default = `None`.
     Returns:
         electoral_systems.voting_rules.utls.duels_type: Un dictionnaire dont les clés sont des paires des candidats
             (gagnant, perdant) et la valeur associé le nombre de fois que gagnant a battu perdant.
             Si (candidat1, candidat2) dans un dictionnaire, alors (candidat2, candidat1) ne sera pas présent.
             De plus, cela signifie que candidat1 a battu candidat2 plus de fois.
-            Cf. `_simplify_duels()` <electoral_systems.voting_rules.utls._simplify_duels>
+            Cf. `electoral_systems.voting_rules.duels.Duels`
     """
 
-    duels = {perm: 0 for perm in permutations(candidates, 2)}
-
-    for elector in electors:
-        pairs = combinations(elector.candidates_ranked, 2)
-        # combinations est inclus dans permutations -> pas de KeyError
-        for fst, snd in pairs:
-            if (fst, snd) in duels:
-                duels[(fst, snd)] += elector.weight
-            elif (snd, fst) in duels:
-                duels[(snd, fst)] += elector.weight
-    duels_simple = _simplify_duels(duels)
-    return duels_simple
-
-
-def _simplify_duels(duels: duels_type) -> duels_type:
-    """Élimine les redondances d'un dictionnaire des duels, i.e. si candidat1 a battu candidat2 plusieurs fois,
-    sauvegarde uniqument une clé (candidat1, candidat2) avec la valeur associé. 
-    Cf. `set_duels_scores()` <electoral_systems.voting_rules.utls.set_duels_scores>
-
-    Args:
-        duels (Utls.duels_type): Un dictionnaire des duels avec les redondances, i.e. les paires 
-        (candidat1, candidat2) et (candidat2, candidat1) sont présentes.
-
-    Returns:
-        Utls.duels_type: Un dictionnaire simplifié.
-    """
-    duels_simplified = dict()
-    for c1, c2 in duels:
-        if (c1, c2) in duels_simplified or (c2, c1) in duels_simplified:
-            continue
-        if duels[(c1, c2)] >= duels[(c2, c1)]:
-            duels_simplified[(c1, c2)] = duels[(c1, c2)]
-        else:
-            duels_simplified[(c2, c1)] = duels[(c2, c1)]
-    return duels_simplified
+    profile = get_profile(electors, candidates, profile)
+    return Duels(profile.candidates, profile=profile)
 
 
 def apply_voting_rule_rounds(electors: List[Elector], candidates: List[Candidate],
-                             voting_rule: str, max_rounds: int, elimination_index: int) -> List[List[Candidate]]:
+                             voting_rule: str, max_rounds: int, elimination_index: int,
+                             profile: Optional[Profile] = None) -> List[List[Candidate]]:
     """
     Applique une régle de vote à plusieurs tours.
 
@@ -164,17 +181,21 @@ def apply_voting_rule_rounds(electors: List[Elector], candidates: List[Candidate
         voting_rule (str): Une constante associée à une règle du vote.
         max_rounds (int): Le nombre des tours maximale qui peut exister dans une règle du vote.
         elimination_index (int): Une indice pour couper les candidats (utilisé pour couper la liste).
+        profile (Optional[electoral_systems.voting_rules.profile.Profile]): Un profil de préférences.
+            S'il n'est pas donné, les listes `candidates_ranked` des électeurs sont utilisées. Default = `None`.
 
     Returns:
         List[List[people.candidate.Candidate]]: Une liste des listes (classement dans l'ordre décroissant) des candidats par tour.
             La longueur de la liste correpond au nombre des tours effectués (peut être inférieur à `max_rounds`)
     """
     
+    profile = get_profile(electors, candidates, profile)
     init_scores(candidates, voting_rule, [0], True)
+    engine = EliminationRounds(profile)
     # Tour 0, initialisation
     curr_round = 0
-    winners_backlog = [_set_score_round(electors, candidates, voting_rule, curr_round)]
-    majority_exists = _has_majority(winners_backlog[curr_round], len(electors), voting_rule, curr_round)
+    winners_backlog = [_set_score_round(engine, candidates, voting_rule, curr_round)]
+    majority_exists = _has_majority(winners_backlog[curr_round], profile.nb_electors, voting_rule, curr_round)
 
     while (curr_round < max_rounds - 1 and (not majority_exists)):
         curr_round += 1
@@ -185,20 +206,22 @@ def apply_voting_rule_rounds(electors: List[Elector], candidates: List[Candidate
 
         cands_curr_round = winners_backlog[curr_round - 1][:elimination_index]
 
-        result_round = _set_score_round(electors, cands_curr_round, voting_rule, curr_round)
+        engine.keep(candidate.index for candidate in cands_curr_round)
+        result_round = _set_score_round(engine, cands_curr_round, voting_rule, curr_round)
 
         winners_backlog.append(result_round)
-        majority_exists = _has_majority(winners_backlog[curr_round], len(electors), voting_rule, curr_round)
+        majority_exists = _has_majority(winners_backlog[curr_round], profile.nb_electors, voting_rule, curr_round)
     return winners_backlog
 
 
-def _set_score_round(electors: List[Elector], remaining_candidates: List[Candidate],
+def _set_score_round(engine: EliminationRounds, remaining_candidates: List[Candidate],
                      voting_rule: str, round: int) -> List[Candidate]:
     """Ajoute le score pour chaque candidat qui participe encore à une élection. Utilisée pour les règles de vote
     à plusieurs tours.
 
     Args:
-        electors (List[people.elector.Elector]): Une liste des électeurs participant à une élection.
+        engine (electoral_systems.voting_rules.elimination.EliminationRounds): Un moteur d'élimination dont les candidats
+            éliminés ont déjà été retirés.
         remaining_candidates (List[people.candidate.Candidate]): Une liste des candidats qui encore participent à une élection.
         voting_rule (str): Une constante associée à une règle du vote.
         round (int): Un tour pour lequel il faut ajouter le score.
@@ -207,40 +230,7 @@ def _set_score_round(electors: List[Elector], remaining_candidates: List[Candida
         List[people.candidate.Candidate]: Une liste (classement) des candidats triée dans l'ordre décroissant dans le tour `round`.
     """
 
-    # Ajouter le score pour tout le monde
-    if round == 0:
-        for elector in electors:
-            elector.candidates_ranked[0].add_score_round(voting_rule, elector.weight, round)
-
-    else:
-        # Donner les scores pour les candidats restants
-        for elector in electors:
-            chosen_candidate = _choose_next_cand(elector, remaining_candidates)
-            chosen_candidate.add_score_round(voting_rule, elector.weight, round)
+    scores = engine.tally().tolist()
+    for candidate in remaining_candidates:
+        candidate.add_score_round(voting_rule, scores[candidate.index], round)
     return sort_cand_by_round(remaining_candidates, voting_rule, round)
-
-
-def _choose_next_cand(elector: Elector, remaining_candidates: List[Candidate]) -> Candidate:
-    """Choisit un candidat qui participe encore à une élection selon les préférences d'un électeur.
-    On choisit le premier candidat préféré d'un électeur parmi les candidats dans `remaining_candidates`.
-    Utilisée pour les règle de vote à plusieurs tours.
-
-    Args:
-        elector (people.elector.Elector): Un électeur pour qui il faudra choisir un candidat restant.
-        remaining_candidates (List[people.candidate.Candidate]): Une liste des candidats qui encore participent dans une élection.
-
-    Returns:
-        people.candidate.Candidate: Un candidat choisi. Un électeur va voter pour lui.
-    """
-
-    remaining_candidates_set = set(remaining_candidates)
-    index = 0
-    current_candidate = elector.candidates_ranked[index]
-
-    while index < len(elector.candidates_ranked) and (
-        current_candidate not in remaining_candidates_set
-    ):
-        index += 1
-        current_candidate = elector.candidates_ranked[index]
-
-    return current_candidate
@@ -13,7 +13,8 @@ from PySide6.QtWidgets import (
     QWidget,
     QFileDialog,
     QMessageBox,
-    QApplication
+    QApplication,
+    QProgressDialog
 )
 
 from .home_window_utls import SettingsWidget
@@ -21,6 +22,7 @@ from .widget_map import WidgetMap
 from .widget_results import WidgetResults
 
 from sqlite import ImportData, ExportData
+from snapshot import Snapshot
 
 
 class HomeWindow(QMainWindow):
@@ -80,11 +82,13 @@ class HomeWindow(QMainWindow):
         # Import
         self.import_with_results = QAction("Import with results", self)
         self.import_no_results = QAction("Import without results", self)
+        self.import_results_only = QAction("Import results only", self)
 
         self.import_with_results.triggered.connect(
             lambda: self.importData(True))
         self.import_no_results.triggered.connect(
             lambda: self.importData(False))
+        self.import_results_only.triggered.connect(self.importResultsOnly)
 
         # Export
         self.export_with_results = QAction("Export with results", self)
@@ -95,6 +99,13 @@ class HomeWindow(QMainWindow):
         self.export_no_results.triggered.connect(
             lambda: self.exportData(False))
 
+        # Snapshot
+        self.load_snapshot = QAction("Load snapshot", self)
+        self.save_snapshot = QAction("Save snapshot", self)
+
+        self.load_snapshot.triggered.connect(self.loadSnapshot)
+        self.save_snapshot.triggered.connect(self.saveSnapshot)
+
     def createMenus(self) -> None:
         """Initialize the menu, place sub-menus et possible options."""
 
@@ -105,11 +116,16 @@ class HomeWindow(QMainWindow):
         import_menu = file_menu.addMenu("Import")
         import_menu.addAction(self.import_with_results)
         import_menu.addAction(self.import_no_results)
+        import_menu.addAction(self.import_results_only)
 
         export_menu = file_menu.addMenu("Export")
         export_menu.addAction(self.export_with_results)
         export_menu.addAction(self.export_no_results)
 
+        snapshot_menu = file_menu.addMenu("Snapshot")
+        snapshot_menu.addAction(self.load_snapshot)
+        snapshot_menu.addAction(self.save_snapshot)
+
     @ Slot(str)
     def showPopupMsg(self, msg: str) -> None:
         """Initialize the pop-up with an alert and a corresponding message.
@@ -145,14 +161,42 @@ class HomeWindow(QMainWindow):
         if not db_file_path:
             return
 
+        progress_dialog = QProgressDialog("Importing electors...", None, 0, 100, self)
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(500)
+
+        def progress(imported: int, total: int) -> None:
+            progress_dialog.setValue(100 * imported // total if total else 100)
+            QApplication.processEvents()
+
         connection = sqlite3.connect(db_file_path)
-        success, msg = ImportData.import_people(connection, with_results)
+        success, msg = ImportData.import_people(connection, with_results, progress)
         connection.close()
+        progress_dialog.close()
         if not success:
             self.showPopupMsg(msg)
         else:
             self.sig_data_imported.emit(with_results)
 
+    @ Slot()
+    def importResultsOnly(self) -> None:
+        """Import candidates and results, electors are loaded only when they are needed
+        (cf. `sqlite.import_data.ImportData.import_people_lazy`). If an error occured, a pop-up will appear it indicating."""
+
+        db_file_path, _ = QFileDialog.getOpenFileName(
+            self, "Choose database", "", "SQLite databases : (*.db)"
+        )
+
+        # Do nothing if no file was chosen
+        if not db_file_path:
+            return
+
+        success, msg = ImportData.import_people_lazy(db_file_path)
+        if not success:
+            self.showPopupMsg(msg)
+        else:
+            self.sig_data_imported.emit(True)
+
     @ Slot(bool)
     def exportData(self, with_results: bool) -> None:
         """Export data with or without results. If an error occured, a pop-up will appear it indicating. 
@@ -171,20 +215,44 @@ class HomeWindow(QMainWindow):
             return
 
         connection = sqlite3.connect(db_file_path)
-        success, msg = ExportData.create_database_people(connection)
+        success, msg = ExportData.export(connection, with_results, with_rankings=True)
+        connection.close()
 
         if not success:
             self.showPopupMsg(msg)
             remove(db_file_path)
 
-        if success and with_results:
-            success, msg = ExportData.create_database_results(connection)
+    @ Slot()
+    def loadSnapshot(self) -> None:
+        """Load a snapshot (cf. `snapshot.snapshot.Snapshot`). All data of the election are replaced.
+        If an error occured, a pop-up will appear it indicating."""
 
-            if not success:
-                self.showPopupMsg(msg)
-                remove(db_file_path)
+        directory = QFileDialog.getExistingDirectory(self, "Choose snapshot directory")
 
-        connection.close()
+        # Do nothing if no directory was chosen
+        if not directory:
+            return
+
+        success, msg = Snapshot.load(directory)
+        if not success:
+            self.showPopupMsg(msg)
+        else:
+            self.sig_data_imported.emit(bool(self.election.results))
+
+    @ Slot()
+    def saveSnapshot(self) -> None:
+        """Save the election as a snapshot (cf. `snapshot.snapshot.Snapshot`), with results if they exist.
+        If an error occured, a pop-up will appear it indicating."""
+
+        directory = QFileDialog.getExistingDirectory(self, "Choose snapshot directory")
+
+        # Do nothing if no directory was chosen
+        if not directory:
+            return
+
+        success, msg = Snapshot.save(directory, with_results=bool(self.election.results))
+        if not success:
+            self.showPopupMsg(msg)
 
     def toggleIEOptions(self, type: str, with_results_status: bool, no_results_status: bool) -> None:
         """Toggle the options (import, export) in the menu.
@@ -201,9 +269,13 @@ class HomeWindow(QMainWindow):
         if type == ImportData.IMPORT:
             self.import_with_results.setEnabled(with_results_status)
             self.import_no_results.setEnabled(no_results_status)
+            self.import_results_only.setEnabled(with_results_status)
+            # A snapshot replaces all data, like an import with results
+            self.load_snapshot.setEnabled(with_results_status)
         if type == ExportData.EXPORT:
             self.export_with_results.setEnabled(with_results_status)
             self.export_no_results.setEnabled(no_results_status)
+            self.save_snapshot.setEnabled(no_results_status)
 
     @ Slot(bool)
     def switchWidgetImport(self, with_results: bool) -> None:
@@ -12,6 +12,7 @@ from PySide6.QtWidgets import (
 from .widget_map_utls import QuadrantMap, WidgetCheckbox, WidgetRandomSettings
 
 from electoral_systems import Election
+from electoral_systems.generation import generate_candidates, generate_electors
 
 
 class WidgetMap(QWidget):
@@ -144,15 +145,11 @@ class WidgetMap(QWidget):
         nb_candidates = self.getIntInputField(self.candidates_text_box)
         nb_electors = self.getIntInputField(self.electors_text_box)
 
-        for _ in range(nb_candidates):
-            # Normalized
-            generated_position = self.quadrant_map.generatePosition()
-            self.election.add_candidate(generated_position)
-
-        for _ in range(nb_electors):
-            # Normalized
-            generated_position = self.quadrant_map.generatePosition()
-            self.election.add_elector(generated_position)
+        # Normalized positions and parameters, generated all at once
+        generation_constants = self.election.generation_constants
+        self.election.add_candidates(*generate_candidates(generation_constants, nb_candidates))
+        positions, knowledge = generate_electors(generation_constants, nb_electors)
+        self.election.add_electors(positions, knowledge=knowledge)
 
         self.quadrant_map.update()
         self.cleanTextBoxes()
@@ -2,14 +2,8 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit
 from PySide6.QtGui import QPainter, QPen, QColor, QFont, QTransform, QColor, QPaintEvent, QMouseEvent
 from PySide6.QtCore import Qt, QPointF, QPoint, QSize
 
-from numpy import clip
-from numpy.random import normal
-from electoral_systems import Election, RandomConstants
-
-# For docs generation only
-__pdoc__ = {
-    'normal':False
-}
+from electoral_systems import Election
+from electoral_systems.generation import generate_coordinate, generate_position
 
 class QuadrantMap(QWidget):
     """A widget which represents the political map. The political map is drawn with `PySide6.QtGui.QPainter`."""
@@ -364,7 +358,8 @@ class QuadrantMap(QWidget):
 
     def generateCoordinate(self, mu: float, sigma: float, limit: float) -> float:
         """Generate a coordinate (X or Y) according to the normal distribution (`mu`, `sigma` are its parameters).
-            An absolute value of a generated coordinates is limited between `limit`. 
+            An absolute value of a generated coordinates is limited between `limit`.
+            Cf. `electoral_systems.generation.generate_coordinate`.
 
         Args:
             mu (float): The mean of the normal distribution. 
@@ -375,33 +370,14 @@ class QuadrantMap(QWidget):
             float: A generated and limited coordinate.
         """
 
-        coordinate = normal(mu, sigma)
-
-        # Max tries of a coordinate generation. Without it, an infinite loop is possible.
-        max_iterations = 5
-        while abs(coordinate) > limit and max_iterations:
-            coordinate = normal(mu, sigma)
-            max_iterations -= 1
-
-        coordinate = clip(coordinate, -limit, limit)
-
-        return coordinate
+        return generate_coordinate(mu, sigma, limit)
 
     def generatePosition(self) -> tuple[float, float]:
         """Generate a position on the political map according to the normal distribution.
+            Cf. `electoral_systems.generation.generate_position`.
 
         Returns:
             tuple[float, float]: A generated position with normalized and confined coordinates.
         """
 
-        constants = self.election.generation_constants
-        economical_constants = constants[RandomConstants.ECONOMICAL]
-        social_constants = constants[RandomConstants.SOCIAL]
-        coef_dir = constants[RandomConstants.ORIENTATION]
-
-        mu, sigma = economical_constants[0], economical_constants[1]
-        x = self.generateCoordinate(mu, sigma, limit=1)
-
-        mu, sigma = coef_dir * x + social_constants[0], social_constants[1]
-        y = self.generateCoordinate(mu, sigma, limit=1)
-        return (x, y)
+        return generate_position(self.election.generation_constants)
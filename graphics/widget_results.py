@@ -9,7 +9,8 @@ from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
     QCheckBox,
-    QGraphicsView
+    QGraphicsView,
+    QMessageBox
 )
 
 from .widget_results_utls import DirectedGraph, DirectedGraphView, ChartView, MapImage
@@ -323,9 +324,15 @@ class WidgetResults(QWidget):
 
         Args:
             state (int): The state of the checkbox (0 for unchecked, positive integer for checked).
+                If electors of a lazy import cannot be loaded, a pop-up indicates it and the checkbox is unchecked.
         """
 
         if state and (not self.map_image.isVisible()):
+            success, msg = self.election.load_electors()
+            if not success:
+                QMessageBox.warning(self, "Political map", msg)
+                self.checkbox_map.setChecked(False)
+                return
             self.map_image.show()
         elif (not state) and self.map_image.isVisible():
             self.map_image.close()
@@ -86,4 +86,4 @@ class ChartMultiRound(QChart):
             int: A maximum for the vertical axe.
         """
 
-        return len(self.election.electors)
+        return self.election.nb_electors
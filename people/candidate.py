@@ -6,7 +6,7 @@ from numpy import clip
 from .person import Person
 
 
-@dataclass(kw_only=True, unsafe_hash=True, eq=True, order=True)
+@dataclass(kw_only=True, unsafe_hash=True, eq=True, order=True, slots=True)
 class Candidate(Person):
     """A class which represents a candidate in the election. **A tuple (first_name, last_name) should be unique**.
     Candidates are compared by full name only."""
@@ -43,6 +43,11 @@ class Candidate(Person):
         default=(0.5, 0.3), compare=False)
     """Parameters (mean, variance) to generate the level of opposition according to the normal distribution."""
 
+    index: int = field(default=-1, hash=False, compare=False)
+    """A dense integer index of the candidate (from 0 to C-1), assigned when the candidate is registered in the election
+    and refreshed each time a preference profile is built. It is the candidate's row and column in every NumPy array
+    (rankings, majority matrix, scores), so hot paths never hash or compare candidates by name. -1 if not registered."""
+
     # int -> 1 round, float -> Copeland, List -> N rounds
     scores: Dict[str, Union[int, float, List[int]]] = field(
         default_factory=dict, hash=False, compare=False
@@ -60,7 +65,7 @@ class Candidate(Person):
             self.dogmatism = Person.generate_parameter(
                 mu=mu, sigma=sigma, lower_limit=0, upper_limit=1
             )
-        if self.opposition:
+        if self.opposition < 0:
             mu, sigma = opposition_const
             self.opposition = Person.generate_parameter(
                 mu=mu, sigma=sigma, lower_limit=0, upper_limit=1
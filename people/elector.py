@@ -1,19 +1,20 @@
 from dataclasses import dataclass, field, InitVar
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from math import sqrt, isclose
 
 from .person import Person
 from .candidate import Candidate
 
 
-@dataclass(kw_only=True, eq=True)
+@dataclass(kw_only=True, eq=True, slots=True)
 class Elector(Person):
-    """A class which represents an elector in the election."""
+    """A class which represents an elector in the election. Attributes are stored in slots (no per-instance `__dict__`)
+    to keep large electorates compact."""
 
-    candidates_ranked: List[Candidate] = field(
-        default_factory=list, repr=False)
+    candidates_ranked: Optional[List[Candidate]] = field(default=None, repr=False)
     """A ranking of candidates bases on elector's preferences. Decreasing order. 
     This list must contain all candidats who participate in the election. 
+    `None` until it is given or filled by `rank_candidates` (the election stores rankings in its profile instead).
     """
 
     weight: int = 1
@@ -40,7 +41,7 @@ class Elector(Person):
 
     def __str__(self):
         return (
-            super().__str__()
+            Person.__str__(self)
             + f" weight : {self.weight}, knowledge : {self.knowledge:.2f}"
         )
 
@@ -50,7 +51,7 @@ class Elector(Person):
     def __eq__(self, other):
         # Necessary to define manually because of Candidate
         if isinstance(other, self.__class__):
-            return (super().__eq__(other) 
+            return (Person.__eq__(self, other)
                     and other.candidates_ranked == self.candidates_ranked
                     and (isclose(other.knowledge, self.knowledge, rel_tol= 1e-4)) and other.weight == self.weight)
         return False
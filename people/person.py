@@ -6,7 +6,7 @@ from math import isclose
 # For docs generation only
 __pdoc__ = {'normal':False}
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Person:
     """A class which encapsulates the commun data between candidate and elector."""
 
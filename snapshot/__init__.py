@@ -0,0 +1 @@
+from .snapshot import Snapshot
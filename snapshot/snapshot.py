@@ -0,0 +1,370 @@
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.voting_rules.duels import Duels
+from electoral_systems.voting_rules.mapped_profile import (DEFAULT_CHUNK_SIZE, KNOWLEDGE_FILE, POSITIONS_FILE,
+                                                           RANKS_FILE, WEIGHTS_FILE, MappedProfile)
+from electoral_systems.voting_rules.profile import Profile
+from people import Candidate
+
+# For docs generation only
+__pdoc__ = {
+    'Snapshot._clear': True,
+    'Snapshot._save_array': True,
+    'Snapshot._save_electors': True,
+    'Snapshot._save_results': True,
+    'Snapshot._save_metadata': True,
+    'Snapshot._duels_matrix': True,
+    'Snapshot._load_electors': True,
+    'Snapshot._load_results': True,
+}
+
+FORMAT: str = "voting-app-snapshot"
+VERSION: int = 1
+"""The name and the version of the format, written in the metadata."""
+
+METADATA_FILE: str = "metadata.json"
+IDS_FILE: str = "ids.npy"
+DUELS_FILE: str = "duels.npy"
+SCORES_PREFIX: str = "scores_"
+"""Names of the files of a snapshot which are not files of a mapped profile. Scores of each voting rule are stored
+in `SCORES_PREFIX` + the voting rule constant + `.npy`."""
+
+
+class Snapshot:
+    """A class providing a columnar binary format for the whole election: a directory of `.npy` files
+    (electors positions, weights, knowledge, IDs, rankings, the majority matrix and the scores of each voting rule)
+    and a JSON metadata file (candidates, settings, voting rules). The files of electors are the files of
+    `electoral_systems.voting_rules.mapped_profile.MappedProfile`, so a snapshot can be loaded without copy
+    through memory mapping."""
+
+    election: Election = Election()
+
+    SNAPSHOT: str = "S"
+    """A constant corresponding to snapshot options."""
+
+    @classmethod
+    def _clear(cls, directory: str, keep_electors: bool = False) -> None:
+        """Remove the files of a previous snapshot which would not be overwritten (rankings, duels, scores, IDs).
+
+        Args:
+            directory (str): A directory of a snapshot.
+            keep_electors (bool): If `True`, the files of electors (rankings, IDs) are kept, e.g. if the election
+                is saved to the directory of its own mapped profile. Default = `False`.
+        """
+
+        electors_files = () if keep_electors else (RANKS_FILE, IDS_FILE)
+        for name in os.listdir(directory):
+            if (name in electors_files or name == DUELS_FILE
+                    or (name.startswith(SCORES_PREFIX) and name.endswith(".npy"))):
+                os.remove(os.path.join(directory, name))
+
+    @classmethod
+    def _save_array(cls, directory: str, name: str, array: np.ndarray) -> None:
+        """Write an array to a temporary file, then replace the file `name`. A previous file which is still mapped
+        in memory (e.g. by a snapshot loaded with `mapped=True`) is never truncated.
+
+        Args:
+            directory (str): A directory of a snapshot.
+            name (str): A file name.
+            array (numpy.ndarray): An array.
+        """
+
+        path = os.path.join(directory, name)
+        with open(path + ".tmp", "wb") as file:
+            np.save(file, array)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def _save_electors(cls, directory: str, same_directory: bool = False) -> None:
+        """Write the arrays of electors: positions, weights, knowledge, IDs and rankings if they are up to date
+        (cf. `electoral_systems.election.Election.distance_ranks`). The arrays of a mapped profile are copied by chunks.
+
+        Args:
+            directory (str): A directory of a snapshot.
+            same_directory (bool): `True` if `directory` is the directory of the mapped profile of the election:
+                its files of electors are kept, only the rankings are updated. Default = `False`.
+        """
+
+        election = cls.election
+        ranks = election.distance_ranks()
+        mapped = election.mapped_profile
+
+        if mapped is None:
+            profile = Profile.from_electors(election.electors, election.candidates)
+            cls._save_array(directory, POSITIONS_FILE, profile.positions)
+            cls._save_array(directory, WEIGHTS_FILE, profile.weights)
+            cls._save_array(directory, KNOWLEDGE_FILE, profile.knowledge)
+            cls._save_array(directory, IDS_FILE, np.fromiter((e.id for e in election.electors), dtype=np.int64,
+                                                             count=len(election.electors)))
+            if ranks is not None:
+                cls._save_array(directory, RANKS_FILE, ranks)
+            return
+
+        mapped.flush()
+        if same_directory:
+            # Positions, weights, knowledge and IDs are already in the directory
+            if ranks is not None:
+                cls._save_array(directory, RANKS_FILE, ranks)
+            elif os.path.exists(os.path.join(directory, RANKS_FILE)):
+                os.remove(os.path.join(directory, RANKS_FILE))
+            return
+        target = MappedProfile.create(directory, election.candidates, mapped.nb_electors, mapped.chunk_size)
+        target_ranks = None if ranks is None else np.lib.format.open_memmap(
+            os.path.join(directory, RANKS_FILE), mode="w+", dtype=ranks.dtype, shape=ranks.shape)
+        for start, stop in mapped.bounds():
+            target.positions[start:stop] = mapped.positions[start:stop]
+            target.weights[start:stop] = mapped.weights[start:stop]
+            target.knowledge[start:stop] = mapped.knowledge[start:stop]
+            if target_ranks is not None:
+                target_ranks[start:stop] = ranks[start:stop]
+        target.ranks = target_ranks
+        target.flush()
+        ids_path = os.path.join(mapped.directory, IDS_FILE)
+        if os.path.exists(ids_path):
+            cls._save_array(directory, IDS_FILE, np.load(ids_path, mmap_mode="r"))
+
+    @classmethod
+    def _duels_matrix(cls) -> Optional[np.ndarray]:
+        """Get the majority matrix of the election. If the duels were imported from a database (a dictionary),
+        the matrix is built from the scores of the winners of duels.
+
+        Returns:
+            Optional[numpy.ndarray]: A matrix (C×C) in the order of `candidates`, `None` if there are no duels.
+        """
+
+        duels = cls.election.duels_scores
+        if isinstance(duels, Duels):
+            return duels.matrix
+        if not duels:
+            return None
+
+        indices = {id(candidate): i for i, candidate in enumerate(cls.election.candidates)}
+        matrix = np.zeros((len(indices), len(indices)), dtype=np.int64)
+        for (winner, loser), score in duels.items():
+            matrix[indices[id(winner)], indices[id(loser)]] = score
+        return matrix
+
+    @classmethod
+    def _save_results(cls, directory: str) -> List[str]:
+        """Write the scores of each voting rule (an array (C,), or (C×R) for multi-round voting rules)
+        and the majority matrix.
+
+        Args:
+            directory (str): A directory of a snapshot.
+
+        Returns:
+            List[str]: Constants of the voting rules whose scores were written.
+        """
+
+        candidates = cls.election.candidates
+        voting_rules = sorted(rule for rule in cls.election.results if all(rule in c.scores for c in candidates))
+        for voting_rule in voting_rules:
+            scores = np.array([candidate.scores[voting_rule] for candidate in candidates])
+            cls._save_array(directory, f"{SCORES_PREFIX}{voting_rule}.npy", scores)
+
+        matrix = cls._duels_matrix()
+        if voting_rules and matrix is not None:
+            cls._save_array(directory, DUELS_FILE, matrix)
+        return voting_rules
+
+    @classmethod
+    def save(cls, directory: str, with_results: bool = True) -> tuple[bool, str]:
+        """Save the election to a directory, created if it does not exist. Files of a previous snapshot are overwritten.
+
+        Args:
+            directory (str): A directory of a snapshot.
+            with_results (bool): If `True`, save the scores, the majority matrix and the voting rules as well.
+                Default = `True`.
+
+        Returns:
+            tuple[bool, str]: A bool `True` if the election was saved succesfully, `False` if an error occured.
+                A string with message.
+        """
+
+        election = cls.election
+        if not election.candidates or not election.nb_electors:
+            return False, "Nothing to save: no electors or no candidates"
+        success, msg = election.load_electors()
+        if not success:
+            return success, msg
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            mapped = election.mapped_profile
+            same_directory = mapped is not None and os.path.samefile(mapped.directory, directory)
+            cls._clear(directory, keep_electors=same_directory)
+            cls._save_electors(directory, same_directory)
+            voting_rules = cls._save_results(directory) if with_results else []
+            cls._save_metadata(directory, voting_rules)
+        except OSError as error:
+            return False, f"Snapshot not saved: {error}"
+        return True, "Snapshot saved"
+
+    @classmethod
+    def _save_metadata(cls, directory: str, voting_rules: List[str]) -> None:
+        """Write the metadata: the format, the number of electors, the candidates, the settings and the voting rules.
+
+        Args:
+            directory (str): A directory of a snapshot.
+            voting_rules (List[str]): Constants of the voting rules whose scores were written.
+        """
+
+        election = cls.election
+
+        metadata = {
+            "format": FORMAT,
+            "version": VERSION,
+            "nb_electors": election.nb_electors,
+            "candidates": [
+                {
+                    "id": c.id,
+                    "position": list(c.position),
+                    "first_name": c.first_name,
+                    "last_name": c.last_name,
+                    "dogmatism": c.dogmatism,
+                    "opposition": c.opposition,
+                }
+                for c in election.candidates
+            ],
+            "settings": {
+                "liquid_democracy_activated": election.liquid_democracy_activated,
+                "tie_breaker_activated": election.tie_breaker_activated,
+            },
+            "voting_rules": voting_rules,
+        }
+        with open(os.path.join(directory, METADATA_FILE), "w") as file:
+            json.dump(metadata, file, indent=4)
+
+    @classmethod
+    def read_metadata(cls, directory: str) -> Optional[Dict[str, Any]]:
+        """Read the metadata of a snapshot.
+
+        Args:
+            directory (str): A directory of a snapshot.
+
+        Returns:
+            Optional[Dict[str, Any]]: The metadata, `None` if the directory does not contain a snapshot
+                of a supported version.
+        """
+
+        try:
+            with open(os.path.join(directory, METADATA_FILE)) as file:
+                metadata = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(metadata, dict) or metadata.get("format") != FORMAT or metadata.get("version") != VERSION:
+            return None
+        return metadata
+
+    @classmethod
+    def _load_electors(cls, directory: str, nb_electors: int, mapped: bool, chunk_size: int) -> None:
+        """Load the arrays of electors. Rankings are given to the election without copy
+        (cf. `electoral_systems.election.Election.set_imported_ranks`), so the candidates are not ranked again.
+
+        Args:
+            directory (str): A directory of a snapshot.
+            nb_electors (int): The number of electors written in the metadata.
+            mapped (bool): If `True`, attach the files as a mapped profile instead of creating electors.
+            chunk_size (int): The number of rows of a chunk of a mapped profile.
+
+        Raises:
+            ValueError: If the arrays do not correspond to the metadata.
+        """
+
+        election = cls.election
+        if mapped:
+            # Copy-on-write: ranking or delegations never modify the snapshot
+            profile = MappedProfile.open(directory, election.candidates, chunk_size, mode="c")
+            if profile.nb_electors != nb_electors:
+                raise ValueError(f"Expected {nb_electors} electors, found {profile.nb_electors}")
+            election.attach_profile(profile)
+            if profile.ranks is not None:
+                election.set_imported_ranks(profile.ranks)
+            return
+
+        def load(name: str, mode: Optional[str] = "r") -> np.ndarray:
+            array = np.load(os.path.join(directory, name), mmap_mode=mode)
+            if len(array) != nb_electors:
+                raise ValueError(f"Expected {nb_electors} rows in {name}, found {len(array)}")
+            return array
+
+        ids = load(IDS_FILE) if os.path.exists(os.path.join(directory, IDS_FILE)) else None
+        election.add_electors(load(POSITIONS_FILE), weights=load(WEIGHTS_FILE), knowledge=load(KNOWLEDGE_FILE), ids=ids)
+        if os.path.exists(os.path.join(directory, RANKS_FILE)):
+            election.set_imported_ranks(load(RANKS_FILE, "c"))
+
+    @classmethod
+    def _load_results(cls, directory: str, voting_rules: List[str]) -> None:
+        """Load the scores of candidates and the majority matrix. The rankings of candidates (`results`) are computed
+        by `electoral_systems.election.Election.start_election` with `imported=True`.
+
+        Args:
+            directory (str): A directory of a snapshot.
+            voting_rules (List[str]): Constants of the voting rules whose scores were saved.
+        """
+
+        election = cls.election
+        for voting_rule in voting_rules:
+            scores = np.load(os.path.join(directory, f"{SCORES_PREFIX}{voting_rule}.npy"))
+            for candidate, score in zip(election.candidates, scores.tolist()):
+                candidate.scores[voting_rule] = score
+        election._init_results_keys(voting_rules)
+
+        duels_path = os.path.join(directory, DUELS_FILE)
+        if os.path.exists(duels_path):
+            election.duels_scores = Duels(election.candidates, matrix=np.load(duels_path, mmap_mode="r"))
+
+    @classmethod
+    def load(cls, directory: str, mapped: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple[bool, str]:
+        """Load a snapshot to the election. Delete all existing data in the election. If results were saved,
+        `electoral_systems.election.Election.results` contains their voting rules, and the election should be started
+        with `imported=True`.
+
+        Args:
+            directory (str): A directory of a snapshot.
+            mapped (bool): If `True`, electors are not created as Python objects: the files are attached as a mapped
+                profile (cf. `electoral_systems.election.Election.attach_profile`). The liquid democracy is then
+                desactivated. Default = `False`.
+            chunk_size (int): The number of rows of a chunk of a mapped profile. Default = `DEFAULT_CHUNK_SIZE`.
+
+        Returns:
+            tuple[bool, str]: A bool `True` if the snapshot was loaded succesfully, `False` if an error occurred.
+                A string with message.
+        """
+
+        metadata = cls.read_metadata(directory)
+        if metadata is None:
+            return False, "Snapshot not found"
+
+        election = cls.election
+        election.delete_all_data()
+        election.nb_polls = 0
+        settings = metadata["settings"]
+        election.liquid_democracy_activated = settings["liquid_democracy_activated"] and not mapped
+        election.tie_breaker_activated = settings["tie_breaker_activated"]
+
+        for data in metadata["candidates"]:
+            election.add_candidate_import(
+                Candidate(
+                    id=next(election.id_iter),
+                    position=tuple(data["position"]),
+                    first_name=data["first_name"],
+                    last_name=data["last_name"],
+                    dogmatism=data["dogmatism"],
+                    opposition=data["opposition"],
+                )
+            )
+
+        try:
+            cls._load_electors(directory, metadata["nb_electors"], mapped, chunk_size)
+            cls._load_results(directory, [rule for rule in metadata["voting_rules"]
+                                          if rule in VotingRulesConstants.VOTING_RULES_FUNC])
+        except (OSError, ValueError) as error:
+            election.delete_all_data()
+            return False, f"Snapshot does not correspond: {error}"
+        return True, "Snapshot loaded"
@@ -1,2 +1,3 @@
 from .import_data import ImportData
 from .export_data import ExportData
+from .run_store import RunStore
@@ -1,5 +1,7 @@
 from sqlite3 import IntegrityError, Connection
-from typing import Set
+from typing import Dict, Optional, Set, Union
+
+import numpy as np
 
 from electoral_systems import Election, VotingRulesConstants
 
@@ -13,6 +15,10 @@ __pdoc__ = {
     'ExportData._condorcet_create_table': True,
     'ExportData._condorcet_insert': True,
     'ExportData._export_config': True,
+    'ExportData._commit': True,
+    'ExportData._set_pragmas': True,
+    'ExportData._rankings_rows': True,
+    'ExportData._export_rankings': True,
 }
 
 
@@ -24,13 +30,119 @@ class ExportData:
     
     EXPORT: str = "E"
     """A constant corresponding to export option."""
+
+    PRAGMAS: Dict[str, Union[str, int]] = {
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,
+    }
+    """Default PRAGMAs of a single-transaction export (cf. `ExportData.export`): the journal stays on disk,
+    so the database survives a crash during the export. A negative `cache_size` is in KiB."""
+
+    FAST_PRAGMAS: Dict[str, Union[str, int]] = {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -64_000,
+    }
+    """Opt-in PRAGMAs of a faster export. A crash or a power loss during the export may corrupt the whole
+    database file (including tables of other data, e.g. `sqlite.run_store.RunStore`)."""
+
+    RANKINGS_CHUNK_SIZE: int = 100_000
+    """A number of electors whose rankings are packed in one row (blob) of the rankings table."""
+
+    @classmethod
+    def _commit(cls, connection: Connection, commit: bool) -> None:
+        """Commit the current transaction, unless the whole export runs in a single transaction.
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            commit (bool): If `False`, nothing is committed (cf. `ExportData.export`).
+        """
+
+        if commit:
+            connection.commit()
+
+    @classmethod
+    def _set_pragmas(cls, connection: Connection, pragmas: Dict[str, Union[str, int]]) -> Dict[str, Union[str, int]]:
+        """Set PRAGMAs of the connection. Must be called outside of a transaction (e.g. `journal_mode`).
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            pragmas (Dict[str, Union[str, int]]): PRAGMA names and their values.
+
+        Returns:
+            Dict[str, Union[str, int]]: The previous values of the PRAGMAs, to restore them afterwards.
+
+        Raises:
+            ValueError: If a PRAGMA name is not an identifier or its value is neither an integer nor an identifier.
+        """
+
+        for name, value in pragmas.items():
+            if not name.isidentifier() or not (isinstance(value, int) or str(value).isidentifier()):
+                raise ValueError(f"Invalid PRAGMA {name!r} = {value!r}")
+
+        previous = dict()
+        for name, value in pragmas.items():
+            row = connection.execute(f"PRAGMA {name}").fetchone()
+            if row is not None:
+                previous[name] = row[0]
+            connection.execute(f"PRAGMA {name} = {value}")
+        return previous
+
+    @classmethod
+    def export(cls, connection: Connection, with_results: bool,
+               pragmas: Optional[Dict[str, Union[str, int]]] = None, with_rankings: bool = False) -> tuple[bool, str]:
+        """Export electors and candidates (and results if necessary) in a single transaction: nothing is committed
+        until all tables are filled, and the transaction is rolled back if an error occurred.
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            with_results (bool): `True` if results should be exported. `False`, otherwise.
+            pragmas (Optional[Dict[str, Union[str, int]]]): PRAGMAs set during the export, their previous values
+                are restored afterwards. Default = `ExportData.PRAGMAS` (cf. `ExportData.FAST_PRAGMAS`).
+            with_rankings (bool): If `True`, export the rankings of electors as well (cf. `ExportData._export_rankings`).
+                Default = `False`.
+
+        Returns:
+            tuple[bool, str]: A bool `True` if data was exported succesfully, `False` if an error occured. 
+                A string with message.
+        """
+
+        # Electors of a lazy import are needed in full, the export must not write an empty table instead
+        success, msg = cls.election.load_electors()
+        if not success:
+            return success, msg
+
+        connection.commit()
+        previous = cls._set_pragmas(connection, cls.PRAGMAS if pragmas is None else pragmas)
+
+        try:
+            connection.execute("BEGIN")
+            try:
+                success, msg = cls.create_database_people(connection, with_rankings, commit=False)
+                if success and with_results:
+                    success, msg = cls.create_database_results(connection, commit=False)
+            except BaseException:
+                connection.rollback()
+                raise
+
+            if success:
+                connection.commit()
+            else:
+                connection.rollback()
+        finally:
+            cls._set_pragmas(connection, previous)
+        return success, msg
     
     @classmethod
-    def create_database_people(cls, connection: Connection) -> tuple[bool, str]:
+    def create_database_people(cls, connection: Connection, with_rankings: bool = False,
+                               commit: bool = True) -> tuple[bool, str]:
         """Create tables for electors and candidats and exports its data. Election results are **not** exported.
 
         Args:
             connection (sqlite3.Connection): SQLite connection.
+            with_rankings (bool): If `True`, export the rankings of electors as well (cf. `ExportData._export_rankings`).
+                Default = `False`.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
 
         Returns:
             tuple[bool, str]: A bool `True` if data was exported succesfully, `False` if an error occured. 
@@ -39,19 +151,21 @@ class ExportData:
 
         cursor = connection.cursor()
 
-        cursor.executescript(
-            "DROP TABLE IF EXISTS electors; DROP TABLE IF EXISTS candidates"
-        )
-        connection.commit()
+        # Not `executescript`: it would commit the current transaction
+        cursor.execute("DROP TABLE IF EXISTS electors")
+        cursor.execute("DROP TABLE IF EXISTS candidates")
+        cursor.execute("DROP TABLE IF EXISTS rankings")
+        cls._commit(connection, commit)
 
-        tables = """CREATE TABLE electors (
+        table_electors = """CREATE TABLE electors (
             id INTEGER PRIMARY KEY,
             x REAL CHECK(x <= 1 AND x >= -1),
             y REAL CHECK(y <= 1 AND y >= -1),
             weight INTEGER CHECK(weight >= 0),
             knowledge REAL CHECK(knowledge <= 1 AND knowledge >= 0)
-        );
-        CREATE TABLE candidates (
+        )
+        """
+        table_candidates = """CREATE TABLE candidates (
             id INTEGER PRIMARY KEY,
             x REAL CHECK(x <= 1 AND x >= -1),
             y REAL CHECK(y <= 1 AND y >= -1),
@@ -59,27 +173,28 @@ class ExportData:
             last_name TEXT NOT NULL,
             dogmatism REAL CHECK(dogmatism <= 1 AND dogmatism >= 0),
             opposition REAL CHECK(opposition <= 1 AND opposition >= 0)
-        );
+        )
         """
 
-        cursor.executescript(tables)
-        connection.commit()
+        cursor.execute(table_electors)
+        cursor.execute(table_candidates)
+        cls._commit(connection, commit)
 
         query = """
             INSERT INTO electors(id, x, y, weight, knowledge)
             VALUES (?, ?, ?, ?, ?)
             """
 
-        data = [
+        data = (
             (e.id, e.position[0], e.position[1], e.weight, e.knowledge)
             for e in cls.election.electors
-        ]
+        )
         try:
             cursor.executemany(query, data)
         except IntegrityError:
             return False, "Data does not corresponds to constraints"
 
-        connection.commit()
+        cls._commit(connection, commit)
 
         # for candidate in candidates:
         query = """
@@ -87,7 +202,7 @@ class ExportData:
             VALUES (?, ?, ?, ?, ?, ?, ?)
             """
 
-        data = [
+        data = (
             (
                 c.id,
                 c.position[0],
@@ -98,18 +213,79 @@ class ExportData:
                 c.opposition,
             )
             for c in cls.election.candidates
-        ]
+        )
         try:
             cursor.executemany(query, data)
         except IntegrityError:
             return False, "Data does not corresponds to constraints"
 
-        connection.commit()
+        cls._commit(connection, commit)
+
+        if with_rankings:
+            cls._export_rankings(connection, commit)
 
         return True, "Date exported"
 
     @classmethod
-    def create_database_results(cls, connection: Connection) -> tuple[bool, str]:
+    def _rankings_rows(cls) -> Optional[np.ndarray]:
+        """Get the rankings of electors as they will be imported: a row per elector in ascending order of IDs,
+        candidates indexed in ascending order of IDs (the order of rows in the tables of electors and candidates).
+        Rankings are exported only if they are the rankings by distance of all electors
+        (cf. `electoral_systems.election.Election.distance_ranks`).
+
+        Returns:
+            Optional[numpy.ndarray]: A matrix (E×C) of candidates indices, `None` if rankings should not be exported.
+        """
+
+        election = cls.election
+        ranks = election.distance_ranks()
+        if election.mapped_profile is not None or ranks is None:
+            return None
+
+        electors_order = np.argsort([e.id for e in election.electors], kind="stable")
+        # New index of each candidate: its place in ascending order of IDs
+        candidates_order = np.argsort([c.id for c in election.candidates], kind="stable")
+        new_index = np.empty_like(candidates_order)
+        new_index[candidates_order] = np.arange(len(candidates_order))
+        return new_index.astype(ranks.dtype)[ranks[electors_order]]
+
+    @classmethod
+    def _export_rankings(cls, connection: Connection, commit: bool = True) -> None:
+        """Create a table for the rankings of electors and fill it. Each row packs the rankings of at most
+        `ExportData.RANKINGS_CHUNK_SIZE` electors in a blob of unsigned integers (uint8 for at most 256 candidates).
+        The table is not created if there are no valid rankings (cf. `ExportData._rankings_rows`).
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
+        """
+
+        ranks = cls._rankings_rows()
+        if ranks is None:
+            return
+
+        cursor = connection.cursor()
+        cursor.execute("""CREATE TABLE rankings (
+            first_row INTEGER PRIMARY KEY,
+            nb_rows INTEGER NOT NULL CHECK(nb_rows > 0),
+            nb_candidates INTEGER NOT NULL,
+            dtype TEXT NOT NULL,
+            ranks BLOB NOT NULL
+        )
+        """)
+
+        nb_electors, nb_candidates = ranks.shape
+        dtype = ranks.dtype.str
+        data = (
+            (start, min(cls.RANKINGS_CHUNK_SIZE, nb_electors - start), nb_candidates, dtype,
+             ranks[start:start + cls.RANKINGS_CHUNK_SIZE].tobytes())
+            for start in range(0, nb_electors, cls.RANKINGS_CHUNK_SIZE)
+        )
+        cursor.executemany("INSERT INTO rankings VALUES (?, ?, ?, ?, ?)", data)
+        cls._commit(connection, commit)
+
+    @classmethod
+    def create_database_results(cls, connection: Connection, commit: bool = True) -> tuple[bool, str]:
         """Create tables for election results and exports results data. Candidates data **must** be exported before.  
 
         At most 5 tables are created:  
@@ -122,6 +298,7 @@ class ExportData:
 
         Args:
             connection (sqlite3.Connection): SQLite connection.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
 
         Returns:
             tuple[bool, str]:  A bool `True` if data was exported succesfully, `False` if an error occured. 
@@ -133,8 +310,8 @@ class ExportData:
         status = True
 
         if chosen_one_round:
-            cls._one_round_create_table(connection, chosen_one_round)
-            status = cls._one_round_insert(connection, chosen_one_round)
+            cls._one_round_create_table(connection, chosen_one_round, commit)
+            status = cls._one_round_insert(connection, chosen_one_round, commit)
         if not status:
             return False, "Results of voting rules (1 round) do not correspond to constraints"
 
@@ -143,8 +320,8 @@ class ExportData:
             cls.election.results.keys() & VotingRulesConstants.MULTI_ROUND
         )
         if chosen_multi_round:
-            cls._multi_round_create_table(connection, chosen_multi_round)
-            status = cls._multi_round_insert(connection, chosen_multi_round)
+            cls._multi_round_create_table(connection, chosen_multi_round, commit)
+            status = cls._multi_round_insert(connection, chosen_multi_round, commit)
         if not status:
             return False, "Results of voting rules (multi round) do not correspond to constraints"
 
@@ -152,12 +329,12 @@ class ExportData:
         chosen_condorcet = cls.election.results.keys() & VotingRulesConstants.CONDORCET
 
         if chosen_condorcet:
-            cls._condorcet_create_table(connection, chosen_condorcet)
-            status = cls._condorcet_insert(connection, chosen_condorcet)
+            cls._condorcet_create_table(connection, chosen_condorcet, commit)
+            status = cls._condorcet_insert(connection, chosen_condorcet, commit)
         if not status:
             return False, "Results of voting rules (Condorcet) do not correspond to constraints"
 
-        cls._export_config(connection)
+        cls._export_config(connection, commit)
         return True, "Data exported"
 
     @classmethod
@@ -176,19 +353,20 @@ class ExportData:
         return f"IN {str(tuple(voting_rules_set))}"
 
     @classmethod
-    def _one_round_create_table(cls, connection: Connection, chosen_one_round: Set[str]) -> None:
+    def _one_round_create_table(cls, connection: Connection, chosen_one_round: Set[str], commit: bool = True) -> None:
         """Create a table for one round voting rules results.
 
         Args:
             connection (sqlite3.Connection): SQLite connection. 
             chosen_one_round (Set[str]): A set of constants related to one round voting rules used in the election.
                 Necessary for an integrity constraint.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
         """
 
         cursor = connection.cursor()
 
         cursor.execute("DROP TABLE IF EXISTS results_one_round")
-        connection.commit()
+        cls._commit(connection, commit)
 
         table_scores = f"""
             CREATE TABLE results_one_round (
@@ -200,15 +378,16 @@ class ExportData:
             )
             """
         cursor.execute(table_scores)
-        connection.commit()
+        cls._commit(connection, commit)
 
     @classmethod
-    def _one_round_insert(cls, connection: Connection, chosen_one_round: Set[str]) -> bool:
+    def _one_round_insert(cls, connection: Connection, chosen_one_round: Set[str], commit: bool = True) -> bool:
         """Fill the table for one round voting rules results. The table **must** be created before.
 
         Args:
             connection (sqlite3.Connection): SQLite connection. 
             chosen_one_round (Set[str]): A set of constants related to one round voting rules used in the election.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
 
         Returns:
             bool: `True` if data was inserted succesfully, `False` if an error occurred.
@@ -218,34 +397,36 @@ class ExportData:
         query = """INSERT INTO results_one_round(candidate_id, voting_rule, score)
         VALUES(?, ?, ?)"""
 
-        tuples = [
+        tuples = (
             (c.id, voting_rule, c.scores[voting_rule])
             for voting_rule in chosen_one_round
             for c in cls.election.candidates
-        ]
+        )
 
         try:
             cursor.executemany(query, tuples)
         except IntegrityError:
             return False
 
-        connection.commit()
+        cls._commit(connection, commit)
         return True
 
     @classmethod
-    def _multi_round_create_table(cls, connection: Connection, chosen_multi_round: Set[str]) -> None:
+    def _multi_round_create_table(cls, connection: Connection, chosen_multi_round: Set[str],
+                                  commit: bool = True) -> None:
         """Create a table for multi-round voting rules results.
         
         Args:
             connection (sqlite3.Connection): SQLite connection.
             chosen_multi_round (Set[str]): A set of constants related to multi-round voting rules used in the election.  
                 Necessary of an integrity constraint.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
         """
 
         cursor = connection.cursor()
 
         cursor.execute("DROP TABLE IF EXISTS results_multi_round")
-        connection.commit()
+        cls._commit(connection, commit)
 
         table_scores = f"""
             CREATE TABLE results_multi_round (
@@ -258,15 +439,16 @@ class ExportData:
             )
             """
         cursor.execute(table_scores)
-        connection.commit()
+        cls._commit(connection, commit)
 
     @classmethod
-    def _multi_round_insert(cls, connection: Connection, chosen_multi_round: Set[str]) -> bool:
+    def _multi_round_insert(cls, connection: Connection, chosen_multi_round: Set[str], commit: bool = True) -> bool:
         """Fill the table for multi-round voting rules results. The table **must** be created before.
 
         Args:
             connection (sqlite3.Connection): SQLite connection. 
             chosen_one_round (Set[str]): A set of constants related to multi-round voting rules used in the election.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
 
         Returns:
             bool: `True` if data was inserted succesfully, `False` if an error occurred.
@@ -277,34 +459,34 @@ class ExportData:
         VALUES(?, ?, ?, ?)
         """
 
-        tuples = [
+        tuples = (
             (c.id, voting_rule, round, c.scores[voting_rule][round])
             for voting_rule in chosen_multi_round
             for c in cls.election.candidates
             for round in range(len(c.scores[voting_rule]))
-        ]
+        )
         try:
             cursor.executemany(query, tuples)
         except IntegrityError:
             return False
-        connection.commit()
+        cls._commit(connection, commit)
         return True
 
     @classmethod
-    def _condorcet_create_table(cls, connection: Connection, chosen_condorcet: Set[str]) -> None:
+    def _condorcet_create_table(cls, connection: Connection, chosen_condorcet: Set[str], commit: bool = True) -> None:
         """Create a table for Condorcet-based voting rules results and a table for scores in duels between candidates.
 
         Args:
             connection (sqlite3.Connection): SQLite connection.
             chosen_condorcet (Set[str]): A set of constants related to Condorcet-based voting rules used in the election.  
-                Necessary for an integrity constraint. 
+                Necessary for an integrity constraint.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`. 
         """
 
         cursor = connection.cursor()
-        cursor.executescript(
-            "DROP TABLE IF EXISTS condorcet_duels;DROP TABLE IF EXISTS results_condorcet"
-        )
-        connection.commit()
+        cursor.execute("DROP TABLE IF EXISTS condorcet_duels")
+        cursor.execute("DROP TABLE IF EXISTS results_condorcet")
+        cls._commit(connection, commit)
 
         table_duels = f"""
             CREATE TABLE condorcet_duels (
@@ -318,7 +500,7 @@ class ExportData:
             """
         cursor.execute(table_duels)
 
-        connection.commit()
+        cls._commit(connection, commit)
         table_scores = f"""CREATE TABLE results_condorcet (
                 candidate_id INTEGER,
                 voting_rule TEXT CHECK(voting_rule {ExportData._get_set_check(chosen_condorcet)}),
@@ -329,16 +511,17 @@ class ExportData:
             """
 
         cursor.execute(table_scores)
-        connection.commit()
+        cls._commit(connection, commit)
 
     @classmethod
-    def _condorcet_insert(cls, connection: Connection, chosen_condorcet: Set[str]) -> bool:
+    def _condorcet_insert(cls, connection: Connection, chosen_condorcet: Set[str], commit: bool = True) -> bool:
         """Fill the table for Condorced-based voting rules results as well as the table for duels scores. 
         These two tables **must** be created before. 
 
         Args:
             connection (sqlite3.Connection): SQLite connection.
             chosen_condorcet (Set[str]): A set of constants of Condorcet-based voting rules used in the election.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
 
         Returns:
             bool: `True` if all data was inserted succesfully, `False` if an error occured.
@@ -349,46 +532,50 @@ class ExportData:
         query = """INSERT INTO condorcet_duels(winner_id, loser_id, score)
         VALUES(?, ?, ?)"""
 
-        tuples = [
+        tuples = (
             (pair[0].id, pair[1].id, score)
             for pair, score in cls.election.duels_scores.items()
-        ]
+        )
         try:
             cursor.executemany(query, tuples)
         except IntegrityError:
             return False
-        connection.commit()
+        cls._commit(connection, commit)
 
         # Scores (like in one round)
         query = """INSERT INTO results_condorcet(candidate_id, voting_rule, score)
         VALUES(?, ?, ?)"""
 
-        tuples = [
+        tuples = (
             (c.id, voting_rule, c.scores[voting_rule])
             for voting_rule in chosen_condorcet
             for c in cls.election.candidates
-        ]
+        )
         try:
             cursor.executemany(query, tuples)
         except IntegrityError:
             return False
-        connection.commit()
+        cls._commit(connection, commit)
         return True
 
     @classmethod
-    def _export_config(cls, connection: Connection) -> None:
+    def _export_config(cls, connection: Connection, commit: bool = True) -> None:
         """Export election settings, i.e. if  
             - the tie-break by duels was activated  
             - the liquid democracy was activated   
 
+        The number of electors and their average position are exported too, so results can be imported without
+        electors (cf. `sqlite.import_data.ImportData.import_people_lazy`).
+
         Args:
             connection (sqlite3.Connection): SQLite connection.
+            commit (bool): If `False`, intermediate commits are skipped (cf. `ExportData.export`). Default = `True`.
         """
 
         cursor = connection.cursor()
 
         cursor.execute("DROP TABLE IF EXISTS settings")
-        connection.commit()
+        cls._commit(connection, commit)
 
         table_config = f"""
             CREATE TABLE settings (
@@ -399,11 +586,14 @@ class ExportData:
             )
             """
         cursor.execute(table_config)
-        connection.commit()
+        cls._commit(connection, commit)
 
         settings_assoc = [
             ("liquid_democracy_activated", 1 if cls.election.liquid_democracy_activated else 0),
             ("tie_breaker_activated",  1 if cls.election.tie_breaker_activated else 0),
+            ("nb_electors", cls.election.nb_electors),
+            ("average_position_x", cls.election.average_position_electors[0]),
+            ("average_position_y", cls.election.average_position_electors[1]),
         ]
         cursor.executemany("INSERT INTO settings VALUES (?, ?)", settings_assoc)
-        connection.commit()
+        cls._commit(connection, commit)
@@ -1,8 +1,12 @@
+import sqlite3
+from pathlib import Path
 from sqlite3 import Connection
-from typing import Set, Dict
+from typing import Callable, Dict, Iterator, Optional, Set
+
+import numpy as np
 
 from electoral_systems import Election, VotingRulesConstants
-from people import Candidate, Elector
+from people import Candidate
 
 # For docs generation only
 __pdoc__ = {
@@ -10,13 +14,21 @@ __pdoc__ = {
     'ImportData._get_existing_tables': True,
     'ImportData._check_columns': True,
     'ImportData._check_columns_people': True,
+    'ImportData._connect_read_only': True,
     'ImportData._import_results': True,
     'ImportData._import_one_round': True,
     'ImportData._import_multi_round': True,
     'ImportData._import_condorcet': True,
     'ImportData._import_config': True,
+    'ImportData._fetch_chunks': True,
+    'ImportData._import_electors': True,
+    'ImportData._import_rankings': True,
+    'ImportData._electors_summary': True,
 }
 
+progress_type = Callable[[int, int], None]
+"""A type of progress callbacks: called with the number of imported electors and the total number of electors."""
+
 
 class ImportData:
     """A class which provides functionnality for data import. SQLite3 is used."""
@@ -26,6 +38,10 @@ class ImportData:
     IMPORT: str = "I"
     """A constant corresponding to import option."""
 
+    CHUNK_SIZE: int = 100_000
+    """A number of rows of the electors table fetched and added to the election at once. It bounds the fetch buffer only:
+    the election still keeps every imported elector (and its profile arrays) in memory."""
+
     @classmethod
     def _check_tables(cls, tables_to_check: Set[str], existing_tables: Set[str]) -> tuple[bool, Set[str]]:
         """Verify if tables in `tables_to_check` exist in database. Tables in database are listed in `existing_tables`.
@@ -114,13 +130,127 @@ class ImportData:
         )
 
     @classmethod
-    def import_people(cls, connection: Connection, with_results: bool) -> tuple[bool, str]:
+    def _connect_read_only(cls, db_file_path: str) -> Connection:
+        """Open the database in read-only mode, so that a missing file is not created as an empty database.
+
+        Args:
+            db_file_path (str): A path to the database.
+
+        Returns:
+            sqlite3.Connection: SQLite connection.
+
+        Raises:
+            sqlite3.Error: If the file cannot be opened.
+        """
+
+        return sqlite3.connect(f"{Path(db_file_path).resolve().as_uri()}?mode=ro", uri=True)
+
+    @classmethod
+    def _fetch_chunks(cls, connection: Connection, query: str, chunk_size: int) -> Iterator[np.ndarray]:
+        """Execute a query and fetch its rows by chunks with `fetchmany`. Each chunk is converted to a 2D array,
+        so only one chunk of rows exists at a time.
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            query (str): A query whose selected columns are all numerical.
+            chunk_size (int): A number of rows fetched at once.
+
+        Returns:
+            Iterator[numpy.ndarray]: Arrays (N×number of columns) of float64, N <= `chunk_size`.
+        """
+
+        cursor = connection.cursor()
+        cursor.execute(query)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            yield np.array(rows, dtype=np.float64)
+
+    @classmethod
+    def _import_electors(cls, connection: Connection, with_ids: bool, chunk_size: Optional[int] = None,
+                         progress: Optional[progress_type] = None) -> None:
+        """Import electors chunk by chunk: each chunk of rows is converted into column arrays and added to the election
+        at once (cf. `electoral_systems.election.Election.add_electors`). Only the rows fetched from SQLite are bounded
+        by `chunk_size`: an `Elector` is created for each row and kept by the election, so the memory still grows
+        with the number of electors (cf. `snapshot.snapshot.Snapshot.load` with `mapped=True` for an import without them).
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            with_ids (bool): If `True`, electors keep their IDs of the database. Otherwise, new IDs are generated.
+            chunk_size (Optional[int]): A number of rows fetched at once. Default = `ImportData.CHUNK_SIZE`.
+            progress (Optional[sqlite.import_data.progress_type]): A function called after each chunk. Default = `None`.
+        """
+
+        chunk_size = chunk_size or cls.CHUNK_SIZE
+        total = connection.execute("SELECT count(*) FROM electors").fetchone()[0] if progress is not None else 0
+        imported = 0
+        for chunk in cls._fetch_chunks(connection, "SELECT x, y, weight, knowledge, id FROM electors ORDER BY id", chunk_size):
+            ids = chunk[:, 4].astype(np.int64) if with_ids else None
+            cls.election.add_electors(chunk[:, :2], weights=chunk[:, 2], knowledge=chunk[:, 3], ids=ids)
+            imported += len(chunk)
+            if progress is not None:
+                progress(imported, total)
+
+    @classmethod
+    def _import_rankings(cls, connection: Connection, existing_tables: Set[str]) -> None:
+        """Import the rankings of electors if the table exists (cf. `sqlite.export_data.ExportData._export_rankings`).
+        Blobs are copied straight into a matrix for the profile, so the election will not rank the candidates again
+        (cf. `electoral_systems.election.Election.set_imported_ranks`). Rankings are ignored if they do not correspond
+        to the tables of electors and candidates. Must be called after the import of electors and candidates.
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            existing_tables (Set[str]): Table names that exist in database.
+        """
+
+        if "rankings" not in existing_tables or cls._check_columns(
+            connection,
+            {
+                "rankings": {
+                    ("first_row", "INTEGER"),
+                    ("nb_rows", "INTEGER"),
+                    ("nb_candidates", "INTEGER"),
+                    ("dtype", "TEXT"),
+                    ("ranks", "BLOB"),
+                },
+            },
+        ):
+            return
+
+        nb_electors = connection.execute("SELECT count(*) FROM electors").fetchone()[0]
+        nb_candidates = connection.execute("SELECT count(*) FROM candidates").fetchone()[0]
+        ranks = None
+        filled = 0
+        cursor = connection.execute("SELECT first_row, nb_rows, nb_candidates, dtype, ranks FROM rankings ORDER BY first_row")
+        for first_row, nb_rows, blob_candidates, dtype, blob in cursor:
+            try:
+                dtype = np.dtype(dtype)
+            except TypeError:
+                return
+            if (dtype.kind != "u" or blob_candidates != nb_candidates or first_row != filled
+                    or filled + nb_rows > nb_electors or len(blob) != nb_rows * nb_candidates * dtype.itemsize):
+                return
+            if ranks is None:
+                ranks = np.empty((nb_electors, nb_candidates), dtype=dtype)
+            ranks[filled:filled + nb_rows] = np.frombuffer(blob, dtype=dtype).reshape(nb_rows, nb_candidates)
+            filled += nb_rows
+
+        if ranks is None or filled != nb_electors or ranks.max(initial=0) >= nb_candidates:
+            return
+        cls.election.set_imported_ranks(ranks)
+
+    @classmethod
+    def import_people(cls, connection: Connection, with_results: bool,
+                      progress: Optional[progress_type] = None) -> tuple[bool, str]:
         """Import data to the election from the database. Electors and candidates data are imported in any case. 
         Results data are imported only if necessary. Make all necessary verification on tables and its columns.
 
         Args:
             connection (sqlite3.Connection): SQLite connection.
             with_results (bool): `True` is results should be imported. `False`, otherwise.
+            progress (Optional[sqlite.import_data.progress_type]): A function called after each chunk of electors.
+                Default = `None`.
 
         Returns:
             tuple[bool, str]: Un booléen `True` si les données ont été importées avec succès, `False` si l'erreur est survenue.
@@ -128,16 +258,20 @@ class ImportData:
         """
 
         if with_results:
-            return cls.import_people_with_results(connection)
-        return cls.import_people_no_results(connection)
+            return cls.import_people_with_results(connection, progress=progress)
+        return cls.import_people_no_results(connection, progress=progress)
 
     @classmethod
-    def import_people_no_results(cls, connection: Connection) -> tuple[bool, str]:
+    def import_people_no_results(cls, connection: Connection, chunk_size: Optional[int] = None,
+                                 progress: Optional[progress_type] = None) -> tuple[bool, str]:
         """Import data (candidates, electors only) in the election from the database.
-        Make necessary verifications on tables and columns.
+        Make necessary verifications on tables and columns. Electors are fetched and added by chunks.
 
         Args:
             connection (sqlite3.Connection): SQLite connection.
+            chunk_size (Optional[int]): A number of electors fetched at once. Default = `ImportData.CHUNK_SIZE`.
+            progress (Optional[sqlite.import_data.progress_type]): A function called after each chunk of electors.
+                Default = `None`.
 
         Returns:
             tuple[bool, str]: A bool `True` if data was imported succesfully, `False` if an error occurred.
@@ -160,7 +294,7 @@ class ImportData:
 
         cursor = connection.cursor()
 
-        cursor.execute("SELECT x, y, first_name, last_name FROM candidates")
+        cursor.execute("SELECT x, y, first_name, last_name FROM candidates ORDER BY id")
         candidates_data = cursor.fetchall()
        
         for x, y, first_name, last_name in candidates_data:
@@ -172,24 +306,22 @@ class ImportData:
                 )
             )
 
-        cursor.execute("SELECT x, y, weight, knowledge FROM electors")
-        electors_data = cursor.fetchall()
-
-        for x, y, weight, knowledge in electors_data:
-            id = next(cls.election.id_iter)
-            cls.election.add_elector_import(
-                Elector(id=id, position=(x, y),
-                        weight=weight, knowledge=knowledge)
-            )
+        cls._import_electors(connection, False, chunk_size, progress)
+        cls._import_rankings(connection, existing_tables)
         return True, "Data imported"
 
     @classmethod
-    def import_people_with_results(cls, connection: Connection) -> tuple[bool, str]:
+    def import_people_with_results(cls, connection: Connection, chunk_size: Optional[int] = None,
+                                   progress: Optional[progress_type] = None) -> tuple[bool, str]:
         """Import data (candidates, electors, results) to the election from the database. Make necessary verification on 
         tables and its columns. Import election settings if such table exists. Delete all existing data in the election.
+        Electors are fetched and added by chunks, they keep their IDs of the database.
 
         Args:
             connection (sqlite3.Connection): SQLite connection.
+            chunk_size (Optional[int]): A number of electors fetched at once. Default = `ImportData.CHUNK_SIZE`.
+            progress (Optional[sqlite.import_data.progress_type]): A function called after each chunk of electors.
+                Default = `None`.
 
         Returns:
             tuple[bool, str]: A bool `True` if data was imported succesfully, `False` if an error occurred.
@@ -213,7 +345,7 @@ class ImportData:
 
         cursor = connection.cursor()
 
-        cursor.execute("SELECT * FROM candidates")
+        cursor.execute("SELECT * FROM candidates ORDER BY id")
         candidates_data = cursor.fetchall()
 
         # id : candidate
@@ -231,22 +363,127 @@ class ImportData:
             cls.election.add_candidate_import(new_candidate)
             candidates_id_assoc[id] = new_candidate
 
-        cursor.execute("SELECT * FROM electors")
-        electors_data = cursor.fetchall()
-
-        for id, x, y, weight, knowledge in electors_data:
-            new_elector = Elector(
-                id=id,
-                position=(x, y),
-                weight=weight,
-                knowledge=knowledge,
-            )
-            cls.election.add_elector_import(new_elector)
+        cls._import_electors(connection, True, chunk_size, progress)
+        cls._import_rankings(connection, existing_tables)
 
         table_missing, _ = cls._check_tables({"settings"}, existing_tables)
         cls._import_config(connection, table_missing)
         return cls._import_results(connection, existing_tables, candidates_id_assoc)
 
+    @classmethod
+    def import_people_lazy(cls, db_file_path: str, chunk_size: Optional[int] = None) -> tuple[bool, str]:
+        """Import candidates, results and settings to the election from the database, but not electors:
+        only their number and average position are read, which is enough to show the imported results.
+        Electors (and their rankings) are fetched from the same database file the first time something needs them,
+        e.g. the political map, the polls or a new computation of results
+        (cf. `electoral_systems.election.Election.set_lazy_electors`). Delete all existing data in the election.
+
+        Args:
+            db_file_path (str): A path to the database. The file should stay available while electors are not loaded:
+                if it does not, loading them fails and the election keeps waiting for them
+                (cf. `electoral_systems.election.Election.load_electors`).
+            chunk_size (Optional[int]): A number of electors fetched at once when they are loaded.
+                Default = `ImportData.CHUNK_SIZE`.
+
+        Returns:
+            tuple[bool, str]: A bool `True` if data was imported succesfully, `False` if an error occurred.
+                A string with message.
+        """
+
+        cls.election.delete_all_data()
+        cls.election.nb_polls = 0
+        try:
+            connection = cls._connect_read_only(db_file_path)
+        except sqlite3.Error as error:
+            return False, f"Database cannot be opened: {error}"
+        try:
+            # Check tables
+            existing_tables = cls._get_existing_tables(connection)
+            missing, missing_tables = cls._check_tables(
+                {"candidates", "electors"}, existing_tables
+            )
+            if missing:
+                return False, f"Tables {missing_tables} are not found"
+
+            # Check columns
+            missing = cls._check_columns_people(connection)
+            if missing:
+                return False, f"Database does not correspond"
+
+            candidates_id_assoc = dict()
+            for id, x, y, first_name, last_name, dogm, oppos in connection.execute("SELECT * FROM candidates ORDER BY id"):
+                new_candidate = Candidate(
+                    id=next(cls.election.id_iter),
+                    position=(x, y),
+                    first_name=first_name,
+                    last_name=last_name,
+                    dogmatism=dogm,
+                    opposition=oppos,
+                )
+                cls.election.add_candidate_import(new_candidate)
+                candidates_id_assoc[id] = new_candidate
+
+            table_missing, _ = cls._check_tables({"settings"}, existing_tables)
+            cls._import_config(connection, table_missing)
+            nb_electors, average_position = cls._electors_summary(connection, table_missing)
+
+            success, msg = cls._import_results(connection, existing_tables, candidates_id_assoc)
+            if not success:
+                return success, msg
+        finally:
+            connection.close()
+
+        def load() -> None:
+            # The file may have been moved, replaced or removed since the import
+            try:
+                connection = cls._connect_read_only(db_file_path)
+            except sqlite3.Error as error:
+                raise ValueError(f"Database cannot be opened: {error}") from error
+            try:
+                existing_tables = cls._get_existing_tables(connection)
+                missing, _ = cls._check_tables({"candidates", "electors"}, existing_tables)
+                if missing or cls._check_columns_people(connection):
+                    raise ValueError("Database does not correspond")
+                if connection.execute("SELECT count(*) FROM electors").fetchone()[0] != nb_electors:
+                    raise ValueError("Database does not correspond")
+                cls._import_electors(connection, True, chunk_size)
+                cls._import_rankings(connection, existing_tables)
+            except sqlite3.Error as error:
+                raise ValueError(f"Electors cannot be imported: {error}") from error
+            finally:
+                connection.close()
+
+        cls.election.set_lazy_electors(nb_electors, average_position, load)
+        return True, "Data imported"
+
+    @classmethod
+    def _electors_summary(cls, connection: Connection, table_missing: bool) -> tuple[int, tuple[float, float]]:
+        """Get the number of electors and their average position from the settings
+        (cf. `sqlite.export_data.ExportData._export_config`). Databases exported without them are aggregated
+        by a single query on the electors table instead.
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            table_missing (bool): `True` if the table `settings` does not exist in the database, `False` otherwise.
+
+        Returns:
+            tuple[int, tuple[float, float]]: The number of electors and their average position.
+        """
+
+        settings = dict()
+        if not table_missing:
+            settings = dict(connection.execute(
+                "SELECT parameter, set_value FROM settings "
+                "WHERE parameter IN ('nb_electors', 'average_position_x', 'average_position_y')"
+            ).fetchall())
+        if len(settings) == 3:
+            return int(settings["nb_electors"]), (settings["average_position_x"], settings["average_position_y"])
+
+        nb_electors, x_sum, y_sum = connection.execute("SELECT count(*), total(x), total(y) FROM electors").fetchone()
+        if not nb_electors:
+            return 0, (0, 0)
+        return nb_electors, (x_sum / nb_electors, y_sum / nb_electors)
+
     @classmethod
     def _import_results(cls, connection: Connection, existing_tables: Set[str], assoc: Dict[int, Candidate]) -> tuple[bool, str]:
         """Import results of each voting rule existing in the database to the election. 
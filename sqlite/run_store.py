@@ -0,0 +1,369 @@
+import json
+from sqlite3 import Connection
+from time import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.simulate import election_record
+
+# For docs generation only
+__pdoc__ = {
+    'RunStore._create_tables': True,
+    'RunStore._parameters_filter': True,
+}
+
+SCHEMA: str = """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id INTEGER PRIMARY KEY,
+        parameters TEXT NOT NULL,
+        seed INTEGER,
+        created REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS runs_parameters ON runs(parameters);
+
+    CREATE TABLE IF NOT EXISTS run_elections (
+        election_id INTEGER PRIMARY KEY,
+        run_id INTEGER NOT NULL,
+        nb_electors INTEGER NOT NULL CHECK(nb_electors >= 0),
+        nb_candidates INTEGER NOT NULL CHECK(nb_candidates >= 0),
+        condorcet_winner INTEGER,
+
+        FOREIGN KEY(run_id) REFERENCES runs(run_id)
+    );
+    CREATE INDEX IF NOT EXISTS run_elections_run ON run_elections(run_id);
+
+    CREATE TABLE IF NOT EXISTS run_candidates (
+        election_id INTEGER NOT NULL,
+        candidate_id INTEGER NOT NULL,
+        x REAL CHECK(x <= 1 AND x >= -1),
+        y REAL CHECK(y <= 1 AND y >= -1),
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        dogmatism REAL CHECK(dogmatism <= 1 AND dogmatism >= 0),
+        opposition REAL CHECK(opposition <= 1 AND opposition >= 0),
+
+        PRIMARY KEY(election_id, candidate_id),
+        FOREIGN KEY(election_id) REFERENCES run_elections(election_id)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS run_winners (
+        election_id INTEGER NOT NULL,
+        voting_rule TEXT NOT NULL,
+        winner_id INTEGER,
+
+        PRIMARY KEY(election_id, voting_rule),
+        FOREIGN KEY(election_id) REFERENCES run_elections(election_id)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS run_scores (
+        election_id INTEGER NOT NULL,
+        candidate_id INTEGER NOT NULL,
+        voting_rule TEXT NOT NULL,
+        round INTEGER NOT NULL CHECK(round >= 0),
+        score REAL,
+
+        FOREIGN KEY(election_id, candidate_id) REFERENCES run_candidates(election_id, candidate_id)
+    );
+    CREATE INDEX IF NOT EXISTS run_scores_rule ON run_scores(election_id, voting_rule);
+    CREATE INDEX IF NOT EXISTS run_scores_candidate ON run_scores(election_id, candidate_id);
+
+    CREATE TABLE IF NOT EXISTS run_electors (
+        election_id INTEGER NOT NULL,
+        elector_id INTEGER NOT NULL,
+        x REAL CHECK(x <= 1 AND x >= -1),
+        y REAL CHECK(y <= 1 AND y >= -1),
+        weight INTEGER CHECK(weight >= 0),
+        knowledge REAL CHECK(knowledge <= 1 AND knowledge >= 0),
+
+        PRIMARY KEY(election_id, elector_id),
+        FOREIGN KEY(election_id) REFERENCES run_elections(election_id)
+    ) WITHOUT ROWID;
+"""
+"""The schema of a run store. The tables do not overlap with the tables of `sqlite.export_data.ExportData`,
+so both can live in the same database."""
+
+
+class RunStore:
+    """A history of many elections in one SQLite database. Elections are grouped in runs (e.g. a Monte Carlo campaign),
+    each run has a parameter set. Every table is keyed by `election_id`, scores are indexed by
+    (`election_id`, `voting_rule`) and (`election_id`, `candidate_id`).
+    Elections are appended by batches: the rows are kept in memory and inserted in one transaction per batch.
+    A store assumes it is the only writer of the database."""
+
+    def __init__(self, connection: Connection, batch_size: int = 1000):
+        """Create the tables if they do not exist.
+
+        Args:
+            connection (sqlite3.Connection): SQLite connection.
+            batch_size (int): A number of elections inserted in one transaction. Default = 1000.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        self.connection: Connection = connection
+        """SQLite connection."""
+
+        self.batch_size: int = batch_size
+        """A number of elections inserted in one transaction."""
+
+        self._create_tables()
+        last_id = connection.execute("SELECT max(election_id) FROM run_elections").fetchone()[0]
+        self._next_election_id = 0 if last_id is None else last_id + 1
+        # Rows waiting to be inserted: table name -> rows
+        self._pending: Dict[str, List[tuple]] = {table: [] for table in
+                                                 ("run_elections", "run_candidates", "run_winners", "run_scores",
+                                                  "run_electors")}
+        self._nb_pending = 0
+
+    def __enter__(self) -> 'RunStore':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
+
+    def _create_tables(self) -> None:
+        """Create the tables and the indexes of the schema (cf. `SCHEMA`)."""
+
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def new_run(self, parameters: Dict[str, Any], seed: Optional[int] = None) -> int:
+        """Add a new run. Runs with the same parameters are aggregated together by the queries.
+
+        Args:
+            parameters (Dict[str, Any]): A JSON serializable parameter set (e.g. numbers of electors and candidates,
+                settings, generation constants).
+            seed (Optional[int]): The seed of the run, not part of the parameter set. Default = `None`.
+
+        Returns:
+            int: The ID of the new run.
+        """
+
+        cursor = self.connection.execute(
+            "INSERT INTO runs(parameters, seed, created) VALUES (?, ?, ?)",
+            (json.dumps(parameters, sort_keys=True), seed, time()),
+        )
+        self.connection.commit()
+        return cursor.lastrowid
+
+    def append(self, run_id: int, election: Election, with_electors: bool = False) -> int:
+        """Append an election whose results were computed. Rows are inserted when the batch is full.
+
+        Args:
+            run_id (int): The ID of the run.
+            election (electoral_systems.election.Election): An election.
+            with_electors (bool): If `True`, store the electors as well. Default = `False`.
+
+        Returns:
+            int: The ID of the election in the store.
+        """
+
+        election_id = self.append_record(run_id, election_record(election), flush=False)
+        if with_electors:
+            self._pending["run_electors"].extend(
+                (election_id, e.id, e.position[0], e.position[1], e.weight, e.knowledge) for e in election.electors
+            )
+        if self._nb_pending >= self.batch_size:
+            self.flush()
+        return election_id
+
+    def append_record(self, run_id: int, record: Dict[str, Any], flush: bool = True) -> int:
+        """Append an election given as a record (cf. `electoral_systems.simulate.election_record`).
+
+        Args:
+            run_id (int): The ID of the run.
+            record (Dict[str, Any]): The data of an election.
+            flush (bool): If `True`, insert the rows when the batch is full. Default = `True`.
+
+        Returns:
+            int: The ID of the election in the store.
+        """
+
+        election_id = self._next_election_id
+        self._next_election_id += 1
+
+        candidates = record["candidates"]
+        self._pending["run_elections"].append(
+            (election_id, run_id, record["nb_electors"], len(candidates), record["condorcet"])
+        )
+        self._pending["run_candidates"].extend(
+            (election_id, c["id"], c["position"][0], c["position"][1], c["first_name"], c["last_name"],
+             c["dogmatism"], c["opposition"])
+            for c in candidates
+        )
+        self._pending["run_winners"].extend(
+            (election_id, voting_rule, winner) for voting_rule, winner in record["winners"].items()
+        )
+        for voting_rule, scores in record["scores"].items():
+            for candidate, score in zip(candidates, scores):
+                if isinstance(score, list):
+                    self._pending["run_scores"].extend(
+                        (election_id, candidate["id"], voting_rule, round, round_score)
+                        for round, round_score in enumerate(score)
+                    )
+                else:
+                    self._pending["run_scores"].append((election_id, candidate["id"], voting_rule, 0, score))
+
+        self._nb_pending += 1
+        if flush and self._nb_pending >= self.batch_size:
+            self.flush()
+        return election_id
+
+    def append_records(self, run_id: int, records: Iterable[Dict[str, Any]]) -> List[int]:
+        """Append several elections given as records, e.g. `electoral_systems.monte_carlo.MonteCarloResults.records`.
+        Remaining rows are inserted at the end.
+
+        Args:
+            run_id (int): The ID of the run.
+            records (Iterable[Dict[str, Any]]): The data of the elections.
+
+        Returns:
+            List[int]: The IDs of the elections in the store.
+        """
+
+        election_ids = [self.append_record(run_id, record) for record in records]
+        self.flush()
+        return election_ids
+
+    def flush(self) -> None:
+        """Insert all pending rows in one transaction."""
+
+        if not self._nb_pending:
+            return
+
+        placeholders = {
+            "run_elections": 5,
+            "run_candidates": 8,
+            "run_winners": 3,
+            "run_scores": 5,
+            "run_electors": 6,
+        }
+        try:
+            for table, rows in self._pending.items():
+                if rows:
+                    values = ", ".join("?" * placeholders[table])
+                    self.connection.executemany(f"INSERT INTO {table} VALUES ({values})", rows)
+        except BaseException:
+            self.connection.rollback()
+            raise
+        self.connection.commit()
+
+        for rows in self._pending.values():
+            rows.clear()
+        self._nb_pending = 0
+
+    @classmethod
+    def _parameters_filter(cls, parameters: Optional[Dict[str, Any]]) -> tuple[str, tuple]:
+        """Get a `WHERE` clause restricting a query to runs of a parameter set.
+
+        Args:
+            parameters (Optional[Dict[str, Any]]): A parameter set, `None` for all runs.
+
+        Returns:
+            tuple[str, tuple]: The clause (empty if `parameters` is `None`) and its arguments.
+        """
+
+        if parameters is None:
+            return "", ()
+        return "WHERE r.parameters = ?", (json.dumps(parameters, sort_keys=True),)
+
+    def winner_statistics(self, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Aggregate the winners of every voting rule per parameter set. Only the tables of elections and winners
+        are read: candidates, scores and electors are not loaded.
+
+        Args:
+            parameters (Optional[Dict[str, Any]]): Restrict the statistics to a parameter set. Default = `None` (all).
+
+        Returns:
+            List[Dict[str, Any]]: For each parameter set and voting rule: `parameters`, `voting_rule`, `nb_elections`,
+                `no_winner` (elections without a winner), `nb_condorcet_winners` (elections with a Condorcet winner),
+                `condorcet_hits` (elections where the voting rule elected the Condorcet winner)
+                and `condorcet_efficiency`.
+        """
+
+        where, args = self._parameters_filter(parameters)
+        query = f"""
+            SELECT r.parameters, w.voting_rule, count(*), sum(w.winner_id IS NULL),
+                sum(e.condorcet_winner IS NOT NULL), sum(w.winner_id = e.condorcet_winner)
+            FROM run_winners w
+            JOIN run_elections e ON e.election_id = w.election_id
+            JOIN runs r ON r.run_id = e.run_id
+            {where}
+            GROUP BY r.parameters, w.voting_rule
+            ORDER BY r.parameters, w.voting_rule
+            """
+
+        statistics = []
+        for params, voting_rule, nb_elections, no_winner, nb_condorcet, hits in self.connection.execute(query, args):
+            hits = hits or 0
+            statistics.append({
+                "parameters": json.loads(params),
+                "voting_rule": voting_rule,
+                "nb_elections": nb_elections,
+                "no_winner": no_winner,
+                "nb_condorcet_winners": nb_condorcet,
+                "condorcet_hits": hits,
+                "condorcet_efficiency": hits / nb_condorcet if nb_condorcet else 0,
+            })
+        return statistics
+
+    def agreement_rates(self, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Aggregate, per parameter set and for each pair of voting rules, the number of elections where their winners
+        coincide (cf. `electoral_systems.monte_carlo.MonteCarloResults.agreement_rate`).
+
+        Args:
+            parameters (Optional[Dict[str, Any]]): Restrict the statistics to a parameter set. Default = `None` (all).
+
+        Returns:
+            List[Dict[str, Any]]: For each parameter set and pair of voting rules: `parameters`, `voting_rules`
+                (a pair in alphabetical order), `nb_elections`, `agreements` and `agreement_rate`.
+        """
+
+        where, args = self._parameters_filter(parameters)
+        query = f"""
+            SELECT r.parameters, w1.voting_rule, w2.voting_rule, count(*),
+                sum(w1.winner_id IS NOT NULL AND w1.winner_id = w2.winner_id)
+            FROM run_winners w1
+            JOIN run_winners w2 ON w2.election_id = w1.election_id AND w1.voting_rule < w2.voting_rule
+            JOIN run_elections e ON e.election_id = w1.election_id
+            JOIN runs r ON r.run_id = e.run_id
+            {where}
+            GROUP BY r.parameters, w1.voting_rule, w2.voting_rule
+            ORDER BY r.parameters, w1.voting_rule, w2.voting_rule
+            """
+
+        return [
+            {
+                "parameters": json.loads(params),
+                "voting_rules": (rule1, rule2),
+                "nb_elections": nb_elections,
+                "agreements": agreements,
+                "agreement_rate": agreements / nb_elections,
+            }
+            for params, rule1, rule2, nb_elections, agreements in self.connection.execute(query, args)
+        ]
+
+    def scores(self, election_id: int, voting_rule: str) -> Dict[int, Any]:
+        """Get the scores of all candidates of an election according to a voting rule.
+
+        Args:
+            election_id (int): The ID of the election in the store.
+            voting_rule (str): A constant related to a voting rule.
+
+        Returns:
+            Dict[int, Any]: The score of each candidate ID (a list of scores per round for multi-round voting rules).
+        """
+
+        query = """SELECT candidate_id, round, score FROM run_scores
+            WHERE election_id = ? AND voting_rule = ? ORDER BY candidate_id, round"""
+        scores = dict()
+        for candidate_id, round, score in self.connection.execute(query, (election_id, voting_rule)):
+            if voting_rule in VotingRulesConstants.MULTI_ROUND:
+                scores.setdefault(candidate_id, []).append(score)
+            else:
+                scores[candidate_id] = score
+        return scores
@@ -42,3 +42,14 @@ class TestApproval(unittest.TestCase):
         self.assertEqual(c1.scores[APPROVAL], 1)
         self.assertEqual(c2.scores[APPROVAL], 1)
         self.assertEqual(c3.scores[APPROVAL], 3)
+
+        # Un écart par électeur: e0 approuve aussi c0 et c1 avec un écart plus grand
+        gaps = [1.0, 0.3, 0.3, 0.3, 0.3, 0.3]
+        self.assertEqual(
+            approval.apply_approval(electors, candidates, gaps), [c0, c3, c1, c2]
+        )
+
+        self.assertEqual(c0.scores[APPROVAL], 4)
+        self.assertEqual(c1.scores[APPROVAL], 2)
+        self.assertEqual(c2.scores[APPROVAL], 1)
+        self.assertEqual(c3.scores[APPROVAL], 3)
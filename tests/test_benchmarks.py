@@ -0,0 +1,45 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from benchmarks import compare, run_grid
+from benchmarks.export import FAST, SINGLE_TRANSACTION, STEP_BY_STEP, time_export
+from electoral_systems.voting_rules.constants import BORDA, EXHAUSTIVE_BALLOT
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_run_grid(self):
+        report = run_grid([50], [3, 4], [BORDA, EXHAUSTIVE_BALLOT], repeat=1)
+
+        self.assertEqual([(p["nb_electors"], p["nb_candidates"]) for p in report["results"]], [(50, 3), (50, 4)])
+        self.assertEqual(set(report["results"][0]["timings"]),
+                         {"ranking", "averages", "delegations", "duels", "apply_BRD", "apply_EB"})
+
+    def test_compare(self):
+        baseline = {"results": [{"nb_electors": 10, "nb_candidates": 3, "timings": {"duels": 1.0, "ranking": 1.0}}]}
+        current = {"results": [
+            {"nb_electors": 10, "nb_candidates": 3, "timings": {"duels": 1.5, "ranking": 1.1, "apply_BRD": 9.0}},
+            {"nb_electors": 20, "nb_candidates": 3, "timings": {"duels": 9.0}},
+        ]}
+
+        regressions = compare(current, baseline, threshold=0.2)
+        self.assertEqual([r.stage for r in regressions], ["duels"])
+        self.assertAlmostEqual(regressions[0].ratio, 1.5)
+
+        self.assertEqual(compare(current, baseline, threshold=0.2, stage_thresholds={"duels": 0.6}), [])
+        # ranking: +0.1s, en dessous de min_delta
+        self.assertEqual([r.stage for r in compare(current, baseline, threshold=0.05, min_delta=0.2)], ["duels"])
+
+    def test_time_export(self):
+        rates = time_export(50, 3, repeat=1)
+        self.assertEqual(set(rates), {STEP_BY_STEP, SINGLE_TRANSACTION, FAST})
+        self.assertTrue(all(rate > 0 for rate in rates.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
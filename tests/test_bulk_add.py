@@ -0,0 +1,114 @@
+import unittest
+import os
+import sqlite3
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.extensions.polls import DirectionStats
+from sqlite import ImportData
+
+
+class TestBulkAdd(unittest.TestCase):
+
+    def setUp(self):
+        self.election = Election()
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+        self.election.nb_polls = 1
+        rng = np.random.default_rng(0)
+        self.positions = rng.uniform(-1, 1, (300, 2))
+        self.positions[:5] = [(0, 0.5), (0.5, 0), (0.1, 0.1), (-0.3, 0.2), (0, 0)]
+        self.knowledge = rng.uniform(0, 1, 300)
+        self.weights = rng.integers(1, 3, 300)
+
+    def tearDown(self):
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+
+    def state(self):
+        election = self.election
+        electors = [(e.position, e.weight, e.knowledge) for e in election.electors]
+        directions = {direction: {key: (value if not isinstance(value, DirectionStats)
+                                        else (value.count, *np.round(value.mean, 12), *np.round(value.m2, 9)))
+                                  for key, value in data.items()}
+                      for direction, data in election.directions_data.items()}
+        return electors, election.average_position_electors, directions
+
+    def test_same_as_one_by_one(self):
+        election = self.election
+        for position in self.positions[:4]:
+            election.add_candidate(tuple(position))
+        for position, knowledge in zip(self.positions, self.knowledge):
+            election.add_elector(tuple(position), knowledge)
+        expected = self.state()
+
+        election.delete_all_data()
+        election.add_candidates(self.positions[:4])
+        election.add_electors(self.positions[:100], knowledge=self.knowledge[:100])
+        election.add_electors(self.positions[100:], knowledge=self.knowledge[100:])
+        self.assertEqual(self.state(), expected)
+
+    def test_incremental(self):
+        election = self.election
+        election.nb_polls = 0
+        election.incremental_activated = True
+        rules = list(VotingRulesConstants.VOTING_RULES_FUNC)
+        election.add_candidates(self.positions[-5:])
+        election.add_electors(self.positions[:200], self.weights[:200], self.knowledge[:200])
+        election.start_election(chosen_voting_rules=rules)
+        election.add_electors(self.positions[200:], self.weights[200:], self.knowledge[200:])
+        incremental = {c.id: dict(c.scores) for c in election.candidates}
+
+        election.incremental_activated = False
+        election.start_election()
+        self.assertEqual(incremental, {c.id: dict(c.scores) for c in election.candidates})
+
+    def _database(self):
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE candidates (id INTEGER, x REAL, y REAL, first_name TEXT, last_name TEXT, "
+                           "dogmatism REAL, opposition REAL)")
+        connection.execute("CREATE TABLE electors (id INTEGER, x REAL, y REAL, weight INTEGER, knowledge REAL)")
+        connection.execute("INSERT INTO candidates VALUES (0, 0.1, 0.2, 'A', 'B', 0.5, 0.5)")
+        connection.executemany("INSERT INTO electors VALUES (?, ?, ?, ?, ?)",
+                               [(i, x, y, int(w), k) for i, ((x, y), w, k)
+                                in enumerate(zip(self.positions.tolist(), self.weights, self.knowledge.tolist()))])
+        return connection
+
+    def test_import(self):
+        connection = self._database()
+        success, _ = ImportData.import_people(connection, with_results=False)
+        self.assertTrue(success)
+        self.assertEqual([e.position for e in self.election.electors], list(map(tuple, self.positions.tolist())))
+        self.assertEqual([e.weight for e in self.election.electors], self.weights.tolist())
+
+    def test_import_chunks(self):
+        # Une importation par blocs donne les mêmes électeurs et la même position moyenne qu'une importation d'un coup
+        ImportData.import_people(self._database(), with_results=False)
+        electors = [(e.position, e.weight, e.knowledge) for e in self.election.electors]
+        average = self.election.average_position_electors
+
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+        progress = []
+        success, _ = ImportData.import_people_no_results(self._database(), chunk_size=7,
+                                                         progress=lambda done, total: progress.append((done, total)))
+        self.assertTrue(success)
+        self.assertEqual([(e.position, e.weight, e.knowledge) for e in self.election.electors], electors)
+        self.assertEqual(self.election.average_position_electors, average)
+        nb_electors = len(self.positions)
+        self.assertEqual(len(progress), -(-nb_electors // 7))
+        self.assertEqual(progress[-1], (nb_electors, nb_electors))
+
+        # Avec les résultats, les électeurs gardent les IDs de la base de données
+        ImportData.import_people_with_results(self._database(), chunk_size=7)
+        self.assertEqual([e.id for e in self.election.electors], list(range(nb_electors)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,8 @@ from electoral_systems.voting_rules import condorcet
 from electoral_systems.voting_rules.constants import CONDORCET_SIMPLE, CONDORCET_COPELAND, CONDORCET_SIMPSON
 from electoral_systems.utls import IdIterator
 from electoral_systems.voting_rules.utls import set_duels_scores
+from electoral_systems.voting_rules.duels import majority_matrix
+from electoral_systems.voting_rules.profile import Profile
 from people.elector import Elector
 from people.candidate import Candidate
 
@@ -165,3 +167,29 @@ class TestCondorcet(unittest.TestCase):
         self.assertEqual(self.c1.scores[CONDORCET_SIMPSON], 4)
         self.assertEqual(self.c2.scores[CONDORCET_SIMPSON], 3)
         self.assertEqual(self.c3.scores[CONDORCET_SIMPSON], 4)
+
+    def test_majority_matrix(self):
+        p = (0, 0)
+
+        # Position n'affecte pas des résultats dans ce cas (candidates_ranked est définie manuellement)
+        e0 = Elector(id=next(self.id_iter), position=p, candidates_ranked=[self.c0, self.c1, self.c3, self.c2])
+        e1 = Elector(id=next(self.id_iter), position=p, candidates_ranked=[self.c3, self.c1, self.c2, self.c0], weight=2)
+        e2 = Elector(id=next(self.id_iter), position=p, candidates_ranked=[self.c2, self.c0, self.c1, self.c3], weight=0)
+        electors = [e0, e1, e2]
+
+        # self.candidates = [c3, c2, c1, c0] -> indices dans la matrice
+        matrix = majority_matrix(Profile.from_rankings(electors, self.candidates))
+        self.assertEqual(matrix.tolist(), [
+            [0, 3, 2, 2],
+            [0, 0, 0, 2],
+            [1, 3, 0, 2],
+            [1, 1, 1, 0],
+        ])
+
+        # Égalité (c0 contre c3) : le candidat placé le premier dans la liste des candidats est gardé comme gagnant
+        e2.weight = 1
+        duels = set_duels_scores(electors, self.candidates)
+        self.assertEqual(len(duels), 6)
+        self.assertEqual(duels[(self.c3, self.c0)], 2)
+        self.assertNotIn((self.c0, self.c3), duels)
+        self.assertEqual(duels[(self.c3, self.c2)], 3)
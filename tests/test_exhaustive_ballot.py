@@ -2,12 +2,16 @@ import unittest
 import os
 import sys
 
+import numpy as np
+
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.append(parent_dir)
 
 from electoral_systems.voting_rules import exhaustive_ballot
 from electoral_systems.voting_rules.constants import EXHAUSTIVE_BALLOT
+from electoral_systems.voting_rules.elimination import EliminationRounds
+from electoral_systems.voting_rules.profile import Profile
 from electoral_systems.utls.id_iterator import IdIterator
 from people.elector import Elector, Candidate
 
@@ -51,3 +55,21 @@ class TestExhaustiveBallot(unittest.TestCase):
         self.assertEqual(c1.scores[EXHAUSTIVE_BALLOT], [4, 4, 7])
         self.assertEqual(c2.scores[EXHAUSTIVE_BALLOT], [3, 5, 5])
         self.assertEqual(c3.scores[EXHAUSTIVE_BALLOT], [2, 0, 0])
+
+    def test_elimination_cursors(self):
+        ranks = np.array([[0, 1, 2], [1, 2, 0], [2, 0, 1], [1, 0, 2]])
+        id_iter = IdIterator(0)
+        candidates = [Candidate(id=next(id_iter), position=(0, 0)) for _ in range(3)]
+        profile = Profile(candidates, np.zeros((4, 2)), weights=[1, 2, 1, 1], ranks=ranks)
+        engine = EliminationRounds(profile)
+        self.assertEqual(engine.tally().tolist(), [1, 3, 1])
+
+        # Seul l'électeur qui votait pour le candidat 2 avance son curseur
+        engine.keep([0, 1])
+        self.assertEqual(engine.cursors.tolist(), [0, 0, 1, 0])
+        self.assertEqual(engine.tally().tolist(), [2, 3, 0])
+
+        # Les électeurs 1 et 3 sautent le candidat 2 déjà éliminé
+        engine.keep([0])
+        self.assertEqual(engine.cursors.tolist(), [0, 2, 1, 1])
+        self.assertEqual(engine.tally().tolist(), [5, 0, 0])
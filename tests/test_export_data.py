@@ -0,0 +1,243 @@
+import unittest
+from unittest import mock
+import os
+import sqlite3
+import sys
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.voting_rules.profile import Profile
+from sqlite import ExportData, ImportData
+
+
+class TestExportData(unittest.TestCase):
+
+    def setUp(self):
+        self.election = Election()
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+        rng = np.random.default_rng(1)
+        self.election.add_candidates(rng.uniform(-1, 1, (5, 2)))
+        self.election.add_electors(rng.uniform(-1, 1, (200, 2)), knowledge=rng.uniform(0, 1, 200))
+        self.election.start_election(chosen_voting_rules=list(VotingRulesConstants.VOTING_RULES_FUNC))
+
+    def tearDown(self):
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+
+    def dump(self, connection):
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")]
+        return {table: sorted(connection.execute(f"SELECT * FROM {table}").fetchall()) for table in tables}
+
+    def test_same_as_step_by_step(self):
+        # Les mêmes tables que l'exportation avec un commit après chaque étape
+        expected = sqlite3.connect(":memory:")
+        ExportData.create_database_people(expected)
+        ExportData.create_database_results(expected)
+        self.assertFalse(expected.in_transaction)
+
+        connection = sqlite3.connect(":memory:")
+        success, _ = ExportData.export(connection, with_results=True)
+        self.assertTrue(success)
+        self.assertFalse(connection.in_transaction)
+        self.assertEqual(self.dump(connection), self.dump(expected))
+        # Les PRAGMAs de la connexion sont restaurés
+        self.assertEqual(connection.execute("PRAGMA synchronous").fetchone()[0], 2)
+
+    def test_rollback(self):
+        # Une erreur annule toute l'exportation, y compris la suppression des anciennes tables
+        connection = sqlite3.connect(":memory:")
+        ExportData.export(connection, with_results=False)
+        before = self.dump(connection)
+
+        self.election.electors[-1].knowledge = 2
+        success, _ = ExportData.export(connection, with_results=True, pragmas={})
+        self.assertFalse(success)
+        self.assertEqual(self.dump(connection), before)
+
+
+    def test_pragmas(self):
+        # Les PRAGMAs rapides sont optionnels, les valeurs précédentes sont restaurées
+        with tempfile.TemporaryDirectory() as directory:
+            connection = sqlite3.connect(os.path.join(directory, "election.db"))
+            connection.execute("PRAGMA cache_size = -1000")
+            success, _ = ExportData.export(connection, with_results=True, pragmas=ExportData.FAST_PRAGMAS)
+            self.assertTrue(success)
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+            self.assertEqual(connection.execute("PRAGMA synchronous").fetchone()[0], 2)
+            self.assertEqual(connection.execute("PRAGMA cache_size").fetchone()[0], -1000)
+            self.assertNotIn("journal_mode", ExportData.PRAGMAS)
+            connection.close()
+
+    def test_invalid_pragma(self):
+        with self.assertRaises(ValueError):
+            ExportData.export(sqlite3.connect(":memory:"), False, pragmas={"cache_size; DROP TABLE x": 1})
+
+    def test_round_trip(self):
+        scores = [dict(c.scores) for c in sorted(self.election.candidates, key=lambda c: c.id)]
+        connection = sqlite3.connect(":memory:")
+        ExportData.export(connection, with_results=True)
+
+        success, _ = ImportData.import_people(connection, with_results=True)
+        self.assertTrue(success)
+        self.assertEqual(len(self.election.electors), 200)
+        self.assertEqual([dict(c.scores) for c in self.election.candidates], scores)
+
+    def test_rankings(self):
+        ExportData.RANKINGS_CHUNK_SIZE = 64
+        connection = sqlite3.connect(":memory:")
+        try:
+            ExportData.export(connection, with_results=True, with_rankings=True)
+        finally:
+            ExportData.RANKINGS_CHUNK_SIZE = 100_000
+        self.assertEqual(connection.execute("SELECT count(*), sum(nb_rows) FROM rankings").fetchone(), (4, 200))
+        expected = self.election.profile.ranks.copy()
+
+        # Les classements importés sont repris sans nouveau tri
+        ImportData.import_people(connection, with_results=True)
+        with mock.patch.object(Profile, "rank") as rank:
+            self.election.start_election(imported=True)
+            rank.assert_not_called()
+        np.testing.assert_array_equal(self.election.profile.ranks, expected)
+
+        # Si un candidat a été déplacé, les candidats sont classés à nouveau
+        ImportData.import_people(connection, with_results=True)
+        self.election.candidates[0].position = (0.0, 0.0)
+        self.election.start_election(imported=True)
+        profile = Profile.from_electors(self.election.electors, self.election.candidates)
+        profile.rank()
+        np.testing.assert_array_equal(self.election.profile.ranks, profile.ranks)
+
+    def test_rankings_ignored(self):
+        # Pas de table des classements si les sondages ont modifié les classements
+        self.election.nb_polls = 1
+        connection = sqlite3.connect(":memory:")
+        ExportData.export(connection, with_results=False, with_rankings=True)
+        self.assertFalse(connection.execute("SELECT count(*) FROM sqlite_master WHERE name = 'rankings'").fetchone()[0])
+
+        # Une table qui ne correspond pas aux électeurs est ignorée
+        self.election.nb_polls = 0
+        ExportData.export(connection, with_results=False, with_rankings=True)
+        connection.execute("DELETE FROM electors WHERE id = (SELECT max(id) FROM electors)")
+        ImportData.import_people(connection, with_results=True)
+        self.assertIsNone(self.election.imported_ranks)
+
+    def ids(self, results):
+        return {rule: [self.ids({0: r})[0] if isinstance(r, list) else r.id for r in ranking]
+                for rule, ranking in results.items()}
+
+    def export_file(self, directory):
+        path = os.path.join(directory, "election.db")
+        connection = sqlite3.connect(path)
+        ExportData.export(connection, with_results=True, with_rankings=True)
+        connection.close()
+        return path
+
+    def test_lazy_import(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.export_file(directory)
+            connection = sqlite3.connect(path)
+            ImportData.import_people(connection, with_results=True)
+            connection.close()
+            self.election.start_election(imported=True)
+            expected = (self.ids(self.election.results), self.election.average_position_electors,
+                        self.election.proportion_satisfaction, dict(self.election.duels_scores))
+            expected_electors = [(e.id, e.position, e.weight, e.knowledge) for e in self.election.electors]
+
+            # Les résultats sont affichés sans charger les électeurs
+            success, _ = ImportData.import_people_lazy(path)
+            self.assertTrue(success)
+            with mock.patch.object(Profile, "rank") as rank:
+                self.election.start_election(imported=True)
+                rank.assert_not_called()
+            self.assertFalse(self.election.electors_loaded)
+            self.assertEqual(self.election.nb_electors, 200)
+            self.assertTrue(self.election.has_electors_candidates())
+            self.assertEqual(self.ids(self.election.results), expected[0])
+            self.assertEqual(self.election.average_position_electors, expected[1])
+            self.assertEqual(self.election.proportion_satisfaction, expected[2])
+            self.assertEqual({(w.id, l.id): s for (w, l), s in self.election.duels_scores.items()},
+                             {(w.id, l.id): s for (w, l), s in expected[3].items()})
+
+            # Le premier accès aux électeurs les charge
+            electors = [(e.id, e.position, e.weight, e.knowledge) for e in self.election.electors]
+            self.assertTrue(self.election.electors_loaded)
+            self.assertEqual(electors, expected_electors)
+            self.assertEqual(self.election.average_position_electors, expected[1])
+            self.assertIsNotNone(self.election.imported_ranks)
+
+            # Un nouveau calcul charge les électeurs avant de classer les candidats
+            ImportData.import_people_lazy(path)
+            self.election.start_election(chosen_voting_rules=list(VotingRulesConstants.VOTING_RULES_FUNC))
+            self.assertEqual(self.election.average_position_electors, expected[1])
+            self.assertEqual(len(self.election.profile.ranks), 200)
+
+    def test_lazy_import_file_removed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.export_file(directory)
+            success, _ = ImportData.import_people_lazy(path)
+            self.assertTrue(success)
+            self.election.start_election(imported=True)
+            average = self.election.average_position_electors
+            moved = os.path.join(directory, "moved.db")
+            os.rename(path, moved)
+
+            # Le chargement échoue sans créer de fichier, l'élection attend toujours les électeurs
+            success, _ = self.election.load_electors()
+            self.assertFalse(success)
+            self.assertFalse(os.path.exists(path))
+            self.assertFalse(self.election.electors_loaded)
+            self.assertEqual(self.election.nb_electors, 200)
+            self.assertEqual(self.election.electors, [])
+            self.assertEqual(self.election.average_position_electors, average)
+            with self.assertRaises(ValueError):
+                self.election.start_election()
+            connection = sqlite3.connect(os.path.join(directory, "other.db"))
+            success, _ = ExportData.export(connection, with_results=True)
+            connection.close()
+            self.assertFalse(success)
+
+            # Une autre base à la place du fichier importé ne correspond pas
+            connection = sqlite3.connect(path)
+            connection.execute("CREATE TABLE electors (id INTEGER)")
+            connection.close()
+            success, _ = self.election.load_electors()
+            self.assertFalse(success)
+            self.assertFalse(self.election.electors_loaded)
+
+            # Le fichier retrouvé, les électeurs sont chargés
+            os.replace(moved, path)
+            success, _ = self.election.load_electors()
+            self.assertTrue(success)
+            self.assertEqual(len(self.election.electors), 200)
+            self.assertEqual(self.election.average_position_electors, average)
+
+    def test_lazy_import_without_settings(self):
+        # Une base exportée sans le nombre des électeurs: une agrégation sur la table des électeurs
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.export_file(directory)
+            connection = sqlite3.connect(path)
+            connection.execute("DELETE FROM settings WHERE parameter = 'nb_electors'")
+            connection.commit()
+            connection.close()
+            average = self.election.average_position_electors
+
+            success, _ = ImportData.import_people_lazy(path)
+            self.assertTrue(success)
+            self.assertEqual(self.election.nb_electors, 200)
+            np.testing.assert_allclose(self.election.average_position_electors, average)
+            self.assertFalse(self.election.electors_loaded)
+
+            self.election.delete_all_data()
+            self.assertTrue(self.election.electors_loaded)
+            self.assertEqual(self.election.electors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
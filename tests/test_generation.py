@@ -0,0 +1,63 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems import Election, RandomConstants
+from electoral_systems.generation import generate_candidates, generate_electors, truncated_normal
+
+
+class TestGeneration(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        self.election = Election()
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+        self.constants = dict(self.election.generation_constants)
+
+    def tearDown(self):
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+
+    def test_truncated_normal(self):
+        values = truncated_normal(0.5, 0.3, 0, 1, 10_000)
+        self.assertEqual(values.shape, (10_000,))
+        self.assertTrue(((values >= 0) & (values <= 1)).all())
+        self.assertAlmostEqual(values.mean(), 0.5, delta=0.02)
+
+        # Une moyenne par valeur
+        values = truncated_normal(np.array([-0.5, 0.5] * 500), 0.01, -1, 1, 1000)
+        np.testing.assert_allclose(values[::2], -0.5, atol=0.1)
+        np.testing.assert_allclose(values[1::2], 0.5, atol=0.1)
+
+    def test_generate_electors(self):
+        self.constants[RandomConstants.ORIENTATION] = 0.8
+        positions, knowledge = generate_electors(self.constants, 5000)
+        self.assertEqual(positions.shape, (5000, 2))
+        self.assertEqual(knowledge.shape, (5000,))
+        self.assertTrue((np.abs(positions) <= 1).all())
+        self.assertTrue(((knowledge >= 0) & (knowledge <= 1)).all())
+        # Y dépend de X selon l'orientation
+        self.assertGreater(np.corrcoef(positions[:, 0], positions[:, 1])[0, 1], 0.3)
+
+    def test_add_generated_population(self):
+        positions, dogmatism, opposition = generate_candidates(self.constants, 4)
+        self.election.add_candidates(positions, dogmatism, opposition)
+        positions, knowledge = generate_electors(self.constants, 50)
+        self.election.add_electors(positions, knowledge=knowledge)
+
+        self.assertEqual(len(self.election.candidates), 4)
+        self.assertEqual([c.dogmatism for c in self.election.candidates], dogmatism.tolist())
+        self.assertEqual([c.opposition for c in self.election.candidates], opposition.tolist())
+        self.assertEqual([e.knowledge for e in self.election.electors], knowledge.tolist())
+        self.assertEqual([e.position for e in self.election.electors], list(map(tuple, positions.tolist())))
+
+
+if __name__ == '__main__':
+    unittest.main()
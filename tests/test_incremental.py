@@ -0,0 +1,196 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.extensions.polls import AVG, NB_ELECTORS, STD_DEV
+from electoral_systems.voting_rules.profile import Profile
+
+
+class TestIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self.election = Election()
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+        self.rules = list(VotingRulesConstants.VOTING_RULES_FUNC)
+        self.rng = np.random.default_rng(0)
+
+    def tearDown(self):
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+
+    def random_position(self):
+        # Positions arrondies pour provoquer des égalités
+        return tuple(np.round(self.rng.uniform(-1, 1, 2), 1).tolist())
+
+    def scores(self):
+        return {c.id: dict(c.scores) for c in self.election.candidates}
+
+    def winners(self):
+        return {rule: self.election.choose_winner(rule) for rule in self.rules}
+
+    def test_add_remove_electors(self):
+        election = self.election
+        election.incremental_activated = True
+        for _ in range(5):
+            election.add_candidate(self.random_position())
+        for _ in range(60):
+            election.add_elector(self.random_position())
+        election.start_election(chosen_voting_rules=self.rules)
+
+        for _ in range(10):
+            election.add_elector(self.random_position())
+        for elector in [election.electors[3], election.electors[-1], election.electors[20]]:
+            election.remove_elector(elector)
+        incremental_scores, incremental_winners = self.scores(), self.winners()
+        incremental_avg = election.average_position_electors
+
+        # Une élection complète avec les mêmes électeurs et candidats
+        electors, candidates = list(election.electors), list(election.candidates)
+        election.delete_all_data()
+        election.incremental_activated = False
+        for candidate in candidates:
+            election.add_candidate_import(candidate)
+        for elector in electors:
+            election.add_elector_import(elector)
+        election.start_election(chosen_voting_rules=self.rules)
+
+        self.assertEqual(incremental_scores, self.scores())
+        self.assertEqual(incremental_winners, self.winners())
+        np.testing.assert_allclose(incremental_avg, election.average_position_electors)
+
+    def test_add_remove_electors_polls(self):
+        election = self.election
+        election.incremental_activated = True
+        election.nb_polls = 1
+        for _ in range(5):
+            election.add_candidate(self.random_position())
+        for _ in range(60):
+            election.add_elector(self.random_position())
+        election.start_election(chosen_voting_rules=self.rules)
+
+        # Les données des directions restent cohérentes après le début de l'élection
+        election.add_elector((0.9, 0.9))
+        for _ in range(5):
+            election.add_elector(self.random_position())
+        for elector in [election.electors[3], election.electors[-1]]:
+            election.remove_elector(elector)
+        directions_data = {direction: dict(data) for direction, data in election.directions_data.items()}
+
+        electors, candidates = list(election.electors), list(election.candidates)
+        election.delete_all_data()
+        election.incremental_activated = False
+        for candidate in candidates:
+            election.add_candidate_import(candidate)
+        for elector in electors:
+            election.add_elector_import(elector)
+        election.start_election(chosen_voting_rules=self.rules)
+
+        for direction, data in election.directions_data.items():
+            np.testing.assert_allclose(directions_data[direction][AVG], data[AVG], atol=1e-12)
+            self.assertAlmostEqual(directions_data[direction][STD_DEV], data[STD_DEV])
+            self.assertAlmostEqual(directions_data[direction][NB_ELECTORS], data[NB_ELECTORS])
+            self.assertLessEqual(directions_data[direction][NB_ELECTORS], 1)
+
+    def test_remove_elector_after_start(self):
+        # Sans le mode incrémental, la position moyenne reste une moyenne après le début de l'élection
+        election = self.election
+        election.nb_polls = 1
+        for _ in range(3):
+            election.add_candidate(self.random_position())
+        for _ in range(50):
+            election.add_elector(self.random_position())
+        election.start_election(chosen_voting_rules=self.rules)
+
+        election.remove_elector(election.electors[0])
+        election.add_elector((0.5, -0.5))
+        positions = np.array([elector.position for elector in election.electors])
+        np.testing.assert_allclose(election.average_position_electors, positions.mean(axis=0))
+
+    def test_update_candidates(self):
+        election = self.election
+        for _ in range(6):
+            election.add_candidate(self.random_position())
+        for _ in range(80):
+            election.add_elector(self.random_position())
+        election._define_ranking()
+        profile = election.profile
+
+        # Deux candidats bougent, seules leurs distances sont recalculées
+        for index in (1, 4):
+            election.candidates[index].position = self.random_position()
+        previous_ranks = profile.ranks.copy()
+        rows, old_ranks = profile.update_candidates([1, 4])
+        np.testing.assert_array_equal(old_ranks, previous_ranks[rows])
+        np.testing.assert_array_equal(np.flatnonzero((profile.ranks != previous_ranks).any(axis=1)), rows)
+        expected = Profile.from_electors(election.electors, election.candidates)
+        expected.rank()
+        np.testing.assert_array_equal(profile.get_distances(), expected.get_distances())
+        np.testing.assert_array_equal(profile.ranks, expected.ranks)
+
+    def test_polls_delta(self):
+        election = self.election
+        election.nb_polls = 3
+        for _ in range(5):
+            election.add_candidate(self.random_position())
+        for _ in range(100):
+            election.add_elector(self.random_position())
+        election.start_election(chosen_voting_rules=self.rules)
+        for _ in range(election.nb_polls):
+            election.conduct_poll()
+        delta_scores, delta_winners = self.scores(), self.winners()
+
+        # Recalcul complet à partir des mêmes classements
+        election.nb_polls = 0
+        election.calc_results()
+        self.assertEqual(delta_scores, self.scores())
+        self.assertEqual(delta_winners, self.winners())
+
+    def test_polls_delta_without_approval(self):
+        # Les scores d'approbation ne sont pas recalculés s'ils ne sont pas nécessaires
+        election = self.election
+        election.nb_polls = 3
+        self.rules = [rule for rule in self.rules if rule != VotingRulesConstants.APPROVAL]
+        for _ in range(5):
+            election.add_candidate(self.random_position())
+        for _ in range(100):
+            election.add_elector(self.random_position())
+        election.start_election(chosen_voting_rules=self.rules)
+        for _ in range(election.nb_polls):
+            election.conduct_poll()
+        self.assertIsNone(election.tallies.approval)
+        delta_scores, delta_winners = self.scores(), self.winners()
+
+        election.nb_polls = 0
+        election.calc_results()
+        self.assertEqual(delta_scores, self.scores())
+        self.assertEqual(delta_winners, self.winners())
+
+    def test_polls_after_changes(self):
+        # Sans le mode incrémental, un sondage après un ajout ou une suppression reprend tous les électeurs
+        election = self.election
+        election.nb_polls = 3
+        for _ in range(5):
+            election.add_candidate(self.random_position())
+        for _ in range(50):
+            election.add_elector(self.random_position())
+        election.start_election(chosen_voting_rules=self.rules)
+
+        for _ in range(10):
+            election.add_elector(self.random_position())
+        election.remove_elector(election.electors[0])
+        election.conduct_poll()
+        plurality = VotingRulesConstants.PLURALITY_SIMPLE
+        self.assertEqual(sum(c.scores[plurality] for c in election.candidates), 59)
+        self.assertEqual(election.profile.nb_electors, 59)
+
+
+if __name__ == '__main__':
+    unittest.main()
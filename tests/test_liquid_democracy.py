@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems.extensions.liquid_democracy import delegation_weights, resolve_delegations
+
+
+def naive_representatives(delegees, knowledge):
+    # Suit chaque chaîne électeur par électeur, casse un cycle au plus compétent
+    delegees = list(delegees)
+    representatives = []
+    for start in range(len(delegees)):
+        path, current = [], start
+        while delegees[current] >= 0 and current not in path:
+            path.append(current)
+            current = delegees[current]
+        if delegees[current] >= 0:
+            cycle = path[path.index(current):]
+            breaker = min(cycle, key=lambda i: (-knowledge[i], i))
+            delegees[breaker] = -1
+            current = start
+            while delegees[current] >= 0:
+                current = delegees[current]
+        representatives.append(current)
+    return representatives
+
+
+class TestLiquidDemocracy(unittest.TestCase):
+
+    def test_chain(self):
+        # 0 -> 1 -> 2, 3 ne délègue pas
+        delegees = np.array([1, 2, -1, -1])
+        knowledge = np.array([0.1, 0.2, 0.3, 0.4])
+        self.assertEqual(resolve_delegations(delegees, knowledge).tolist(), [2, 2, 2, 3])
+        self.assertEqual(delegation_weights(delegees, knowledge).tolist(), [0, 0, 3, 1])
+
+    def test_cycle(self):
+        # Cycle 0 -> 1 -> 2 -> 0, 3 -> 0. L'électeur 1 est le plus compétent du cycle.
+        delegees = np.array([1, 2, 0, 0])
+        knowledge = np.array([0.1, 0.9, 0.5, 1.0])
+        self.assertEqual(resolve_delegations(delegees, knowledge).tolist(), [1, 1, 1, 1])
+        self.assertEqual(delegation_weights(delegees, knowledge, [1, 2, 1, 1]).tolist(), [0, 5, 0, 0])
+
+    def test_same_as_naive(self):
+        rng = np.random.default_rng(0)
+        for nb_electors in (1, 2, 10, 200):
+            for _ in range(20):
+                delegees = rng.integers(0, nb_electors, nb_electors)
+                delegees[delegees == np.arange(nb_electors)] = -1
+                delegees[rng.uniform(size=nb_electors) < 0.3] = -1
+                knowledge = np.round(rng.uniform(size=nb_electors), 1)
+                representatives = resolve_delegations(delegees, knowledge)
+                self.assertEqual(representatives.tolist(), naive_representatives(delegees, knowledge))
+
+                # Sans égalité des taux de connaissance, les poids ne dépendent pas de l'ordre des électeurs
+                knowledge = rng.uniform(size=nb_electors)
+                permutation = rng.permutation(nb_electors)
+                inverse = np.argsort(permutation)
+                permuted = np.where(delegees[permutation] < 0, -1, inverse[delegees[permutation]])
+                weights = delegation_weights(delegees, knowledge)
+                permuted_weights = delegation_weights(permuted, knowledge[permutation])
+                np.testing.assert_array_equal(weights[permutation], permuted_weights)
+                self.assertEqual(weights.sum(), nb_electors)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import os
+import sys
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.voting_rules.approval import approval_scores
+from electoral_systems.voting_rules.duels import majority_matrix
+from electoral_systems.voting_rules.mapped_profile import MappedProfile, RANKS_FILE
+from electoral_systems.voting_rules.profile import Profile
+from electoral_systems.voting_rules.scoring import position_counts
+
+
+class TestMappedProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.positions = rng.uniform(-1, 1, (203, 2))
+        self.weights = rng.integers(0, 3, 203)
+        self.candidates_positions = rng.uniform(-1, 1, (5, 2))
+
+        self.election = Election()
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+
+    def tearDown(self):
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+        self.directory.cleanup()
+
+    def mapped(self, candidates, chunk_size=16):
+        profile = MappedProfile.create(self.directory.name, candidates, len(self.positions), chunk_size)
+        # Écriture par blocs
+        for start, stop in profile.bounds():
+            profile.positions[start:stop] = self.positions[start:stop]
+            profile.weights[start:stop] = self.weights[start:stop]
+        profile.flush()
+        return profile
+
+    def test_same_as_in_memory(self):
+        self.election.add_candidates(self.candidates_positions)
+        candidates = self.election.candidates
+        profile = Profile(candidates, self.positions, self.weights)
+        profile.rank()
+        mapped = self.mapped(candidates)
+        mapped.rank()
+
+        np.testing.assert_array_equal(mapped.ranks, profile.ranks)
+        np.testing.assert_array_equal(position_counts(mapped), position_counts(profile))
+        np.testing.assert_array_equal(majority_matrix(mapped), majority_matrix(profile))
+        np.testing.assert_array_equal(approval_scores(mapped, 0.3), approval_scores(profile, 0.3))
+        gaps = np.linspace(0, 1, len(self.positions))
+        np.testing.assert_array_equal(approval_scores(mapped, gaps), approval_scores(profile, gaps))
+
+        # Les classements sont repris à la réouverture
+        reopened = MappedProfile.open(self.directory.name, candidates, chunk_size=50, mode="r")
+        np.testing.assert_array_equal(reopened.ranks, profile.ranks)
+        np.testing.assert_array_equal(position_counts(reopened), position_counts(profile))
+
+        # Un nouveau classement d'un profil ouvert en lecture seule ou en copie sur écriture ne modifie pas les fichiers
+        ranks_path = os.path.join(self.directory.name, RANKS_FILE)
+        np.save(ranks_path, np.zeros_like(profile.ranks))
+        for mode in ("r", "c"):
+            opened = MappedProfile.open(self.directory.name, candidates, chunk_size=50, mode=mode)
+            opened.rank()
+            opened.flush()
+            np.testing.assert_array_equal(opened.ranks, profile.ranks)
+            np.testing.assert_array_equal(np.load(ranks_path), 0)
+        os.remove(ranks_path)
+        opened = MappedProfile.open(self.directory.name, candidates, chunk_size=50, mode="r")
+        opened.rank()
+        np.testing.assert_array_equal(opened.ranks, profile.ranks)
+        self.assertFalse(os.path.exists(ranks_path))
+
+    def test_election(self):
+        election = self.election
+        rules = list(VotingRulesConstants.VOTING_RULES_FUNC)
+        election.add_candidates(self.candidates_positions)
+        election.add_electors(self.positions, weights=self.weights)
+        election.start_election(chosen_voting_rules=rules)
+        expected = {rule: election.results[rule] for rule in rules}
+        average = election.average_position_electors
+
+        candidates = list(election.candidates)
+        election.electors.clear()
+        election.results.clear()
+        election.attach_profile(self.mapped(candidates))
+        election.start_election(chosen_voting_rules=rules)
+        self.assertEqual(election.results, expected)
+        np.testing.assert_allclose(election.average_position_electors, average)
+        self.assertEqual(election.profile.nb_electors, len(self.positions))
+
+    def test_unavailable(self):
+        self.election.add_candidates(self.candidates_positions)
+        self.election.attach_profile(self.mapped(self.election.candidates))
+        self.election.liquid_democracy_activated = True
+        with self.assertRaises(ValueError):
+            self.election.start_election()
+        with self.assertRaises(ValueError):
+            self.election.mapped_profile.append((0, 0))
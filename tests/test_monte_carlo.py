@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems.monte_carlo import MonteCarloResults, run_monte_carlo
+from electoral_systems.voting_rules.constants import BORDA, CONDORCET_COPELAND, CONDORCET_SIMPLE
+from electoral_systems.voting_rules.duels import condorcet_winner
+
+
+class TestMonteCarlo(unittest.TestCase):
+
+    def test_results(self):
+        results = MonteCarloResults([CONDORCET_COPELAND, BORDA])
+        results.add_run({BORDA: 1, CONDORCET_COPELAND: 1}, condorcet=1)
+        results.add_run({BORDA: 2, CONDORCET_COPELAND: 1}, condorcet=None)
+
+        other = MonteCarloResults([BORDA, CONDORCET_COPELAND])
+        other.add_run({BORDA: 0, CONDORCET_COPELAND: 1}, condorcet=1)
+        results.merge(other)
+
+        self.assertEqual(results.nb_runs, 3)
+        self.assertEqual(results.nb_condorcet_winners, 2)
+        self.assertEqual(results.condorcet_hits, {BORDA: 1, CONDORCET_COPELAND: 2})
+        self.assertEqual(results.agreement_rate(CONDORCET_COPELAND, BORDA), 1 / 3)
+        self.assertEqual(results.condorcet_efficiency(BORDA), 0.5)
+
+    def test_condorcet_winner(self):
+        self.assertEqual(condorcet_winner(np.array([[0, 2, 3], [1, 0, 2], [0, 1, 0]])), 0)
+        # Cycle: pas de gagnant de Condorcet
+        self.assertIsNone(condorcet_winner(np.array([[0, 2, 1], [1, 0, 2], [2, 1, 0]])))
+
+    def test_reproducible(self):
+        rules = [BORDA, CONDORCET_SIMPLE]
+        results1 = run_monte_carlo(12, 50, 4, rules, seed=7, max_workers=1, batch_size=5)
+        results2 = run_monte_carlo(12, 50, 4, rules, seed=7, max_workers=2, batch_size=5)
+
+        self.assertEqual(results1.to_dict(), results2.to_dict())
+        self.assertEqual(results1.nb_runs, 12)
+        # Condorcet simple élit toujours le gagnant de Condorcet s'il existe
+        self.assertEqual(results1.condorcet_hits[CONDORCET_SIMPLE], results1.nb_condorcet_winners)
+
+
+if __name__ == '__main__':
+    unittest.main()
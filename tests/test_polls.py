@@ -0,0 +1,65 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems.extensions.polls import (AVG, NB_ELECTORS, STATS, STD_DEV, DirectionStats,
+                                                add_electors_data, get_default_directions_data,
+                                                merge_directions_data, set_avg_electors_positions,
+                                                set_std_deviation)
+
+
+class TestDirectionStats(unittest.TestCase):
+
+    def setUp(self):
+        self.positions = np.random.default_rng(0).uniform(-1, 1, (500, 2))
+
+    def test_add_same_as_numpy(self):
+        stats = DirectionStats()
+        for position in self.positions:
+            stats.add(tuple(position))
+        self.assertEqual(stats.count, 500)
+        np.testing.assert_allclose(stats.mean, self.positions.mean(axis=0))
+        np.testing.assert_allclose(stats.std(), self.positions.std(axis=0))
+
+    def test_merge_and_remove(self):
+        # Des statistiques calculées par parties puis fusionnées
+        stats = DirectionStats()
+        for part in np.array_split(self.positions, 7):
+            partial = DirectionStats()
+            partial.add_positions(part)
+            stats.merge(partial)
+        np.testing.assert_allclose(stats.std(), self.positions.std(axis=0))
+
+        for position in self.positions[:100]:
+            stats.remove(tuple(position))
+        np.testing.assert_allclose(stats.mean, self.positions[100:].mean(axis=0))
+        np.testing.assert_allclose(stats.std(), self.positions[100:].std(axis=0))
+
+    def test_merge_directions_data(self):
+        expected = get_default_directions_data()
+        add_electors_data(expected, self.positions)
+
+        directions_data = get_default_directions_data()
+        for part in np.array_split(self.positions, 3):
+            partial = get_default_directions_data()
+            add_electors_data(partial, part)
+            merge_directions_data(directions_data, partial)
+
+        for data in (expected, directions_data):
+            set_avg_electors_positions(data)
+            set_std_deviation(data, len(self.positions))
+        for direction, data in expected.items():
+            np.testing.assert_allclose(directions_data[direction][AVG], data[AVG])
+            self.assertAlmostEqual(directions_data[direction][STD_DEV], data[STD_DEV])
+            self.assertAlmostEqual(directions_data[direction][NB_ELECTORS], data[NB_ELECTORS])
+            self.assertEqual(directions_data[direction][STATS].count, data[STATS].count)
+
+
+if __name__ == '__main__':
+    unittest.main()
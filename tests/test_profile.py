@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from electoral_systems.utls import IdIterator
+from electoral_systems.voting_rules.duels import Duels
+from electoral_systems.voting_rules.profile import Profile
+from people.elector import Elector
+from people.candidate import Candidate
+
+
+class TestProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.id_iter = IdIterator(0)
+        self.c0 = Candidate(id=next(self.id_iter), position=(0.6, 0.5), first_name="A", last_name="A")
+        self.c1 = Candidate(id=next(self.id_iter), position=(-0.6, 0.5), first_name="B", last_name="B")
+        self.c2 = Candidate(id=next(self.id_iter), position=(0, 0), first_name="C", last_name="C")
+        self.c3 = Candidate(id=next(self.id_iter), position=(0.9, -0.9), first_name="D", last_name="D")
+        self.candidates = [self.c3, self.c2, self.c1, self.c0]
+
+        positions = [(0.1, 0.1), (0.5, 0.5), (-0.7, -0.8), (-0.3, -0.3), (0.9, 0.9), (0, 0.5)]
+        self.electors = [Elector(id=next(self.id_iter), position=p) for p in positions]
+
+    def test_rank_same_as_electors(self):
+        profile = Profile.from_electors(self.electors, self.candidates)
+        profile.rank()
+
+        for row, elector in enumerate(self.electors):
+            elector.rank_candidates(self.candidates)
+            # Égalité des distances (dernier électeur) : l'ordre de la liste des candidats est conservé
+            self.assertEqual(profile.ranked_candidates(row), elector.candidates_ranked)
+
+    def test_from_rankings(self):
+        for elector in self.electors:
+            elector.rank_candidates(self.candidates)
+        profile = Profile.from_rankings(self.electors, self.candidates)
+
+        self.assertEqual(profile.nb_electors, 6)
+        self.assertEqual(profile.nb_candidates, 4)
+        for row, elector in enumerate(self.electors):
+            self.assertEqual(profile.ranked_candidates(row), elector.candidates_ranked)
+
+    def test_rank_positions(self):
+        profile = Profile.from_electors(self.electors, self.candidates)
+        profile.rank()
+        positions = profile.rank_positions()
+
+        for row in range(profile.nb_electors):
+            for place, index in enumerate(profile.ranks[row]):
+                self.assertEqual(positions[row, index], place)
+
+    def test_candidates_index(self):
+        # Les indices denses suivent l'ordre des candidats du profil
+        profile = Profile.from_electors(self.electors, self.candidates)
+        self.assertListEqual([candidate.index for candidate in self.candidates], [0, 1, 2, 3])
+
+        # Les duels sont retrouvés par indice, un candidat hors du profil n'a pas de duel
+        profile.rank()
+        duels = Duels(profile.candidates, profile=profile)
+        for (winner, loser), score in duels.items():
+            self.assertEqual(score, duels.matrix[winner.index, loser.index])
+        other = Candidate(id=next(self.id_iter), position=(0, 0), first_name="E", last_name="E", index=0)
+        self.assertNotIn((other, self.c2), duels)
+        self.assertNotIn((self.c2, other), duels)
@@ -36,3 +36,18 @@ class TestRanking(unittest.TestCase):
         self.assertEqual(e2.candidates_ranked, [c2, c1, c3, c0])
         self.assertEqual(e3.candidates_ranked, [c2, c1, c0, c3])
         self.assertEqual(e4.candidates_ranked, [c0, c2, c1, c3])
+
+    def test_slots(self):
+        # Les personnes n'ont pas de __dict__, le classement n'est rempli qu'à la demande
+        candidate = Candidate(id=0, position=(0.1, 0.2), first_name="A", last_name="A")
+        elector = Elector(id=1, position=(0.3, 0.4))
+        self.assertFalse(hasattr(candidate, "__dict__"))
+        self.assertFalse(hasattr(elector, "__dict__"))
+        self.assertIsNone(elector.candidates_ranked)
+        with self.assertRaises(AttributeError):
+            elector.unknown = 0
+
+        elector.rank_candidates([candidate])
+        self.assertListEqual(elector.candidates_ranked, [candidate])
+        candidate.init_score("X", 0)
+        self.assertEqual(candidate.scores["X"], 0)
@@ -0,0 +1,76 @@
+import unittest
+import os
+import sqlite3
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from electoral_systems import Election
+from electoral_systems.monte_carlo import run_monte_carlo
+from electoral_systems.simulate import configure, generate_population
+from electoral_systems.voting_rules.constants import BORDA, CONDORCET_COPELAND, EXHAUSTIVE_BALLOT
+from sqlite import RunStore
+
+
+class TestRunStore(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.rules = [BORDA, CONDORCET_COPELAND, EXHAUSTIVE_BALLOT]
+
+    def tearDown(self):
+        Election().delete_all_data()
+        Election().set_default_settings()
+
+    def test_monte_carlo(self):
+        # Les statistiques calculées par la base de données sont celles de MonteCarloResults
+        store = RunStore(self.connection)
+        parameters = {"nb_electors": 40, "nb_candidates": 4}
+        results = run_monte_carlo(20, 40, 4, self.rules, seed=3, max_workers=1, batch_size=7, keep_records=True)
+        self.assertEqual(len(results.records), 20)
+        store.append_records(store.new_run(parameters, seed=3), results.records)
+        store.append_records(store.new_run({"nb_electors": 10, "nb_candidates": 3}), results.records[:5])
+
+        statistics = {s["voting_rule"]: s for s in store.winner_statistics(parameters)}
+        self.assertEqual(set(statistics), set(self.rules))
+        for rule in self.rules:
+            self.assertEqual(statistics[rule]["nb_elections"], 20)
+            self.assertEqual(statistics[rule]["nb_condorcet_winners"], results.nb_condorcet_winners)
+            self.assertEqual(statistics[rule]["condorcet_hits"], results.condorcet_hits[rule])
+            self.assertEqual(statistics[rule]["no_winner"], results.no_winner[rule])
+        self.assertEqual(len(store.winner_statistics()), 2 * len(self.rules))
+
+        for rates in store.agreement_rates(parameters):
+            self.assertEqual(rates["agreement_rate"], results.agreement_rate(*rates["voting_rules"]))
+
+    def test_batches(self):
+        election = Election()
+        store = RunStore(self.connection, batch_size=2)
+        run_id = store.new_run({"nb_electors": 30})
+        count = lambda table: self.connection.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+        scores = []
+        for _ in range(3):
+            configure(election)
+            generate_population(election, 30, 3)
+            election.start_election(chosen_voting_rules=self.rules)
+            scores.append({c.id: c.scores[EXHAUSTIVE_BALLOT] for c in election.candidates})
+            store.append(run_id, election, with_electors=True)
+        # Seul le premier lot a été inséré
+        self.assertEqual(count("run_elections"), 2)
+        self.assertEqual(count("run_electors"), 60)
+
+        store.flush()
+        self.assertEqual(count("run_elections"), 3)
+        self.assertEqual(store.scores(2, EXHAUSTIVE_BALLOT), scores[2])
+
+        # Une nouvelle instance continue la numérotation des élections
+        with RunStore(self.connection) as other:
+            self.assertEqual(other.append(run_id, election), 3)
+        self.assertEqual(count("run_elections"), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
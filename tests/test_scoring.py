@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from electoral_systems.voting_rules import scoring
+from electoral_systems.voting_rules.profile import Profile
+from electoral_systems.utls import IdIterator
+from people.elector import Elector
+from people.candidate import Candidate
+
+
+class TestScoring(unittest.TestCase):
+
+    def setUp(self):
+        id_iter = IdIterator(0)
+        self.c0 = Candidate(id=next(id_iter), position=(0, 0), first_name="A", last_name="A")
+        self.c1 = Candidate(id=next(id_iter), position=(0, 0), first_name="B", last_name="B")
+        self.c2 = Candidate(id=next(id_iter), position=(0, 0), first_name="C", last_name="C")
+        self.candidates = [self.c0, self.c1, self.c2]
+
+        rankings = [[self.c0, self.c1, self.c2]] * 3 + [[self.c1, self.c2, self.c0]] * 2 + [[self.c2, self.c1, self.c0]]
+        self.electors = [Elector(id=next(id_iter), position=(0, 0), candidates_ranked=ranking)
+                         for ranking in rankings]
+
+    def test_position_counts(self):
+        profile = Profile.from_rankings(self.electors, self.candidates)
+        counts = scoring.position_counts(profile)
+        self.assertEqual(counts.tolist(), [[3, 2, 1], [0, 4, 2], [3, 0, 3]])
+
+        # Un électeur de poids 3 compte 3 fois
+        profile.set_weights([3, 1, 1, 1, 1, 1])
+        self.assertEqual(scoring.position_counts(profile)[0].tolist(), [5, 2, 1])
+
+    def test_score_vectors(self):
+        self.assertEqual(scoring.plurality_vector(4), [1, 0, 0, 0])
+        self.assertEqual(scoring.borda_vector(4), [3, 2, 1, 0])
+        self.assertEqual(scoring.veto_vector(4), [1, 1, 1, 0])
+        self.assertEqual(scoring.k_approval(2)(4), [1, 1, 0, 0])
+        self.assertEqual(scoring.truncated_borda(2)(4), [2, 1, 0, 0])
+        self.assertEqual(scoring.dowdall_vector(3), [1, 1 / 2, 1 / 3])
+
+    def test_custom_vector(self):
+        ranking = scoring.apply_positional(self.electors, self.candidates, voting_rule="K2",
+                                           vector=scoring.k_approval(2)(3))
+        self.assertEqual(ranking, [self.c1, self.c0, self.c2])
+        self.assertEqual([c.scores["K2"] for c in self.candidates], [3, 6, 3])
+
+        scoring.register_score_vector("DWD", scoring.dowdall_vector)
+        ranking = scoring.apply_positional(self.electors, self.candidates, voting_rule="DWD")
+        self.assertEqual(ranking, [self.c0, self.c1, self.c2])
+        self.assertAlmostEqual(self.c0.scores["DWD"], 3 + 3 / 3)
+
+        with self.assertRaises(ValueError):
+            scoring.apply_positional(self.electors, self.candidates, voting_rule="K2", vector=[1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import io
+import json
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from electoral_systems import simulate
+from electoral_systems.voting_rules.constants import PLURALITY_SIMPLE, PLURALITY_2_ROUNDS, CONDORCET_COPELAND
+
+
+class TestSimulate(unittest.TestCase):
+
+    def test_simulation(self):
+        record = simulate.run_simulation(200, 4, [PLURALITY_SIMPLE, PLURALITY_2_ROUNDS, CONDORCET_COPELAND], nb_polls=1)
+
+        self.assertEqual(record["nb_electors"], 200)
+        self.assertEqual(record["nb_candidates"], 4)
+        self.assertEqual(set(record["timings"]), {"generation", "election", "polls"})
+        self.assertEqual(set(record["results"]), {PLURALITY_SIMPLE, PLURALITY_2_ROUNDS, CONDORCET_COPELAND})
+
+        plurality = record["results"][PLURALITY_SIMPLE]
+        self.assertEqual(plurality["winner"], plurality["ranking"][0])
+        self.assertEqual(sum(c["score"] for c in plurality["ranking"]), 200)
+        self.assertIsInstance(record["results"][PLURALITY_2_ROUNDS]["winner"]["score"], list)
+
+    def test_command_line(self):
+        output = io.StringIO()
+        argv = ["--electors", "50", "--candidates", "3", "--rules", PLURALITY_SIMPLE, "--runs", "2", "--seed", "3"]
+        simulate.main(argv + ["--output", os.devnull])
+
+        sys.stdout, stdout = output, sys.stdout
+        try:
+            simulate.main(argv)
+        finally:
+            sys.stdout = stdout
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([r["run"] for r in records], [0, 1])
+        self.assertEqual(records[0]["seed"], 3)
+
+    def test_no_qt(self):
+        self.assertNotIn("PySide6", sys.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
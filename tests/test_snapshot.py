@@ -0,0 +1,125 @@
+import unittest
+from unittest import mock
+import os
+import sys
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems import Election, VotingRulesConstants
+from electoral_systems.voting_rules.duels import Duels
+from electoral_systems.voting_rules.profile import Profile
+from snapshot import Snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.election = Election()
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+        self.election.tie_breaker_activated = True
+        rng = np.random.default_rng(2)
+        self.election.add_candidates(rng.uniform(-1, 1, (6, 2)))
+        self.election.add_electors(rng.uniform(-1, 1, (300, 2)), weights=rng.integers(1, 3, 300),
+                                   knowledge=rng.uniform(0, 1, 300))
+        self.election.start_election(chosen_voting_rules=list(VotingRulesConstants.VOTING_RULES_FUNC))
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        self.election.delete_all_data()
+        self.election.set_default_settings()
+
+    def state(self):
+        election = self.election
+        # Plusieurs tours: comme pour une importation SQLite, seuls les gagnants des tours sont comparés
+        results = {rule: [ranking[0].first_name for ranking in result] if rule in VotingRulesConstants.MULTI_ROUND
+                   else [c.first_name for c in result] for rule, result in election.results.items()}
+        return results, [dict(c.scores) for c in election.candidates], dict(election.duels_scores.items()).values()
+
+    def test_round_trip(self):
+        electors = [(e.id, e.position, e.weight, e.knowledge) for e in self.election.electors]
+        results, scores, duels = self.state()
+        ranks = self.election.profile.ranks.copy()
+        success, _ = Snapshot.save(self.directory.name)
+        self.assertTrue(success)
+
+        success, _ = Snapshot.load(self.directory.name)
+        self.assertTrue(success)
+        self.assertEqual([(e.id, e.position, e.weight, e.knowledge) for e in self.election.electors], electors)
+        self.assertEqual(set(self.election.results), set(results))
+        self.assertIsInstance(self.election.duels_scores, Duels)
+
+        # Les classements enregistrés sont repris sans nouveau tri
+        with mock.patch.object(Profile, "rank") as rank:
+            self.election.start_election(imported=True)
+            rank.assert_not_called()
+        np.testing.assert_array_equal(self.election.profile.ranks, ranks)
+        self.assertEqual(self.state()[:2], (results, scores))
+        self.assertEqual(list(self.state()[2]), list(duels))
+
+    def test_mapped(self):
+        results, scores, _ = self.state()
+        Snapshot.save(self.directory.name)
+
+        success, _ = Snapshot.load(self.directory.name, mapped=True, chunk_size=64)
+        self.assertTrue(success)
+        self.assertEqual(self.election.electors, [])
+        self.assertEqual(self.election.nb_electors, 300)
+        self.election.start_election(imported=True)
+        self.assertEqual(self.state()[:2], (results, scores))
+
+        # Les résultats recalculés sur le profil sur disque sont les mêmes
+        self.election.start_election()
+        self.assertEqual(self.state()[:2], (results, scores))
+
+        # Un profil sur disque est copié bloc par bloc dans un autre répertoire
+        with tempfile.TemporaryDirectory() as other:
+            self.assertTrue(Snapshot.save(other)[0])
+            Snapshot.load(other)
+            self.assertEqual(len(self.election.electors), 300)
+            self.election.start_election(imported=True)
+            self.assertEqual(self.state()[:2], (results, scores))
+
+    def test_mapped_same_directory(self):
+        # Un profil sur disque enregistré dans son propre répertoire garde ses classements et ses IDs
+        ids = [e.id for e in self.election.electors]
+        Snapshot.save(self.directory.name)
+        Snapshot.load(self.directory.name, mapped=True, chunk_size=64)
+        self.election.start_election(imported=True)
+        self.assertTrue(Snapshot.save(self.directory.name)[0])
+        for name in ("ranks.npy", "ids.npy"):
+            self.assertTrue(os.path.exists(os.path.join(self.directory.name, name)))
+
+        Snapshot.load(self.directory.name, mapped=True)
+        self.assertIsNotNone(self.election.mapped_profile.ranks)
+        Snapshot.load(self.directory.name)
+        self.assertEqual([e.id for e in self.election.electors], ids)
+
+    def test_save_error(self):
+        path = os.path.join(self.directory.name, "file")
+        open(path, "w").close()
+        success, _ = Snapshot.save(path)
+        self.assertFalse(success)
+
+    def test_without_results(self):
+        Snapshot.save(self.directory.name, with_results=False)
+        Snapshot.load(self.directory.name)
+        self.assertEqual(self.election.results, dict())
+        self.assertTrue(all(not c.scores for c in self.election.candidates))
+
+    def test_invalid(self):
+        self.assertFalse(Snapshot.load(self.directory.name)[0])
+        Snapshot.save(self.directory.name)
+        os.remove(os.path.join(self.directory.name, "weights.npy"))
+        self.assertFalse(Snapshot.load(self.directory.name)[0])
+        self.assertEqual(self.election.candidates, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import os
+import random
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems.utls import IdIterator, SpatialIndex
+from electoral_systems.extensions.liquid_democracy import (DELEGATION_GAP_COEF, choose_delegee, choose_delegee_row,
+                                                           choose_possible_delegees, possible_delegees_rows)
+from people.elector import Elector
+
+
+class TestSpatialIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # Positions arrondies pour avoir des points exactement sur le cercle
+        self.positions = np.round(rng.uniform(-1, 1, (500, 2)), 2)
+
+    def brute_force(self, position, radius, inclusive):
+        x, y = position
+        distances = np.sqrt((self.positions[:, 0] - x) ** 2 + (self.positions[:, 1] - y) ** 2)
+        return np.flatnonzero(distances <= radius if inclusive else distances < radius)
+
+    def test_query_same_as_brute_force(self):
+        for cell_size in (0.05, 0.1, 0.5):
+            index = SpatialIndex(self.positions, cell_size)
+            for position in [(0, 0), (1, 1), (-1, 0.3), (0.13, -0.27), tuple(self.positions[7])]:
+                for radius in (0.1, 0.25):
+                    for inclusive in (True, False):
+                        np.testing.assert_array_equal(index.query(position, radius, inclusive),
+                                                      self.brute_force(position, radius, inclusive))
+
+    def test_empty(self):
+        index = SpatialIndex([], 0.1)
+        self.assertEqual(len(index.query((0, 0), 0.1)), 0)
+        self.assertFalse(index.any_within((0, 0), 0.1))
+        with self.assertRaises(ValueError):
+            SpatialIndex(self.positions, 0)
+
+    def test_possible_delegees(self):
+        id_iter = IdIterator(0)
+        electors = [Elector(id=next(id_iter), position=tuple(p)) for p in self.positions]
+        electors[3].weight = 0
+        weights = np.array([elector.weight for elector in electors])
+        index = SpatialIndex(self.positions, DELEGATION_GAP_COEF)
+        for row, delegator in enumerate(electors[:50]):
+            expected = choose_possible_delegees(electors, delegator)
+            rows = possible_delegees_rows(index, row, weights)
+            self.assertEqual([electors[i] for i in rows], expected)
+
+    def test_choose_delegee_same_draw(self):
+        id_iter = IdIterator(0)
+        knowledge = np.random.default_rng(1).uniform(0, 1, 30)
+        electors = [Elector(id=next(id_iter), position=(0, 0), knowledge=k) for k in knowledge]
+        rows = np.arange(2, 30, 3)
+        for seed in range(20):
+            random.seed(seed)
+            expected = choose_delegee([electors[i] for i in rows])
+            random.seed(seed)
+            self.assertIs(electors[choose_delegee_row(rows, knowledge)], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from electoral_systems.utls import IdIterator
+from electoral_systems.voting_rules.profile import Profile
+from electoral_systems.voting_rules.tie import resolve_ties
+from electoral_systems.voting_rules.utls import set_duels_scores, sort_cand_by_value
+from people.elector import Elector
+from people.candidate import Candidate
+
+RULE = "RULE"
+
+
+class TestTie(unittest.TestCase):
+
+    def legacy(self, candidates, nb_electors, duels, scores_asc):
+        # Ancien algorithme: tri par (score, nom) puis échanges 2 à 2 dans chaque égalité
+        sign = 1 if scores_asc else -1
+        ranking = sorted(candidates, key=lambda c: (sign * c.scores[RULE], c))
+        resolve_ties(ranking, nb_electors, RULE, duels)
+        return ranking
+
+    def random_election(self, rng, nb_electors, nb_candidates):
+        id_iter = IdIterator(0)
+        names = rng.permutation(nb_candidates).tolist()
+        candidates = [Candidate(id=next(id_iter), position=tuple(rng.uniform(-1, 1, 2).tolist()),
+                                first_name=f"F{name}", last_name=f"L{name}", dogmatism=0.5, opposition=0.5)
+                      for name in names]
+        electors = [Elector(id=next(id_iter), position=tuple(rng.uniform(-1, 1, 2).tolist()))
+                    for _ in range(nb_electors)]
+        profile = Profile.from_electors(electors, candidates)
+        profile.rank()
+        # Peu de valeurs possibles: beaucoup d'égalités
+        for candidate in candidates:
+            candidate.init_score(RULE, int(rng.integers(0, 3)))
+        return candidates, profile
+
+    def test_same_as_resolve_ties(self):
+        rng = np.random.default_rng(0)
+        for _ in range(300):
+            nb_electors = int(rng.integers(1, 9))
+            nb_candidates = int(rng.integers(2, 9))
+            candidates, profile = self.random_election(rng, nb_electors, nb_candidates)
+            duels = set_duels_scores([], candidates, profile)
+
+            for scores_asc in (False, True):
+                expected = self.legacy(candidates, nb_electors, duels, scores_asc)
+                self.assertListEqual(sort_cand_by_value(candidates, RULE, nb_electors, duels, scores_asc), expected)
+                # Les duels importés sont un dictionnaire
+                self.assertListEqual(sort_cand_by_value(candidates, RULE, nb_electors, dict(duels), scores_asc),
+                                     expected)
+
+    def test_cycle(self):
+        # Un cycle de Condorcet entre 3 candidats à égalité: a > b > c > a
+        id_iter = IdIterator(0)
+        a, b, c = [Candidate(id=next(id_iter), position=(0, 0), first_name=name, last_name=name,
+                             dogmatism=0.5, opposition=0.5) for name in "abc"]
+        for candidate in (a, b, c):
+            candidate.init_score(RULE, 1)
+        duels = {(a, b): 2, (b, c): 2, (c, a): 2}
+
+        for order in ([a, b, c], [c, b, a], [b, a, c]):
+            self.assertListEqual(sort_cand_by_value(order, RULE, 3, duels), self.legacy(order, 3, duels, False))